@@ -3,6 +3,8 @@
 
 set -e
 
+cd "$(dirname "$0")"
+
 echo "=== API Governance Benchmarks ==="
 echo ""
 
@@ -13,7 +15,7 @@ if ! command -v api-governor &> /dev/null; then
 fi
 
 # Create test specs if they don't exist
-if [ ! -f "specs/small.yaml" ]; then
+if [ ! -f "specs/small_v1.yaml" ]; then
     echo "Generating test specs..."
     python generate_test_specs.py
 fi
@@ -25,7 +27,7 @@ echo ""
 echo "=== Parse Benchmarks ==="
 for size in small medium large; do
     echo -n "$size: "
-    time api-governor specs/$size.yaml --json > /dev/null 2>&1
+    time api-governor specs/${size}_v1.yaml --json > /dev/null 2>&1
 done
 
 echo ""
@@ -49,5 +51,11 @@ else
     echo "Install memory-profiler for memory benchmarks: pip install memory-profiler"
 fi
 
+echo ""
+echo "=== Benchmark Suite ==="
+# Per-stage timings and peak memory, as JSON (see benchmark_suite.py)
+python benchmark_suite.py --output results.json
+echo "Results written to results.json"
+
 echo ""
 echo "Done."
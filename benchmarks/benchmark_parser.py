@@ -0,0 +1,115 @@
+"""Parse-time benchmark for OpenAPIParser loaders.
+
+Compares the pure-Python ``yaml.safe_load`` path used before against the
+loaders picked by ``api_governor.parser.load_document`` and reports time
+per MB of spec text, plus the overhead of indexing source positions
+(``load_document_with_positions``) relative to a plain load.
+
+Usage:
+    python benchmarks/benchmark_parser.py [--operations N] [--repeat N]
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any
+
+import yaml
+
+from api_governor.parser import (
+    YAMLLoader,
+    _json_loads,
+    load_document,
+    load_document_with_positions,
+)
+
+
+def make_spec(operations: int) -> dict[str, Any]:
+    """Build a synthetic spec with the given number of operations."""
+    paths: dict[str, Any] = {}
+    schemas: dict[str, Any] = {}
+    for i in range(operations // 2):
+        name = f"Resource{i}"
+        schemas[name] = {
+            "type": "object",
+            "required": ["id", "name"],
+            "properties": {
+                "id": {"type": "string", "format": "uuid"},
+                "name": {"type": "string", "maxLength": 128},
+                "status": {"type": "string", "enum": ["active", "disabled"]},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+        }
+        ref = {"$ref": f"#/components/schemas/{name}"}
+        paths[f"/resources-{i}"] = {
+            "get": {
+                "operationId": f"listResource{i}",
+                "parameters": [
+                    {"name": "limit", "in": "query", "schema": {"type": "integer"}},
+                    {"name": "cursor", "in": "query", "schema": {"type": "string"}},
+                ],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {"application/json": {"schema": ref}},
+                    }
+                },
+            },
+            "post": {
+                "operationId": f"createResource{i}",
+                "requestBody": {"content": {"application/json": {"schema": ref}}},
+                "responses": {"201": {"description": "Created"}},
+            },
+        }
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Benchmark API", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def per_mb(func: Any, content: str, repeat: int) -> float:
+    """Return best-of-N milliseconds per MB for parsing content."""
+    best = min(timeit.repeat(lambda: func(content), number=1, repeat=repeat))
+    return best * 1000 / (len(content.encode()) / 1_000_000)
+
+
+def main() -> None:
+    """Run the parser benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    spec = make_spec(args.operations)
+    yaml_text = yaml.safe_dump(spec, sort_keys=False)
+    json_text = json.dumps(spec, indent=2)
+
+    def load(content: str) -> Any:
+        return load_document(content, ".yaml")
+
+    def load_with_positions(content: str) -> Any:
+        return load_document_with_positions(content, ".yaml")
+
+    rows = [
+        ("YAML spec, yaml.safe_load (before)", yaml.safe_load, yaml_text),
+        (f"YAML spec, {YAMLLoader.__name__} (after)", load, yaml_text),
+        ("JSON-in-.yaml, yaml.safe_load (before)", yaml.safe_load, json_text),
+        ("JSON-in-.yaml, sniffed (after)", load, json_text),
+        ("YAML spec, with source positions", load_with_positions, yaml_text),
+    ]
+
+    print(f"Operations: {args.operations}, JSON loader: {_json_loads.__module__}")
+    print(f"{'Benchmark':<45} {'ms/MB':>10}")
+    timings = []
+    for label, func, content in rows:
+        timings.append(per_mb(func, content, args.repeat))
+        print(f"{label:<45} {timings[-1]:>10.1f}")
+
+    overhead = (timings[4] - timings[1]) / timings[1] * 100
+    print(f"Source position overhead vs. plain YAML load: {overhead:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
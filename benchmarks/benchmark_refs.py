@@ -0,0 +1,128 @@
+"""Benchmark for OpenAPIParser.validate_refs.
+
+Compares the previous recursive implementation, which formatted a location
+string for every node, against the iterative walker that only records
+(parent, key) links for containers. Reports wall time, the number of
+location strings formatted and peak traced memory on a synthetic spec, and
+checks that a deeply nested spec no longer hits the recursion limit. Both
+versions resolve refs through the parser's memoizing resolver, so the
+difference is the walk itself.
+
+Usage:
+    python benchmarks/benchmark_refs.py [--operations N] [--repeat N]
+"""
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+from typing import Any
+
+from benchmark_parser import make_spec
+
+from api_governor.parser import OpenAPIParseError, OpenAPIParser
+
+
+def count_nodes(document: Any) -> int:
+    """Count all nodes (containers and scalars) in a document."""
+    count = 0
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        count += 1
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return count
+
+
+def validate_refs_recursive(parser: OpenAPIParser) -> list[str]:
+    """The previous recursive walk, kept for comparison."""
+    errors = []
+
+    def check_refs(obj: Any, path: str = "") -> None:
+        if isinstance(obj, dict):
+            if "$ref" in obj:
+                ref = obj["$ref"]
+                try:
+                    resolved = parser.resolve_ref(ref)
+                    if not resolved:
+                        errors.append(f"Unresolved ref at {path}: {ref}")
+                except OpenAPIParseError as e:
+                    errors.append(f"Invalid ref at {path}: {e}")
+            for key, value in obj.items():
+                check_refs(value, f"{path}.{key}")
+        elif isinstance(obj, list):
+            for i, item in enumerate(obj):
+                check_refs(item, f"{path}[{i}]")
+
+    check_refs(parser.spec)
+    return errors
+
+
+def peak_memory(func: Any) -> int:
+    """Return peak traced memory in bytes while running func."""
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def deep_spec(depth: int) -> dict[str, Any]:
+    """Build a spec with one schema nested ``depth`` levels deep."""
+    schema: dict[str, Any] = {"$ref": "#/components/schemas/Leaf"}
+    for _ in range(depth):
+        schema = {"type": "object", "properties": {"child": schema}}
+    return {
+        "openapi": "3.0.3",
+        "paths": {},
+        "components": {"schemas": {"Deep": schema, "Leaf": {"type": "string"}}},
+    }
+
+
+def main() -> None:
+    """Run the validate_refs benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    spec_parser = OpenAPIParser.from_spec(make_spec(args.operations))
+    nodes = count_nodes(spec_parser.spec)
+    errors = len(spec_parser.validate_refs())
+    print(f"Operations: {args.operations}, nodes: {nodes}")
+
+    # The recursive version formats a location for every node below the root;
+    # the iterative one only for reported errors
+    def before() -> list[str]:
+        return validate_refs_recursive(spec_parser)
+
+    rows = [
+        ("recursive, per-node paths (before)", before, nodes - 1),
+        ("iterative, lazy paths (after)", spec_parser.validate_refs, errors),
+    ]
+    print(f"{'Implementation':<38} {'ms':>8} {'paths':>8} {'peak KB':>9}")
+    for label, func, paths in rows:
+        func()  # Warm the ref resolver cache
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        peak = peak_memory(func)
+        print(f"{label:<38} {best * 1000:>8.1f} {paths:>8} {peak / 1024:>9.1f}")
+
+    depth = sys.getrecursionlimit() * 2
+    deep = OpenAPIParser.from_spec(deep_spec(depth))
+    try:
+        validate_refs_recursive(deep)
+        recursive_result = "ok"
+    except RecursionError:
+        recursive_result = "RecursionError"
+    iterative_errors = len(deep.validate_refs())
+    print(
+        f"Nesting depth {depth}: recursive {recursive_result}, "
+        f"iterative {iterative_errors} errors"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""Benchmark suite for parse, refs, rules, plugins, the differ and formatters.
+
+For each spec size, generates a seeded spec and a second version with planned
+breaking changes (see ``generate_test_specs.py``), then times:
+
+- ``parse``: loading and parsing the spec file, with source positions
+- ``validate_refs``: ref validation of the parsed spec
+- ``rules`` and ``rule:<Name>``: all built-in rules in their shared
+  traversal, then each rule on its own
+- ``plugin:<RULE_ID>``: each built-in plugin
+- ``diff``: breaking change detection between the two versions
+- ``format:json``, ``format:sarif``, ``format:markdown``: each output format
+- ``run``: a full ``APIGovernor.run`` with baseline and plugins
+
+Each benchmark runs ``--repeat`` times with the garbage collector paused, as
+``timeit`` does, plus one untimed run under ``tracemalloc`` for peak memory.
+Results are written as JSON, one record per benchmark and size, for scaling
+curves and regression checks.
+
+Usage:
+    python benchmarks/benchmark_suite.py [--sizes 10,100,1000] [--repeat N]
+        [--output results.json]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from generate_test_specs import write_versions
+
+from api_governor import __version__
+from api_governor.diff import SpecDiffer
+from api_governor.formatters import JSONFormatter, SARIFFormatter
+from api_governor.governor import APIGovernor
+from api_governor.output import OutputGenerator
+from api_governor.parser import OpenAPIParser, YAMLLoader, _json_loads
+from api_governor.plugins import default_manager
+from api_governor.rules import RuleEngine
+
+#: Format version of the results document
+SCHEMA_VERSION = 1
+
+DEFAULT_SIZES = (10, 100, 1000, 10_000)
+GROUPS = ("parse", "refs", "rules", "plugins", "diff", "format", "run")
+
+
+def measure(
+    func: Callable[[Any], Any],
+    setup: Callable[[], Any] | None = None,
+    repeat: int = 5,
+    memory: bool = True,
+) -> dict[str, Any]:
+    """Time ``func(setup())``; setup is excluded from the timings.
+
+    Returns:
+        Samples, median and minimum in milliseconds, and the peak traced
+        memory of one extra run in KB (if ``memory``)
+    """
+    samples = []
+    for _ in range(repeat):
+        arg = setup() if setup is not None else None
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func(arg)
+            samples.append((time.perf_counter() - start) * 1000)
+        finally:
+            gc.enable()
+
+    record: dict[str, Any] = {
+        "samples_ms": [round(sample, 4) for sample in samples],
+        "median_ms": round(statistics.median(samples), 4),
+        "min_ms": round(min(samples), 4),
+    }
+    if memory:
+        arg = setup() if setup is not None else None
+        tracemalloc.start()
+        try:
+            func(arg)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        record["peak_kb"] = round(peak / 1024, 1)
+    return record
+
+
+def benchmarks(
+    v1_path: Path, v2_path: Path, workdir: Path, groups: tuple[str, ...] = GROUPS
+) -> list[tuple[str, str, Callable[[Any], Any], Callable[[], Any] | None]]:
+    """Build the (group, name, func, setup) benchmarks of some groups for one spec size."""
+    policy = APIGovernor._read_policy(APIGovernor._get_default_policy())
+    v1 = OpenAPIParser(v1_path)
+    v1.parse()
+    v2 = OpenAPIParser(v2_path)
+    v2.parse()
+    _ = v2.operation_index  # Shared by the rules, as in a real run
+
+    def fresh_versions() -> tuple[OpenAPIParser, OpenAPIParser]:
+        return OpenAPIParser.from_spec(v1.spec), OpenAPIParser.from_spec(v2.spec)
+
+    def parse(_: Any) -> None:
+        OpenAPIParser(v2_path, positions=True).parse()
+
+    def run(_: Any) -> Any:
+        return APIGovernor(v2_path, baseline_path=v1_path, plugins=default_manager).run()
+
+    rules = RuleEngine(policy)
+    items: list[tuple[str, str, Callable[[Any], Any], Callable[[], Any] | None]] = [
+        ("parse", "parse", parse, None),
+        ("refs", "validate_refs", lambda p: p.validate_refs(), lambda: fresh_versions()[1]),
+        ("rules", "rules", lambda _: rules.evaluate(v2), None),
+    ]
+    items += [("rules", f"rule:{t.name}", lambda _, t=t: t(v2), None) for t in rules.tasks()]
+    items += [
+        ("plugins", f"plugin:{t.name}", lambda _, t=t: t(v2), None)
+        for t in default_manager.tasks(policy)
+    ]
+    items.append(("diff", "diff", lambda pair: SpecDiffer(policy).diff(*pair), fresh_versions))
+    if "format" in groups:
+        result = run(None)
+        items += [
+            ("format", "format:json", lambda _: JSONFormatter(result).format(), None),
+            ("format", "format:sarif", lambda _: SARIFFormatter(result).format(), None),
+            (
+                "format",
+                "format:markdown",
+                lambda _: OutputGenerator(result, policy, workdir).generate_all(),
+                None,
+            ),
+        ]
+    items.append(("run", "run", run, None))
+    return [item for item in items if item[0] in groups]
+
+
+def environment() -> dict[str, Any]:
+    """Describe the interpreter and machine the suite ran on."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "api_governor": __version__,
+        "yaml_loader": YAMLLoader.__name__,
+        "json_loader": _json_loads.__module__,
+    }
+
+
+def run_suite(
+    sizes: list[int],
+    repeat: int = 5,
+    seed: int = 0,
+    specs_dir: Path | None = None,
+    regenerate: bool = False,
+    memory: bool = True,
+    groups: tuple[str, ...] = GROUPS,
+    log: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """Run the suite and return the results document.
+
+    Args:
+        sizes: Operation counts to benchmark
+        repeat: Timed runs per benchmark
+        seed: Spec generator seed
+        specs_dir: Where generated specs are kept (default: benchmarks/specs);
+            existing specs for a size and seed are reused unless ``regenerate``
+        regenerate: Regenerate specs even if present
+        memory: Measure peak traced memory
+        groups: Benchmark groups to run
+        log: Called with one progress line per benchmark (optional)
+    """
+    specs_dir = specs_dir or Path(__file__).parent / "specs"
+    records: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for operations in sizes:
+            name = f"ops{operations}_seed{seed}"
+            v1_path, v2_path = specs_dir / f"{name}_v1.yaml", specs_dir / f"{name}_v2.yaml"
+            if regenerate or not (v1_path.exists() and v2_path.exists()):
+                v1_path, v2_path = write_versions(specs_dir, name, operations, seed)
+            specs = (v1_path, v2_path, Path(workdir), groups)
+            for group, benchmark, func, setup in benchmarks(*specs):
+                record = {"benchmark": benchmark, "group": group, "operations": operations}
+                record.update(measure(func, setup, repeat, memory))
+                records.append(record)
+                if log is not None:
+                    peak = f"{record['peak_kb']:>12.1f}" if "peak_kb" in record else ""
+                    log(f"{operations:>8} {benchmark:<36} {record['median_ms']:>12.3f}{peak}")
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "seed": seed,
+        "repeat": repeat,
+        "environment": environment(),
+        "results": records,
+    }
+
+
+def parse_sizes(value: str) -> list[int]:
+    """Parse a comma-separated list of operation counts."""
+    return [int(size) for size in value.split(",") if size]
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=list(DEFAULT_SIZES),
+        help="Comma-separated operation counts (default: 10,100,1000,10000; up to 50000)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Spec generator seed")
+    parser.add_argument("--specs", type=Path, help="Generated spec directory")
+    parser.add_argument("--regenerate", action="store_true", help="Regenerate specs")
+    parser.add_argument(
+        "--memory",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Measure peak traced memory (default: on)",
+    )
+    parser.add_argument(
+        "--groups",
+        type=lambda value: tuple(value.split(",")),
+        default=GROUPS,
+        help=f"Comma-separated benchmark groups (default: {','.join(GROUPS)})",
+    )
+    parser.add_argument("--output", "-o", type=Path, help="Results file (default: stdout)")
+    args = parser.parse_args()
+
+    def log(line: str) -> None:
+        print(line, file=sys.stderr, flush=True)
+
+    header = f"{'ops':>8} {'benchmark':<36} {'median ms':>12}"
+    log(header + (f"{'peak KB':>12}" if args.memory else ""))
+    results = run_suite(
+        args.sizes,
+        repeat=args.repeat,
+        seed=args.seed,
+        specs_dir=args.specs,
+        regenerate=args.regenerate,
+        memory=args.memory,
+        groups=args.groups,
+        log=log,
+    )
+    document = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(document + "\n")
+    else:
+        print(document)
+
+
+if __name__ == "__main__":
+    main()
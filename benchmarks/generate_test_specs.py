@@ -0,0 +1,429 @@
+"""Seeded synthetic OpenAPI spec generator for benchmarks.
+
+Generates specs with a given number of operations: CRUD resources, some
+nested under a parent resource, whose schemas nest inline objects several
+levels deep and reference other resource schemas. A second version of each
+spec carries a planned set of breaking changes, cycling through every kind
+``SpecDiffer`` detects, so diff benchmarks compare realistic versions.
+
+The same seed always produces the same specs.
+
+Usage:
+    python benchmarks/generate_test_specs.py [--out specs] [--seed N]
+    python benchmarks/generate_test_specs.py --operations 50000 --out specs
+"""
+
+import argparse
+import copy
+import json
+import random
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+#: Named sizes written by default (operations), as used by benchmark.sh
+SIZES = {"small": 10, "medium": 50, "large": 200, "xlarge": 500}
+
+#: Breaking change kinds planned into the second version, applied in turn
+BREAKING_CHANGES = (
+    "removed_operation",
+    "removed_parameter",
+    "removed_status_code",
+    "removed_field",
+    "optional_to_required",
+    "narrowed_enum",
+    "narrowed_numeric_range",
+    "auth_requirement_change",
+)
+
+_NOUNS = (
+    "account", "address", "invoice", "order", "payment", "product", "refund",
+    "review", "shipment", "subscription", "team", "ticket", "user", "webhook",
+)  # fmt: skip
+_FIELDS = (
+    "label", "notes", "currency", "region", "source", "channel", "reference",
+    "owner", "category", "locale", "timezone", "externalId", "summary",
+)  # fmt: skip
+_ITEM_METHODS = ("get", "patch", "delete")
+
+
+def generate_spec(
+    operations: int, seed: int = 0, schema_depth: int = 3, ref_fanout: int = 2
+) -> dict[str, Any]:
+    """Generate a spec with exactly ``operations`` operations.
+
+    Args:
+        operations: Number of operations to generate
+        seed: Random seed; equal seeds give equal specs
+        schema_depth: Levels of inline objects nested in each resource schema
+        ref_fanout: Maximum refs from each resource schema to earlier ones
+
+    Returns:
+        The spec document
+    """
+    rng = random.Random(seed)
+    schemas: dict[str, Any] = {"Error": _error_schema()}
+    paths: dict[str, Any] = {}
+    resources: list[tuple[str, str]] = []  # (schema name, item path)
+    count = 0
+    while count < operations:
+        index = len(resources)
+        noun = _NOUNS[index % len(_NOUNS)]
+        name = f"{noun.title()}{index}"
+        earlier = [schema for schema, _ in resources]
+        refs = rng.sample(earlier, min(len(earlier), rng.randint(0, ref_fanout)))
+        schemas[name] = _resource_schema(rng, schema_depth, refs)
+
+        # About a third of the resources are nested under an earlier one
+        if resources and rng.random() < 0.3:
+            parent_path = rng.choice(resources)[1]
+        else:
+            parent_path = "/v1"
+        collection = f"{parent_path}/{noun}s-{index}"
+        item = f"{collection}/{{{noun}{index}Id}}"
+        resources.append((name, item))
+
+        ref = {"$ref": f"#/components/schemas/{name}"}
+        for path, methods in ((collection, ("get", "post")), (item, _ITEM_METHODS)):
+            for method in methods:
+                if count == operations:
+                    break
+                path_item = paths.setdefault(path, {})
+                path_item[method] = _operation(rng, method, name, path, ref)
+                count += 1
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Synthetic Benchmark API", "version": "1.0.0"},
+        "servers": [{"url": "https://api.example.com"}],
+        "security": [{"bearerAuth": []}],
+        "paths": paths,
+        "components": {
+            "schemas": schemas,
+            "securitySchemes": {"bearerAuth": {"type": "http", "scheme": "bearer"}},
+        },
+    }
+
+
+def plan_breaking_changes(
+    spec: dict[str, Any], count: int, seed: int = 0
+) -> tuple[dict[str, Any], list[dict[str, str]]]:
+    """Derive a second spec version carrying planned breaking changes.
+
+    Args:
+        spec: Spec to change (not modified)
+        count: Number of changes, cycling through ``BREAKING_CHANGES``
+        seed: Random seed for picking change targets
+
+    Returns:
+        The changed spec, and one {"kind", "location"} record per change
+        applied (kinds with no remaining target are skipped)
+    """
+    rng = random.Random(seed)
+    changed = copy.deepcopy(spec)
+    targets = _Targets(changed)
+    planned: list[dict[str, str]] = []
+    for i in range(count):
+        kind = BREAKING_CHANGES[i % len(BREAKING_CHANGES)]
+        location = _CHANGES[kind](rng, targets)
+        if location is not None:
+            planned.append({"kind": kind, "location": location})
+    changed["info"]["version"] = "2.0.0"
+    return changed, planned
+
+
+def _error_schema() -> dict[str, Any]:
+    return {
+        "type": "object",
+        "required": ["code", "message", "requestId"],
+        "properties": {
+            "code": {"type": "string"},
+            "message": {"type": "string"},
+            "requestId": {"type": "string"},
+            "details": {"type": "array", "items": {"type": "object"}},
+        },
+    }
+
+
+def _resource_schema(rng: random.Random, depth: int, refs: list[str]) -> dict[str, Any]:
+    schema = _object_schema(rng, depth)
+    properties = schema["properties"]
+    properties["id"] = {"type": "string", "format": "uuid", "readOnly": True}
+    properties["status"] = {"type": "string", "enum": ["active", "pending", "archived"]}
+    properties["quantity"] = {"type": "integer", "minimum": 0, "maximum": 1000}
+    properties["createdAt"] = {"type": "string", "format": "date-time"}
+    for ref in refs:
+        properties[ref[0].lower() + ref[1:]] = {"$ref": f"#/components/schemas/{ref}"}
+    schema["required"] = ["id", "status", *schema["required"]]
+    return schema
+
+
+def _object_schema(rng: random.Random, depth: int) -> dict[str, Any]:
+    properties: dict[str, Any] = {}
+    for field in rng.sample(_FIELDS, rng.randint(3, 6)):
+        properties[field] = _field_schema(rng, depth - 1)
+    required = sorted(rng.sample(sorted(properties), rng.randint(0, 2)))
+    return {"type": "object", "required": required, "properties": properties}
+
+
+def _field_schema(rng: random.Random, depth: int) -> dict[str, Any]:
+    kind = rng.choice(("string", "integer", "enum", "array", "object"))
+    if kind == "object" and depth > 0:
+        return _object_schema(rng, depth)
+    if kind == "array":
+        items = _object_schema(rng, depth) if depth > 0 else {"type": "string"}
+        return {"type": "array", "items": items, "maxItems": 100}
+    if kind == "integer":
+        return {"type": "integer", "minimum": 0, "maximum": rng.choice((10, 100, 10_000))}
+    if kind == "enum":
+        return {"type": "string", "enum": [f"value{i}" for i in range(rng.randint(2, 5))]}
+    return {"type": "string", "maxLength": rng.choice((32, 128, 1024))}
+
+
+def _operation(
+    rng: random.Random, method: str, name: str, path: str, ref: dict[str, str]
+) -> dict[str, Any]:
+    is_list = method == "get" and not path.endswith("Id}")
+    operation: dict[str, Any] = {
+        "operationId": f"{method}{name}{'List' if is_list else ''}",
+        "summary": f"{method.upper()} {name}",
+        "tags": [name],
+    }
+    if rng.random() < 0.8:
+        operation["description"] = f"{method.upper()} operation on {name} resources."
+
+    parameters: list[dict[str, Any]] = [
+        {"name": segment[1:-1], "in": "path", "required": True, "schema": {"type": "string"}}
+        for segment in path.split("/")
+        if segment.startswith("{")
+    ]
+    if is_list:
+        parameters += [
+            {"name": "limit", "in": "query", "schema": {"type": "integer", "maximum": 100}},
+            {"name": "cursor", "in": "query", "schema": {"type": "string"}},
+        ]
+    if parameters:
+        operation["parameters"] = parameters
+
+    if method in ("post", "patch"):
+        operation["requestBody"] = {
+            "required": True,
+            "content": {"application/json": {"schema": ref}},
+        }
+
+    error = {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Error"}}}}
+    if method == "delete":
+        responses: dict[str, Any] = {"204": {"description": "Deleted"}}
+    else:
+        body = {"type": "array", "items": ref} if is_list else ref
+        content: dict[str, Any] = {"schema": body}
+        if rng.random() < 0.3:
+            content["example"] = {"id": "00000000-0000-0000-0000-000000000000"}
+        status = "201" if method == "post" else "200"
+        responses = {status: {"description": "OK", "content": {"application/json": content}}}
+    responses["400"] = {"description": "Bad request", **error}
+    if not is_list and method != "post":
+        responses["404"] = {"description": "Not found", **error}
+    operation["responses"] = responses
+    return operation
+
+
+class _Targets:
+    """Change targets of a spec, sampled at random rather than rescanned per change."""
+
+    attempts = 50  # Random picks before a kind is considered to have no target left
+
+    def __init__(self, spec: dict[str, Any]):
+        self.spec = spec
+        self.operations = [
+            (path, method) for path, path_item in spec["paths"].items() for method in path_item
+        ]
+        self.schemas = [name for name in spec["components"]["schemas"] if name != "Error"]
+
+    def operation(
+        self, rng: random.Random, accept: Callable[[dict[str, Any]], bool]
+    ) -> tuple[str, str, dict[str, Any]] | None:
+        """Pick a random remaining operation that ``accept`` allows."""
+        for _ in range(self.attempts):
+            if not self.operations:
+                return None
+            path, method = rng.choice(self.operations)
+            operation = self.spec["paths"].get(path, {}).get(method)
+            if operation is not None and accept(operation):
+                return path, method, operation
+        return None
+
+    def optional_property(self, rng: random.Random) -> tuple[str, dict[str, Any], str] | None:
+        """Pick a random resource schema and one of its optional properties."""
+        for _ in range(self.attempts):
+            name = rng.choice(self.schemas)
+            schema = self.spec["components"]["schemas"][name]
+            optional = [p for p in schema["properties"] if p not in schema["required"]]
+            if optional:
+                return name, schema, rng.choice(optional)
+        return None
+
+    def property(
+        self, rng: random.Random, prop: str, accept: Callable[[dict[str, Any]], bool]
+    ) -> tuple[str, dict[str, Any]] | None:
+        """Pick a random resource schema whose property ``prop`` ``accept`` allows."""
+        for _ in range(self.attempts):
+            name = rng.choice(self.schemas)
+            schema = self.spec["components"]["schemas"][name]["properties"].get(prop)
+            if schema is not None and accept(schema):
+                return name, schema
+        return None
+
+
+def _remove_operation(rng: random.Random, targets: _Targets) -> str | None:
+    if len(targets.operations) < 2:
+        return None
+    path, method = targets.operations.pop(rng.randrange(len(targets.operations)))
+    paths = targets.spec["paths"]
+    del paths[path][method]
+    if not paths[path]:
+        del paths[path]
+    return f"{method.upper()} {path}"
+
+
+def _remove_parameter(rng: random.Random, targets: _Targets) -> str | None:
+    picked = targets.operation(
+        rng, lambda operation: any(p["in"] == "query" for p in operation.get("parameters", []))
+    )
+    if picked is None:
+        return None
+    path, method, operation = picked
+    query = [p for p in operation["parameters"] if p["in"] == "query"]
+    operation["parameters"].remove(query[-1])
+    return f"{method.upper()} {path} -> {query[-1]['name']}"
+
+
+def _remove_status_code(rng: random.Random, targets: _Targets) -> str | None:
+    picked = targets.operation(rng, lambda operation: "400" in operation["responses"])
+    if picked is None:
+        return None
+    path, method, operation = picked
+    del operation["responses"]["400"]
+    return f"{method.upper()} {path} -> 400"
+
+
+def _remove_field(rng: random.Random, targets: _Targets) -> str | None:
+    picked = targets.optional_property(rng)
+    if picked is None:
+        return None
+    name, schema, prop = picked
+    del schema["properties"][prop]
+    return f"schemas.{name}.{prop}"
+
+
+def _require_field(rng: random.Random, targets: _Targets) -> str | None:
+    picked = targets.optional_property(rng)
+    if picked is None:
+        return None
+    name, schema, prop = picked
+    schema["required"].append(prop)
+    return f"schemas.{name}.{prop}"
+
+
+def _narrow_enum(rng: random.Random, targets: _Targets) -> str | None:
+    picked = targets.property(rng, "status", lambda status: len(status.get("enum", ())) > 1)
+    if picked is None:
+        return None
+    name, status = picked
+    removed = status["enum"].pop()
+    return f"schemas.{name}.status -> {removed}"
+
+
+def _narrow_range(rng: random.Random, targets: _Targets) -> str | None:
+    picked = targets.property(rng, "quantity", lambda quantity: quantity["maximum"] > 1)
+    if picked is None:
+        return None
+    name, quantity = picked
+    quantity["maximum"] //= 2
+    return f"schemas.{name}.quantity"
+
+
+def _change_auth(rng: random.Random, targets: _Targets) -> str | None:
+    picked = targets.operation(rng, lambda operation: "security" not in operation)
+    if picked is None:
+        return None
+    path, method, operation = picked
+    schemes = targets.spec["components"]["securitySchemes"]
+    schemes["apiKey"] = {"type": "apiKey", "in": "header", "name": "X-API-Key"}
+    operation["security"] = [{"apiKey": []}]
+    return f"{method.upper()} {path}"
+
+
+_CHANGES = {
+    "removed_operation": _remove_operation,
+    "removed_parameter": _remove_parameter,
+    "removed_status_code": _remove_status_code,
+    "removed_field": _remove_field,
+    "optional_to_required": _require_field,
+    "narrowed_enum": _narrow_enum,
+    "narrowed_numeric_range": _narrow_range,
+    "auth_requirement_change": _change_auth,
+}
+
+
+def dump(spec: dict[str, Any], path: Path) -> None:
+    """Write a spec as YAML (with libyaml when available) or, for .json, as JSON."""
+    if path.suffix == ".json":
+        path.write_text(json.dumps(spec, indent=2))
+        return
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    path.write_text(yaml.dump(spec, Dumper=dumper, sort_keys=False))
+
+
+def write_versions(
+    out_dir: Path, name: str, operations: int, seed: int = 0, changes: int | None = None
+) -> tuple[Path, Path]:
+    """Write ``<name>_v1.yaml``, ``<name>_v2.yaml`` and ``<name>_changes.json``.
+
+    Args:
+        out_dir: Output directory
+        name: Base file name
+        operations: Operations in the first version
+        seed: Random seed
+        changes: Breaking changes planned into the second version
+            (default: one per kind, plus one per 100 operations)
+
+    Returns:
+        Paths of the two versions
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if changes is None:
+        changes = len(BREAKING_CHANGES) + operations // 100
+    v1 = generate_spec(operations, seed)
+    v2, planned = plan_breaking_changes(v1, changes, seed)
+    v1_path, v2_path = out_dir / f"{name}_v1.yaml", out_dir / f"{name}_v2.yaml"
+    dump(v1, v1_path)
+    dump(v2, v2_path)
+    (out_dir / f"{name}_changes.json").write_text(json.dumps(planned, indent=2))
+    return v1_path, v2_path
+
+
+def main() -> None:
+    """Write the benchmark specs."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", type=Path, default=Path(__file__).parent / "specs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--operations",
+        type=int,
+        action="append",
+        help="Write ops<N>_v1/_v2 specs with N operations instead of the named sizes "
+        "(repeatable)",
+    )
+    args = parser.parse_args()
+
+    sizes = {f"ops{n}": n for n in args.operations} if args.operations else SIZES
+    for name, operations in sizes.items():
+        v1_path, v2_path = write_versions(args.out, name, operations, args.seed)
+        print(f"{name}: {operations} operations -> {v1_path}, {v2_path}")
+
+
+if __name__ == "__main__":
+    main()
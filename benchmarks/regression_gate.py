@@ -0,0 +1,392 @@
+"""Performance regression gate over benchmark suite results.
+
+Runs the benchmark suite (or reads a results file), stores the results as
+``history/<commit>.json`` and compares them with a baseline results file.
+Each benchmark's median time and peak memory are checked:
+
+- Time regresses when both the median and the fastest sample exceed the
+  baseline's by more than the larger of ``--threshold`` and three times the
+  combined sample noise (relative median absolute deviation of both runs).
+  Noise only ever adds time, so a slow outlier run moves the median but
+  rarely the minimum. A noisy benchmark needs a larger slowdown to fail,
+  and differences under ``--min-delta-ms`` are ignored as timer jitter.
+- Peak memory regresses when it exceeds the baseline by more than
+  ``--memory-threshold`` and ``--min-delta-kb``.
+
+Writes a markdown summary (suitable for ``benchmarks/results.md``) and exits
+with status 1 if any benchmark regressed. Without a baseline the gate fails
+before running anything, unless ``--update-baseline`` records the first one.
+
+Usage:
+    python benchmarks/regression_gate.py [--baseline baseline.json]
+        [--current results.json | suite options] [--summary results.md]
+        [--update-baseline]
+"""
+
+import argparse
+import json
+import math
+import shutil
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+BENCHMARKS_DIR = Path(__file__).parent
+
+#: Multiple of the combined sample noise a slowdown must exceed
+NOISE_FACTOR = 3.0
+
+#: Scales a median absolute deviation to a standard deviation estimate
+MAD_TO_SIGMA = 1.4826
+
+
+@dataclass
+class Comparison:
+    """Baseline versus current measurements of one benchmark and size."""
+
+    benchmark: str
+    operations: int
+    median_ms: float | None
+    baseline_ms: float | None
+    min_ms: float | None = None
+    baseline_min_ms: float | None = None
+    peak_kb: float | None = None
+    baseline_kb: float | None = None
+    tolerance: float = 0.0  # Relative time tolerance applied
+    status: str = "ok"  # ok, regression, improvement, new, missing
+    reasons: tuple[str, ...] = ()
+
+    @property
+    def time_change(self) -> float | None:
+        """Get the relative change of the median time."""
+        return _change(self.median_ms, self.baseline_ms)
+
+    @property
+    def memory_change(self) -> float | None:
+        """Get the relative change of the peak memory."""
+        return _change(self.peak_kb, self.baseline_kb)
+
+
+def relative_noise(record: dict[str, Any]) -> float:
+    """Estimate the relative standard deviation of a record's samples."""
+    samples = record.get("samples_ms") or []
+    median = record.get("median_ms") or 0.0
+    if len(samples) < 2 or median <= 0:
+        return 0.0
+    mad = statistics.median(abs(sample - median) for sample in samples)
+    return MAD_TO_SIGMA * mad / median
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = 0.2,
+    memory_threshold: float = 0.2,
+    min_delta_ms: float = 0.5,
+    min_delta_kb: float = 64.0,
+) -> list[Comparison]:
+    """Compare two results documents, benchmark by benchmark.
+
+    Args:
+        baseline: Baseline results document
+        current: Current results document
+        threshold: Relative slowdown that fails the gate on noise-free samples
+        memory_threshold: Relative peak memory growth that fails the gate
+        min_delta_ms: Median time differences below this are never regressions
+        min_delta_kb: Peak memory differences below this are never regressions
+
+    Returns:
+        One comparison per benchmark and size, in current-results order,
+        followed by baseline benchmarks missing from the current results
+    """
+    baseline_records = {_key(r): r for r in baseline.get("results", [])}
+    comparisons: list[Comparison] = []
+    for record in current.get("results", []):
+        base = baseline_records.pop(_key(record), None)
+        comparison = Comparison(
+            record["benchmark"],
+            record["operations"],
+            median_ms=record["median_ms"],
+            baseline_ms=base["median_ms"] if base else None,
+            min_ms=record.get("min_ms"),
+            baseline_min_ms=base.get("min_ms") if base else None,
+            peak_kb=record.get("peak_kb"),
+            baseline_kb=base.get("peak_kb") if base else None,
+        )
+        if base is None:
+            comparison.status = "new"
+        else:
+            noise = math.hypot(relative_noise(base), relative_noise(record))
+            comparison.tolerance = max(threshold, NOISE_FACTOR * noise)
+            _judge(comparison, memory_threshold, min_delta_ms, min_delta_kb)
+        comparisons.append(comparison)
+
+    for base in baseline_records.values():
+        comparisons.append(
+            Comparison(
+                base["benchmark"],
+                base["operations"],
+                median_ms=None,
+                baseline_ms=base["median_ms"],
+                baseline_kb=base.get("peak_kb"),
+                status="missing",
+            )
+        )
+    return comparisons
+
+
+def _key(record: dict[str, Any]) -> tuple[str, int]:
+    return record["benchmark"], record["operations"]
+
+
+def _change(value: float | None, baseline: float | None) -> float | None:
+    if value is None or not baseline:
+        return None
+    return value / baseline - 1
+
+
+def _judge(
+    comparison: Comparison, memory_threshold: float, min_delta_ms: float, min_delta_kb: float
+) -> None:
+    """Set a comparison's status from its time and memory changes."""
+    reasons = []
+    improved = False
+    assert comparison.median_ms is not None and comparison.baseline_ms is not None
+    delta_ms = comparison.median_ms - comparison.baseline_ms
+    change = comparison.time_change
+    # Without recorded minimums, the median alone decides
+    min_change = _change(comparison.min_ms, comparison.baseline_min_ms)
+    if min_change is None:
+        min_change = change
+    tolerance = comparison.tolerance
+    if change is not None and min_change is not None and abs(delta_ms) >= min_delta_ms:
+        if change > tolerance and min_change > tolerance:
+            reasons.append(f"time +{change:.0%} (tolerance {tolerance:.0%})")
+        elif change < -tolerance and min_change < -tolerance:
+            improved = True
+
+    memory_change = comparison.memory_change
+    if memory_change is not None and comparison.peak_kb is not None:
+        assert comparison.baseline_kb is not None
+        delta_kb = comparison.peak_kb - comparison.baseline_kb
+        if memory_change > memory_threshold and delta_kb >= min_delta_kb:
+            reasons.append(f"peak memory +{memory_change:.0%}")
+
+    comparison.reasons = tuple(reasons)
+    if reasons:
+        comparison.status = "regression"
+    elif improved:
+        comparison.status = "improvement"
+
+
+def git_commit(cwd: Path = BENCHMARKS_DIR) -> dict[str, Any] | None:
+    """Describe the checked-out commit, or None outside a git work tree."""
+    try:
+        sha = _git(cwd, "rev-parse", "HEAD")
+        dirty = bool(_git(cwd, "status", "--porcelain", "--untracked-files=no"))
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return {"sha": sha, "dirty": dirty}
+
+
+def _git(cwd: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def store(results: dict[str, Any], history_dir: Path) -> Path:
+    """Store results under the commit they were measured at.
+
+    Returns:
+        Path of the stored file, ``<sha>.json`` (``<sha>-dirty.json`` with
+        uncommitted changes, ``<timestamp>.json`` outside git)
+    """
+    history_dir.mkdir(parents=True, exist_ok=True)
+    commit = results.get("commit")
+    if commit:
+        name = commit["sha"][:12] + ("-dirty" if commit["dirty"] else "")
+    else:
+        name = results["created"].replace(":", "")
+    path = history_dir / f"{name}.json"
+    path.write_text(json.dumps(results, indent=2) + "\n")
+    return path
+
+
+def summarize(
+    current: dict[str, Any],
+    comparisons: list[Comparison],
+    baseline: dict[str, Any] | None = None,
+    threshold: float = 0.2,
+    memory_threshold: float = 0.2,
+) -> str:
+    """Render the comparison as a markdown report."""
+    regressions = [c for c in comparisons if c.status == "regression"]
+    improvements = [c for c in comparisons if c.status == "improvement"]
+    env = current.get("environment", {})
+    created = datetime.fromisoformat(current["created"]).date().isoformat()
+
+    lines = [
+        "# Benchmark Results",
+        "",
+        f"Last updated: {created} ({_describe(current)})",
+        "",
+        f"Environment: Python {env.get('python')} ({env.get('implementation')}), "
+        f"{env.get('platform')}, {env.get('cpu_count')} CPU(s), "
+        f"YAML loader {env.get('yaml_loader')}, JSON loader {env.get('json_loader')}",
+        "",
+    ]
+    if baseline is None:
+        lines += ["No baseline to compare against.", ""]
+    else:
+        lines += [f"Baseline: {_describe(baseline)}", ""]
+        if baseline.get("environment") != env:
+            lines += ["> **Note:** baseline was measured in a different environment.", ""]
+        status = "FAIL" if regressions else "PASS"
+        lines += [
+            f"**Result: {status}** ({len(regressions)} regressions, "
+            f"{len(improvements)} improvements)",
+            "",
+        ]
+        for comparison in regressions:
+            lines.append(
+                f"- `{comparison.benchmark}` at {comparison.operations} operations: "
+                + "; ".join(comparison.reasons)
+            )
+        if regressions:
+            lines.append("")
+
+    for operations in sorted({c.operations for c in comparisons}):
+        lines += [
+            f"## {operations} operations",
+            "",
+            "| Benchmark | Median | Baseline | Change | Peak memory | Baseline | Change | Status |",
+            "|-----------|-------:|---------:|-------:|------------:|---------:|-------:|--------|",
+        ]
+        for c in comparisons:
+            if c.operations != operations:
+                continue
+            lines.append(
+                f"| `{c.benchmark}` | {_ms(c.median_ms)} | {_ms(c.baseline_ms)} "
+                f"| {_percent(c.time_change)} | {_kb(c.peak_kb)} | {_kb(c.baseline_kb)} "
+                f"| {_percent(c.memory_change)} | {c.status} |"
+            )
+        lines.append("")
+
+    lines += [
+        "## Notes",
+        "",
+        f"- Times are the median of {current.get('repeat')} runs with the garbage "
+        "collector paused; memory is peak traced (`tracemalloc`) memory of one run",
+        f"- Time regresses beyond {threshold:.0%} or three times the sample noise, "
+        f"whichever is larger; peak memory regresses beyond {memory_threshold:.0%}",
+        "- Specs are generated by `generate_test_specs.py` "
+        f"with seed {current.get('seed')}",
+        "- Regenerate with `python benchmarks/regression_gate.py --summary "
+        "benchmarks/results.md`",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def _describe(results: dict[str, Any]) -> str:
+    commit = results.get("commit")
+    if not commit:
+        return f"run at {results['created']}"
+    dirty = " with uncommitted changes" if commit["dirty"] else ""
+    return f"commit `{commit['sha'][:12]}`{dirty}"
+
+
+def _ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.3f} ms"
+
+
+def _kb(value: float | None) -> str:
+    return "-" if value is None else f"{value:,.1f} KB"
+
+
+def _percent(value: float | None) -> str:
+    return "-" if value is None else f"{value:+.1%}"
+
+
+def main() -> int:
+    """Run the regression gate."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BENCHMARKS_DIR / "baseline.json",
+        help="Baseline results (default: benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--current", type=Path, help="Compare this results file instead of running the suite"
+    )
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=BENCHMARKS_DIR / "history",
+        help="Where run results are stored per commit (default: benchmarks/history)",
+    )
+    parser.add_argument("--summary", type=Path, help="Markdown summary file (default: stdout)")
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Make the current results the baseline"
+    )
+    parser.add_argument("--threshold", type=float, default=0.2, help="Time tolerance")
+    parser.add_argument(
+        "--memory-threshold", type=float, default=0.2, help="Peak memory tolerance"
+    )
+    parser.add_argument("--min-delta-ms", type=float, default=0.5)
+    parser.add_argument("--min-delta-kb", type=float, default=64.0)
+    parser.add_argument("--sizes", default="10,100,1000", help="Suite spec sizes")
+    parser.add_argument("--repeat", type=int, default=7, help="Suite timed runs per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Suite spec generator seed")
+    args = parser.parse_args()
+    if not args.baseline.exists() and not args.update_baseline:
+        parser.error(f"no baseline at {args.baseline}; record one with --update-baseline")
+
+    if args.current:
+        current = json.loads(args.current.read_text())
+    else:
+        # Imported here so comparing stored results does not need api_governor
+        from benchmark_suite import parse_sizes, run_suite
+
+        def log(line: str) -> None:
+            print(line, file=sys.stderr, flush=True)
+
+        current = run_suite(parse_sizes(args.sizes), args.repeat, args.seed, log=log)
+        current["commit"] = git_commit()
+        path = store(current, args.history)
+        print(f"Results stored in {path}", file=sys.stderr)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    comparisons = compare(
+        baseline or {},
+        current,
+        args.threshold,
+        args.memory_threshold,
+        args.min_delta_ms,
+        args.min_delta_kb,
+    )
+    summary = summarize(current, comparisons, baseline, args.threshold, args.memory_threshold)
+    if args.summary:
+        args.summary.write_text(summary)
+    else:
+        print(summary)
+
+    if args.update_baseline:
+        if args.current:
+            shutil.copyfile(args.current, args.baseline)
+        else:
+            args.baseline.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"Baseline updated: {args.baseline}", file=sys.stderr)
+
+    return 1 if any(c.status == "regression" for c in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
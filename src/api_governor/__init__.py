@@ -3,26 +3,42 @@
 __version__ = "1.0.0"
 
 from .diff import SpecDiffer
+from .executors import ProcessExecutor, RuleExecutor, SerialExecutor, ThreadExecutor
 from .formatters import JSONFormatter, SARIFFormatter, format_result
 from .governor import APIGovernor
 from .models import (
+    BatchResult,
     BreakingChange,
     Finding,
     GovernanceResult,
+    HistoryResult,
     PolicyConfig,
+    RunProfile,
     Severity,
+    Template,
+    Timing,
+    VersionDiff,
 )
 from .parser import OpenAPIParser
 from .plugins import PluginManager, RulePlugin, default_manager
+from .policy import PolicyError
 from .rules import RuleEngine
+from .traversal import SpecVisitor, SpecWalker
 
 __all__ = [
     "APIGovernor",
     "Finding",
     "Severity",
     "GovernanceResult",
+    "BatchResult",
+    "HistoryResult",
+    "VersionDiff",
+    "RunProfile",
+    "Timing",
+    "Template",
     "BreakingChange",
     "PolicyConfig",
+    "PolicyError",
     "OpenAPIParser",
     "RuleEngine",
     "SpecDiffer",
@@ -32,4 +48,10 @@ __all__ = [
     "RulePlugin",
     "PluginManager",
     "default_manager",
+    "SpecVisitor",
+    "SpecWalker",
+    "RuleExecutor",
+    "SerialExecutor",
+    "ThreadExecutor",
+    "ProcessExecutor",
 ]
@@ -1,11 +1,14 @@
 """CLI entry point for API Governor."""
 
 import argparse
+import glob
 import json
 import sys
 from pathlib import Path
 
-from . import APIGovernor, __version__
+from . import APIGovernor, Severity, __version__
+from .executors import EXECUTOR_KINDS, create_executor
+from .models import RunProfile
 
 
 def main() -> int:
@@ -21,8 +24,8 @@ def main() -> int:
     )
     parser.add_argument(
         "spec",
-        type=Path,
-        help="Path to OpenAPI spec file",
+        nargs="*",
+        help="Path(s) or glob pattern(s) of OpenAPI spec files; more than one runs in batch mode",
     )
     parser.add_argument(
         "--policy",
@@ -34,6 +37,18 @@ def main() -> int:
         type=Path,
         help="Path to baseline spec for breaking change detection",
     )
+    parser.add_argument(
+        "--baseline-rev",
+        metavar="REV",
+        help="Git revision to read the baseline from, e.g. origin/main "
+        "(the spec's own path, or --baseline's path, at that revision)",
+    )
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        help="Treat the specs as an ordered release chain (oldest first) and report "
+        "breaking changes between adjacent versions",
+    )
     parser.add_argument(
         "--output",
         "-o",
@@ -41,6 +56,23 @@ def main() -> int:
         default=Path("governance"),
         help="Output directory for artifacts (default: governance/)",
     )
+    parser.add_argument(
+        "--fail-fast",
+        choices=["blocker", "major"],
+        help="Stop at the first finding of this severity or worse and report a partial "
+        "result (checks that can reach it run first)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record wall time, CPU time and finding counts per phase and per rule or plugin",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        type=Path,
+        metavar="PATH",
+        help="Dump cProfile stats of the slowest rule or plugin to PATH (implies --profile)",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -52,6 +84,40 @@ def main() -> int:
         help="Use strict public API policy preset",
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory for persistent parsed-spec and result caches (default: disabled)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Worker processes for batch mode, or workers for --rule-executor (default: CPU count)",
+    )
+    parser.add_argument(
+        "--rule-executor",
+        choices=list(EXECUTOR_KINDS),
+        help="Run rules and plugins of a single spec as parallel tasks on threads or "
+        "processes (default: one shared traversal in the calling thread)",
+    )
+
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run a resident JSON-RPC server (newline-delimited, stdio unless --socket)",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="Unix socket path for --serve",
+    )
+    parser.add_argument(
+        "--lsp",
+        action="store_true",
+        help="Run a Language Server Protocol server on stdio",
+    )
+
     args = parser.parse_args()
 
     # Determine policy path
@@ -60,15 +126,64 @@ def main() -> int:
         skill_dir = Path(__file__).parent.parent.parent
         policy_path = skill_dir / "skills" / "api-governor" / "policy" / "preset.strict.public.yaml"
 
+    if args.lsp:
+        from .lsp import LanguageServer
+
+        LanguageServer(policy_path=policy_path).serve()
+        return 0
+    if args.serve:
+        from .server import GovernorServer
+
+        server = GovernorServer(cache_dir=args.cache_dir, policy_path=policy_path)
+        if args.socket:
+            server.serve_unix(args.socket)
+        else:
+            server.serve_stdio()
+        return 0
+    if not args.spec:
+        parser.error("at least one SPEC is required")
+
+    specs = expand_specs(args.spec, unique=not args.history)
+    if not specs:
+        parser.error(f"no spec files match {', '.join(args.spec)}")
+    if args.history:
+        if args.baseline or args.baseline_rev:
+            parser.error("--baseline/--baseline-rev cannot be used with --history")
+        if len(specs) < 2:
+            parser.error("--history needs at least two specs")
+        if args.fail_fast:
+            parser.error("--fail-fast cannot be used with --history")
+    batch = len(specs) != 1 or any(glob.has_magic(p) for p in args.spec)
+    if batch and (args.baseline or args.baseline_rev):
+        parser.error("--baseline/--baseline-rev cannot be used with multiple specs")
+
+    if args.rule_executor and (batch or args.history):
+        parser.error("--rule-executor applies to a single spec only")
+    if (args.profile or args.profile_trace) and (batch or args.history):
+        parser.error("--profile/--profile-trace apply to a single spec only")
+
+    fail_fast = Severity[args.fail_fast.upper()] if args.fail_fast else None
     try:
+        if args.history:
+            return run_history(args, specs, policy_path)
+        if batch:
+            return run_batch(args, specs, policy_path, fail_fast)
+
         governor = APIGovernor(
-            spec_path=args.spec,
+            spec_path=specs[0],
             policy_path=policy_path,
             baseline_path=args.baseline,
             output_dir=args.output,
+            cache_dir=args.cache_dir,
+            baseline_rev=args.baseline_rev,
+            rule_executor=(
+                create_executor(args.rule_executor, args.jobs) if args.rule_executor else None
+            ),
+            profile=args.profile,
+            profile_trace=args.profile_trace,
         )
 
-        result = governor.run()
+        result = governor.run(fail_fast=fail_fast)
 
         if args.json:
             print(json.dumps(result.to_dict(), indent=2))
@@ -80,6 +195,8 @@ def main() -> int:
             print(f"{'=' * 60}")
             print(f"Policy: {result.policy_name}")
             print(f"Spec: {result.spec_path}")
+            if result.partial:
+                print(f"Partial result: stopped at the first {args.fail_fast.upper()} finding")
             print()
 
             print("Findings:")
@@ -98,6 +215,9 @@ def main() -> int:
                 print(f"  {name}: {path}")
             print()
 
+            if result.profile is not None:
+                print_profile(result.profile)
+
         # Exit code based on result
         if result.status == "FAIL":
             return 1
@@ -113,5 +233,116 @@ def main() -> int:
         return 3
 
 
+def print_profile(profile: RunProfile) -> None:
+    """Print phase and rule timings of a profiled run."""
+    for title, timings in (("Phases", profile.phases), ("Rules", profile.rules)):
+        if not timings:
+            continue
+        print(f"{title} (wall ms / cpu ms / findings):")
+        width = max(len(t.name) for t in timings)
+        for t in timings:
+            print(f"  {t.name:<{width}}  {t.wall_ms:9.2f}  {t.cpu_ms:9.2f}  {t.findings:6d}")
+        print()
+    if profile.trace_path is not None:
+        print(f"Slowest rule trace: {profile.trace_path}")
+        print()
+
+
+def expand_specs(patterns: list[str], unique: bool = True) -> list[Path]:
+    """Expand spec arguments, resolving glob patterns in order.
+
+    Args:
+        patterns: Spec paths or glob patterns
+        unique: Drop repeated paths (release chains may revisit a version)
+    """
+    specs: list[Path] = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            specs.extend(Path(match) for match in sorted(glob.glob(pattern, recursive=True)))
+        else:
+            specs.append(Path(pattern))
+    return list(dict.fromkeys(specs)) if unique else specs
+
+
+def run_batch(
+    args: argparse.Namespace,
+    specs: list[Path],
+    policy_path: Path | None,
+    fail_fast: Severity | None = None,
+) -> int:
+    """Run batch mode and print the aggregated report."""
+    batch = APIGovernor.run_batch(
+        specs,
+        policy_path=policy_path,
+        cache_dir=args.cache_dir,
+        jobs=args.jobs,
+        fail_fast=fail_fast,
+    )
+
+    if args.json:
+        print(json.dumps(batch.to_dict(), indent=2))
+    else:
+        APIGovernor.generate_batch_artifacts(batch, args.output, policy_path)
+
+        print(f"\n{'=' * 60}")
+        print(f"API Governance Batch Result: {batch.status}")
+        print(f"{'=' * 60}")
+        print(f"Policy: {batch.policy_name}")
+        print(f"Specs: {len(batch.results)}")
+        print()
+
+        for result in batch.results:
+            print(
+                f"  {result.status:<4}  {result.spec_path}  "
+                f"(BLOCKER: {len(result.blockers)}, MAJOR: {len(result.majors)}, "
+                f"MINOR: {len(result.minors)}, INFO: {len(result.infos)})"
+                + (" [partial]" if result.partial else "")
+            )
+        print()
+        print(f"Artifacts: {args.output}")
+        print()
+
+    return 1 if batch.status == "FAIL" else 0
+
+
+def run_history(args: argparse.Namespace, specs: list[Path], policy_path: Path | None) -> int:
+    """Run history mode and print the breaking change timeline."""
+    history = APIGovernor.run_history(
+        specs,
+        policy_path=policy_path,
+        cache_dir=args.cache_dir,
+        jobs=args.jobs,
+    )
+
+    if args.json:
+        print(json.dumps(history.to_dict(), indent=2))
+        return 0
+
+    print(f"\n{'=' * 60}")
+    print(f"API Breaking Change History: {history.status}")
+    print(f"{'=' * 60}")
+    print(f"Policy: {history.policy_name}")
+    print(f"Versions: {len(history.versions)}")
+    print()
+
+    for step in history.steps:
+        print(
+            f"  {step.baseline_path} -> {step.current_path}: "
+            f"{len(step.breaking_changes)} breaking change(s)"
+        )
+    print()
+
+    timeline = history.timeline
+    if timeline:
+        print("Timeline:")
+        for endpoint, changes in timeline.items():
+            print(f"  {endpoint}")
+            for version, bc in changes:
+                print(f"    {version}: {bc.description}")
+        print()
+
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
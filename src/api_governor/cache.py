@@ -0,0 +1,196 @@
+"""Persistent on-disk caches for parsed specs and results."""
+
+import hashlib
+import hmac
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+#: Environment variable holding the key that signs cache entries
+CACHE_KEY_ENV = "API_GOVERNOR_CACHE_KEY"
+
+#: Eviction frees space down to this fraction of ``max_bytes``
+_LOW_WATER = 0.9
+
+#: Temporary files older than this many seconds are left over from crashed writes
+_STALE_TMP_SECONDS = 3600
+
+_TAG_SIZE = hashlib.sha256().digest_size
+
+
+def content_hash(*parts: bytes | str) -> str:
+    """Hash one or more content parts into a hex digest cache key."""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode() if isinstance(part, str) else part
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def signing_key() -> bytes:
+    """Get the key that signs cache entries.
+
+    ``API_GOVERNOR_CACHE_KEY`` takes precedence, so CI jobs that share a cache
+    directory can share a secret. Otherwise a random per-user key is created
+    on first use in ``$XDG_CONFIG_HOME/api-governor/cache.key`` (default
+    ``~/.config``), readable only by the user.
+    """
+    secret = os.environ.get(CACHE_KEY_ENV)
+    if secret:
+        return secret.encode()
+
+    config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    path = Path(config_home) / "api-governor" / "cache.key"
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")  # Mode 0600
+    with os.fdopen(fd, "wb") as f:
+        f.write(os.urandom(32))
+    os.replace(tmp_name, path)
+    return path.read_bytes()
+
+
+class DiskCache:
+    """Size-bounded, process-safe key/value cache stored as files.
+
+    Entries are pickled to ``<directory>/<namespace>/<key>.pickle``, prefixed
+    with an HMAC-SHA256 tag of the key and payload. Entries whose tag does
+    not match (written with another key, or tampered with) are misses and are
+    never unpickled, so a cache directory restored from elsewhere cannot run
+    code. Writes go to a temporary file that is atomically renamed into
+    place, so parallel processes never observe partial entries.
+
+    Reads refresh the entry's mtime. The namespace size is scanned on the
+    first write and then tracked per instance; once it exceeds ``max_bytes``
+    the least recently used entries, and temporary files left by crashed
+    writes, are removed.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        namespace: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        key: bytes | None = None,
+    ):
+        """Initialize cache.
+
+        Args:
+            directory: Root cache directory
+            namespace: Subdirectory for this kind of entry
+            max_bytes: Maximum total size of entries in the namespace
+            key: Key signing the entries (default: :func:`signing_key`)
+        """
+        self.directory = Path(directory) / namespace
+        self.max_bytes = max_bytes
+        self._key = key if key is not None else signing_key()
+        self._size: int | None = None  # Estimated bytes in the namespace
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def _tag(self, key: str, payload: bytes) -> bytes:
+        return hmac.new(self._key, key.encode() + b"\0" + payload, hashlib.sha256).digest()
+
+    def get(self, key: str) -> Any | None:
+        """Get a cached value, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None  # Missing, or evicted by another process
+
+        payload = data[_TAG_SIZE:]
+        if not hmac.compare_digest(data[:_TAG_SIZE], self._tag(key, payload)):
+            # Unsigned, foreign or tampered entry: never unpickle it
+            self._unlink(path)
+            return None
+        try:
+            value = pickle.loads(payload)
+        except Exception:
+            # Incompatible entry; drop it and treat as a miss
+            self._unlink(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # Evicted by another process after we read it
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value, evicting least recently used entries if needed."""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._tag(key, payload))
+                f.write(payload)
+            os.replace(tmp_name, self._entry_path(key))
+        except BaseException:
+            self._unlink(Path(tmp_name))
+            raise
+
+        if self._size is None:
+            self._evict()
+        else:
+            self._size += _TAG_SIZE + len(payload)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Scan the namespace, evicting LRU entries and stale temporary files.
+
+        Evicts down to a low-water mark below ``max_bytes``, so the next scan
+        is not due on the very next write.
+        """
+        stale = time.time() - _STALE_TMP_SECONDS
+        for path in self.directory.glob("*.tmp"):
+            try:
+                if path.stat().st_mtime < stale:
+                    self._unlink(path)
+            except FileNotFoundError:
+                continue
+
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total > self.max_bytes:
+            entries.sort()
+            low_water = self.max_bytes * _LOW_WATER
+            for _mtime, size, path in entries:
+                if total <= low_water:
+                    break
+                self._unlink(path)
+                total -= size
+        self._size = total
+
+    def clear(self) -> None:
+        """Remove all entries in the namespace."""
+        for path in self.directory.glob("*.pickle"):
+            self._unlink(path)
+        self._size = 0
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
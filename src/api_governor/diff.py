@@ -1,32 +1,477 @@
 """OpenAPI spec differ for breaking change detection."""
 
-from .models import BreakingChange, PolicyConfig, Severity
-from .parser import OpenAPIParser
+from collections.abc import Sequence
+from itertools import pairwise
+from typing import Any, TypeGuard
+
+from .models import BreakingChange, PolicyConfig, Template, http_method
+from .parser import OpenAPIParser, refs_reach
+from .refs import RefResolver
+
+#: (change type, location relative to the compared schema root, detail), e.g.
+#: ("removed_field", ("address", "street"), "") or
+#: ("narrowed_enum", ("tags", "[]", "kind"), "'legacy'")
+SchemaChange = tuple[str, tuple[str, ...], str]
+
+_COMPONENT_SCHEMA_REF = "#/components/schemas/"
+
+#: Schema changes that break clients sending data (request bodies, parameters)
+_REQUEST_CHANGES = frozenset({"optional_to_required", "narrowed_enum", "narrowed_numeric_range"})
+
+#: Schema changes that break clients reading data (responses)
+_RESPONSE_CHANGES = frozenset({"removed_field", "required_to_optional"})
+
+# Breaking change text shared by every change of a type; args are (METHOD, path, ...)
+_OPERATION = Template("{0} {1}")
+_OPERATION_MEMBER = Template("{0} {1} -> {2}")
+_REMOVED_OPERATION = Template("Operation removed: {0} {1}")
+_REMOVED_PARAMETER = Template("Parameter removed: '{2}' from {0} {1}")
+_REMOVED_STATUS_CODE = Template("Response status code removed: {2} from {0} {1}")
+
+#: Policy key under ``breaking_change_detection.breaking_changes`` and default,
+#: per schema change type
+_SCHEMA_CHANGE_POLICY = {
+    "removed_field": ("removed_response_field", True),
+    "optional_to_required": ("optional_to_required_flip", True),
+    "required_to_optional": ("required_to_optional_flip", False),
+    "narrowed_enum": ("narrowed_enum", True),
+    "narrowed_numeric_range": ("narrowed_numeric_range", True),
+}
+
+
+def format_schema_location(location: tuple[str, ...]) -> str:
+    """Format a relative schema location as a dotted field path."""
+    return ".".join(location).replace(".[]", "[]")
+
+
+class SchemaComparator:
+    """Recursively compares baseline and current schemas for breaking changes.
+
+    Descends into ``properties`` and array ``items``, following ``$ref`` chains
+    on both sides. Results are memoized per (baseline, current) schema pair,
+    so a schema shared by many operations is compared once. Pairs already
+    being compared further up (recursive schemas) contribute no changes; a
+    pair whose comparison cut such a cycle depends on where the cycle was
+    entered, so it is only memoized as the root of a ``compare`` call.
+
+    Refs naming the same component schema on both sides are not followed:
+    component schemas are compared once under their own name.
+    """
+
+    def __init__(self, baseline: RefResolver, current: RefResolver):
+        """Initialize comparator.
+
+        Args:
+            baseline: Resolver for refs in the baseline spec
+            current: Resolver for refs in the current spec
+        """
+        self.baseline = baseline
+        self.current = current
+        self._results: dict[tuple[int, int], tuple[SchemaChange, ...]] = {}
+        # Results of pairs on or reaching a cycle, valid only as the root
+        self._root_results: dict[tuple[int, int], tuple[SchemaChange, ...]] = {}
+
+    def compare(
+        self,
+        baseline_schema: Any,
+        current_schema: Any,
+        baseline_resolver: RefResolver | None = None,
+        current_resolver: RefResolver | None = None,
+    ) -> tuple[SchemaChange, ...]:
+        """Compare two schemas.
+
+        Args:
+            baseline_schema: Baseline schema
+            current_schema: Current schema
+            baseline_resolver: Resolver of the document containing the baseline
+                schema (default: the baseline spec's)
+            current_resolver: Resolver of the document containing the current
+                schema (default: the current spec's)
+
+        Returns:
+            Changes, with locations relative to the compared schemas
+        """
+        pair = self._pair(
+            baseline_schema,
+            baseline_resolver or self.baseline,
+            current_schema,
+            current_resolver or self.current,
+        )
+        if pair is None:
+            return ()
+        result = self._results.get(pair[0])
+        if result is None:
+            result = self._root_results.get(pair[0])
+        if result is None:
+            result = self._compare_pair(pair)
+        return result
+
+    def _pair(
+        self,
+        baseline_schema: Any,
+        baseline_resolver: RefResolver,
+        current_schema: Any,
+        current_resolver: RefResolver,
+    ) -> tuple[tuple[int, int], Any, RefResolver, Any, RefResolver] | None:
+        """Resolve refs on both sides; None if there is nothing to compare."""
+        baseline_ref = _ref_of(baseline_schema)
+        if (
+            baseline_ref is not None
+            and baseline_ref.startswith(_COMPONENT_SCHEMA_REF)
+            and baseline_ref == _ref_of(current_schema)
+            and baseline_resolver is self.baseline
+            and current_resolver is self.current
+        ):
+            return None
+
+        baseline_schema, baseline_resolver = _deref(baseline_schema, baseline_resolver)
+        current_schema, current_resolver = _deref(current_schema, current_resolver)
+        if not isinstance(baseline_schema, dict) or not isinstance(current_schema, dict):
+            return None
+        key = (id(baseline_schema), id(current_schema))
+        return key, baseline_schema, baseline_resolver, current_schema, current_resolver
+
+    def _compare_pair(
+        self, root: tuple[tuple[int, int], Any, RefResolver, Any, RefResolver]
+    ) -> tuple[SchemaChange, ...]:
+        """Compare a resolved pair and its descendants without recursion."""
+        results = self._results
+        in_progress: set[tuple[int, int]] = set()
+        # Results that cut a cycle, with the in-progress pairs they cut at;
+        # reusable only while all of those pairs are still in progress
+        partial: dict[tuple[int, int], tuple[tuple[SchemaChange, ...], set[tuple[int, int]]]] = {}
+
+        def done(key: tuple[int, int]) -> bool:
+            if key in results or key in in_progress:
+                return True
+            entry = partial.get(key)
+            return entry is not None and entry[1] <= in_progress
+
+        # Frames: (pair key, local changes, children as (segment, pair key)), or
+        # a pair still to be expanded
+        stack: list[Any] = [root]
+        while stack:
+            frame = stack.pop()
+            if len(frame) == 3:
+                key, local, children = frame
+                changes = list(local)
+                cut: set[tuple[int, int]] = set()
+                for segment, child in children:
+                    child_changes = results.get(child)
+                    if child_changes is None:
+                        if child in in_progress:
+                            cut.add(child)
+                            continue
+                        child_changes, child_cut = partial[child]
+                        cut |= child_cut
+                    for change_type, location, detail in child_changes:
+                        changes.append((change_type, (segment, *location), detail))
+                cyclic = key in cut
+                cut.discard(key)
+                in_progress.discard(key)
+                if cut or cyclic:
+                    partial[key] = tuple(changes), cut
+                else:
+                    results[key] = tuple(changes)
+                continue
+
+            key, baseline_schema, baseline_resolver, current_schema, current_resolver = frame
+            if done(key):
+                continue
+            in_progress.add(key)
+
+            local_changes = _local_changes(baseline_schema, current_schema)
+            child_pairs = []
+            baseline_props = baseline_schema.get("properties")
+            current_props = current_schema.get("properties")
+            if isinstance(baseline_props, dict) and isinstance(current_props, dict):
+                for name, baseline_prop in baseline_props.items():
+                    if name in current_props:
+                        child_pairs.append(
+                            (
+                                str(name),
+                                self._pair(
+                                    baseline_prop,
+                                    baseline_resolver,
+                                    current_props[name],
+                                    current_resolver,
+                                ),
+                            )
+                        )
+            if "items" in baseline_schema and "items" in current_schema:
+                child_pairs.append(
+                    (
+                        "[]",
+                        self._pair(
+                            baseline_schema["items"],
+                            baseline_resolver,
+                            current_schema["items"],
+                            current_resolver,
+                        ),
+                    )
+                )
+
+            children = [(segment, pair[0]) for segment, pair in child_pairs if pair is not None]
+            stack.append((key, local_changes, children))
+            for _, pair in reversed(child_pairs):
+                if pair is not None and not done(pair[0]):
+                    stack.append(pair)
+
+        key = root[0]
+        if key in results:
+            return results[key]
+        # The root closed every cycle it cut, but its members were cut where
+        # this comparison entered them
+        result = self._root_results[key] = partial[key][0]
+        return result
+
+
+def _ref_of(schema: Any) -> str | None:
+    if isinstance(schema, dict):
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            return ref
+    return None
+
+
+def _deref(schema: Any, resolver: RefResolver) -> tuple[Any, RefResolver]:
+    """Follow a schema's (or other object's) $ref chain; unresolvable refs yield None."""
+    ref = _ref_of(schema)
+    if ref is None:
+        return schema, resolver
+    target = resolver.deref(ref)
+    if target.error is not None or not target.found:
+        return None, resolver
+    return target.value, target.source or resolver
+
+
+def _local_changes(
+    baseline_schema: dict[str, Any], current_schema: dict[str, Any]
+) -> list[SchemaChange]:
+    """Find breaking changes to one schema node, excluding its descendants."""
+    changes: list[SchemaChange] = []
+    baseline_props = baseline_schema.get("properties", {})
+    current_props = current_schema.get("properties", {})
+    if isinstance(baseline_props, dict) and isinstance(current_props, dict):
+        for prop in set(baseline_props.keys()) - set(current_props.keys()):
+            changes.append(("removed_field", (str(prop),), ""))
+
+        baseline_required = set(baseline_schema.get("required", []))
+        current_required = set(current_schema.get("required", []))
+        for prop in current_required - baseline_required:
+            if prop in baseline_props:
+                changes.append(("optional_to_required", (str(prop),), ""))
+        for prop in baseline_required - current_required:
+            if prop in current_props:
+                changes.append(("required_to_optional", (str(prop),), ""))
+
+    if "enum" in current_schema:
+        removed = _removed_enum_values(baseline_schema.get("enum"), current_schema["enum"])
+        if removed:
+            changes.append(("narrowed_enum", (), ", ".join(repr(value) for value in removed)))
+
+    for bound in (_lower_bound, _upper_bound):
+        narrowed = _narrowed_bound(bound(baseline_schema), bound(current_schema))
+        if narrowed:
+            changes.append(("narrowed_numeric_range", (), narrowed))
+    return changes
+
+
+def _removed_enum_values(baseline_enum: Any, current_enum: Any) -> list[Any]:
+    """Get baseline enum values no longer allowed; ``["*"]`` if an enum was added."""
+    if not isinstance(current_enum, list):
+        return []
+    if not isinstance(baseline_enum, list):
+        return ["*"]
+    try:
+        allowed = set(current_enum)
+    except TypeError:  # Unhashable (object/array) enum values
+        return [value for value in baseline_enum if value not in current_enum]
+    return [value for value in baseline_enum if value not in allowed]
+
+
+#: A bound as (limit, exclusive, keyword); None when unbounded
+_Bound = tuple[float, bool, str] | None
+
+
+def _is_number(value: Any) -> TypeGuard[float]:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _keyword(name: str, exclusive: bool) -> str:
+    return f"exclusive{name.capitalize()}" if exclusive else name
+
+
+def _lower_bound(schema: dict[str, Any]) -> _Bound:
+    """Get the tightest lower bound of a schema (OpenAPI 3.0 and 3.1 forms)."""
+    bounds: list[tuple[float, bool, str]] = []
+    minimum = schema.get("minimum")
+    exclusive = schema.get("exclusiveMinimum")
+    if _is_number(minimum):
+        bounds.append((minimum, exclusive is True, _keyword("minimum", exclusive is True)))
+    if _is_number(exclusive):
+        bounds.append((exclusive, True, "exclusiveMinimum"))
+    return max(bounds, key=lambda bound: (bound[0], bound[1])) if bounds else None
+
+
+def _upper_bound(schema: dict[str, Any]) -> _Bound:
+    """Get the tightest upper bound of a schema (OpenAPI 3.0 and 3.1 forms)."""
+    bounds: list[tuple[float, bool, str]] = []
+    maximum = schema.get("maximum")
+    exclusive = schema.get("exclusiveMaximum")
+    if _is_number(maximum):
+        bounds.append((maximum, exclusive is True, _keyword("maximum", exclusive is True)))
+    if _is_number(exclusive):
+        bounds.append((exclusive, True, "exclusiveMaximum"))
+    return max(bounds, key=lambda bound: (-bound[0], bound[1])) if bounds else None
+
+
+def _narrowed_bound(baseline: _Bound, current: _Bound) -> str:
+    """Describe how a bound was tightened, or return "" if it was not."""
+    if current is None:
+        return ""
+    limit, exclusive, keyword = current
+    if baseline is not None:
+        baseline_limit, baseline_exclusive, baseline_keyword = baseline
+        if keyword.endswith("inimum"):
+            tighter = limit > baseline_limit
+        else:
+            tighter = limit < baseline_limit
+        if not tighter and not (limit == baseline_limit and exclusive and not baseline_exclusive):
+            return ""
+        return f"{baseline_keyword} {baseline_limit} -> {keyword} {limit}"
+    return f"{keyword} {limit} added"
 
 
 class SpecDiffer:
-    """Detects breaking changes between OpenAPI spec versions."""
+    """Detects breaking changes between OpenAPI spec versions.
+
+    Checks only descend into operations and component schemas whose
+    structural hashes differ between the two specs, and into operations that
+    refer to a changed parameter, request body, response or other component
+    (or to another document); other subtrees cannot contain breaking changes
+    and are skipped.
+    """
 
     def __init__(self, policy: PolicyConfig):
         """Initialize with policy configuration."""
         self.policy = policy
-
-    def diff(self, baseline: OpenAPIParser, current: OpenAPIParser) -> list[BreakingChange]:
-        """Find breaking changes between baseline and current spec."""
+        self.plan = policy.plan.breaking_changes
+        self._schema_change_types = frozenset(
+            change_type
+            for change_type, (check, default) in _SCHEMA_CHANGE_POLICY.items()
+            if self.plan.detects(check, default)
+        )
+        # Indexes shared by the checks of the current diff() call
+        self._changed_ops: list[tuple[str, str, dict[str, Any], dict[str, Any]]] | None = None
+        self._schema_comparator: SchemaComparator | None = None
+
+    def diff(
+        self, baseline: OpenAPIParser, current: OpenAPIParser, stop_at_first: bool = False
+    ) -> list[BreakingChange]:
+        """Find breaking changes between baseline and current spec.
+
+        Args:
+            baseline: Baseline spec
+            current: Current spec
+            stop_at_first: Run the cheapest checks first and return the
+                changes of the first check that finds any (fail-fast mode)
+        """
         changes: list[BreakingChange] = []
+        self._changed_ops = None
+        self._schema_comparator = None
+        if not self.plan.enabled:
+            return changes
 
-        if self.policy.get("breaking_change_detection.enabled", True):
-            changes.extend(self._check_removed_operations(baseline, current))
-            changes.extend(self._check_removed_parameters(baseline, current))
-            changes.extend(self._check_response_changes(baseline, current))
-            changes.extend(self._check_schema_changes(baseline, current))
+        checks = [
+            self._check_removed_operations,
+            self._check_removed_parameters,
+            self._check_response_changes,
+            self._check_schema_changes,
+            self._check_operation_schema_changes,
+            self._check_auth_changes,
+        ]
+        if stop_at_first:
+            # Schema comparisons recurse through every changed schema: move them last
+            checks.insert(3, checks.pop())
+        for check in checks:
+            changes.extend(check(baseline, current))
+            if stop_at_first and changes:
+                break
 
         return changes
 
-    def _get_default_severity(self) -> Severity:
-        """Get default severity for breaking changes."""
-        level = self.policy.get("breaking_change_detection.default_breaking_severity", "MAJOR")
-        return Severity[level]
+    def diff_history(self, versions: Sequence[OpenAPIParser]) -> list[list[BreakingChange]]:
+        """Find breaking changes between each adjacent pair of an ordered release chain.
+
+        Each parser serves as current version of one diff and baseline of the
+        next, so every version is parsed and hashed once.
+
+        Args:
+            versions: Parsers for the chain, oldest first
+
+        Returns:
+            One list of breaking changes per adjacent pair, in chain order
+        """
+        return [self.diff(baseline, current) for baseline, current in pairwise(versions)]
+
+    def _changed_operations(
+        self, baseline: OpenAPIParser, current: OpenAPIParser
+    ) -> list[tuple[str, str, dict[str, Any], dict[str, Any]]]:
+        """Get operations present in both specs whose content differs, in baseline order."""
+        if self._changed_ops is None:
+            self._changed_ops = self._find_changed_operations(baseline, current)
+        return self._changed_ops
+
+    @staticmethod
+    def _find_changed_operations(
+        baseline: OpenAPIParser, current: OpenAPIParser
+    ) -> list[tuple[str, str, dict[str, Any], dict[str, Any]]]:
+        baseline_hashes = baseline.hashes
+        current_hashes = current.hashes
+        # Operations with equal text still change through refs to changed components
+        changed_components = baseline_hashes.changed_components(current_hashes)
+        operation_refs = baseline_hashes.operation_refs
+        if baseline_hashes.paths == current_hashes.paths and not operation_refs:
+            return []
+
+        current_ops = current.operation_index.by_key
+        changed = []
+        for path, methods in baseline.operation_index.by_path.items():
+            same_path = baseline_hashes.path_items.get(path) == current_hashes.path_items.get(path)
+            for method, baseline_op in methods:
+                key = (path, method)
+                if same_path and key not in operation_refs:
+                    continue
+                current_op = current_ops.get(key)
+                if current_op is None:
+                    continue
+                if (
+                    same_path
+                    or baseline_hashes.operations.get(key) == current_hashes.operations.get(key)
+                ) and not refs_reach(operation_refs.get(key, ()), changed_components):
+                    continue
+                changed.append((path, method, baseline_op, current_op))
+        return changed
+
+    @staticmethod
+    def _changed_schemas(
+        baseline: OpenAPIParser, current: OpenAPIParser
+    ) -> list[tuple[str, Any, Any]]:
+        """Get component schemas present in both specs whose content differs."""
+        baseline_hashes = baseline.hashes
+        current_hashes = current.hashes
+        if baseline_hashes.schemas == current_hashes.schemas:
+            return []
+
+        current_schemas = current.components.get("schemas", {})
+        changed = []
+        for name, baseline_schema in baseline.components.get("schemas", {}).items():
+            if name not in current_schemas:
+                continue
+            if baseline_hashes.schema_items.get(name) != current_hashes.schema_items.get(name):
+                changed.append((name, baseline_schema, current_schemas[name]))
+        return changed
 
     def _check_removed_operations(
         self, baseline: OpenAPIParser, current: OpenAPIParser
@@ -34,23 +479,19 @@ class SpecDiffer:
         """Check for removed operations."""
         changes: list[BreakingChange] = []
 
-        if not self.policy.get(
-            "breaking_change_detection.breaking_changes.removed_operation", True
-        ):
+        if not self.plan.detects("removed_operation"):
             return changes
 
-        baseline_ops = {(p, m) for p, m, _ in baseline.get_operations()}
-        current_ops = {(p, m) for p, m, _ in current.get_operations()}
-
-        removed = baseline_ops - current_ops
+        removed = baseline.operation_index.operation_keys - current.operation_index.operation_keys
         for path, method in removed:
             changes.append(
                 BreakingChange(
                     change_type="removed_operation",
-                    path=f"{method.upper()} {path}",
-                    description=f"Operation removed: {method.upper()} {path}",
+                    path=_OPERATION,
+                    description=_REMOVED_OPERATION,
                     client_impact="Clients calling this endpoint will receive 404 errors",
-                    severity=self._get_default_severity(),
+                    severity=self.plan.severity,
+                    args=(http_method(method), path),
                 )
             )
 
@@ -62,19 +503,10 @@ class SpecDiffer:
         """Check for removed or renamed parameters."""
         changes: list[BreakingChange] = []
 
-        if not self.policy.get(
-            "breaking_change_detection.breaking_changes.removed_parameter", True
-        ):
+        if not self.plan.detects("removed_parameter"):
             return changes
 
-        baseline_ops = {(p, m): op for p, m, op in baseline.get_operations()}
-        current_ops = {(p, m): op for p, m, op in current.get_operations()}
-
-        for (path, method), baseline_op in baseline_ops.items():
-            if (path, method) not in current_ops:
-                continue
-
-            current_op = current_ops[(path, method)]
+        for path, method, baseline_op, current_op in self._changed_operations(baseline, current):
             baseline_params = {p.get("name"): p for p in baseline_op.get("parameters", [])}
             current_params = {p.get("name"): p for p in current_op.get("parameters", [])}
 
@@ -83,10 +515,11 @@ class SpecDiffer:
                 changes.append(
                     BreakingChange(
                         change_type="removed_parameter",
-                        path=f"{method.upper()} {path} -> {param_name}",
-                        description=f"Parameter removed: '{param_name}' from {method.upper()} {path}",
+                        path=_OPERATION_MEMBER,
+                        description=_REMOVED_PARAMETER,
                         client_impact="Clients sending this parameter will have it ignored or may receive errors",
-                        severity=self._get_default_severity(),
+                        severity=self.plan.severity,
+                        args=(http_method(method), path, param_name),
                     )
                 )
 
@@ -98,30 +531,22 @@ class SpecDiffer:
         """Check for breaking response changes."""
         changes: list[BreakingChange] = []
 
-        baseline_ops = {(p, m): op for p, m, op in baseline.get_operations()}
-        current_ops = {(p, m): op for p, m, op in current.get_operations()}
-
-        for (path, method), baseline_op in baseline_ops.items():
-            if (path, method) not in current_ops:
-                continue
-
-            current_op = current_ops[(path, method)]
+        for path, method, baseline_op, current_op in self._changed_operations(baseline, current):
             baseline_responses = baseline_op.get("responses", {})
             current_responses = current_op.get("responses", {})
 
             # Check for removed status codes
-            if self.policy.get(
-                "breaking_change_detection.breaking_changes.status_code_removed", True
-            ):
+            if self.plan.detects("status_code_removed"):
                 removed_codes = set(baseline_responses.keys()) - set(current_responses.keys())
                 for code in removed_codes:
                     changes.append(
                         BreakingChange(
                             change_type="removed_status_code",
-                            path=f"{method.upper()} {path} -> {code}",
-                            description=f"Response status code removed: {code} from {method.upper()} {path}",
+                            path=_OPERATION_MEMBER,
+                            description=_REMOVED_STATUS_CODE,
                             client_impact="Clients handling this status code may not handle the new response correctly",
-                            severity=self._get_default_severity(),
+                            severity=self.plan.severity,
+                            args=(http_method(method), path, code),
                         )
                     )
 
@@ -130,55 +555,297 @@ class SpecDiffer:
     def _check_schema_changes(
         self, baseline: OpenAPIParser, current: OpenAPIParser
     ) -> list[BreakingChange]:
-        """Check for breaking schema changes."""
+        """Check for breaking changes in component schemas, including nested fields."""
         changes: list[BreakingChange] = []
+        enabled = self._schema_change_types
+        if not enabled:
+            return changes
 
-        baseline_schemas = baseline.components.get("schemas", {})
-        current_schemas = current.components.get("schemas", {})
+        comparator = self._comparator(baseline, current)
+        for schema_name, baseline_schema, current_schema in self._changed_schemas(
+            baseline, current
+        ):
+            for change in comparator.compare(baseline_schema, current_schema):
+                if change[0] in enabled:
+                    changes.append(
+                        self._schema_change(
+                            change,
+                            path=f"schemas.{schema_name}",
+                            subject=f"schema '{schema_name}'",
+                        )
+                    )
 
-        for schema_name, baseline_schema in baseline_schemas.items():
-            if schema_name not in current_schemas:
-                continue
+        return changes
 
-            current_schema = current_schemas[schema_name]
+    def _check_operation_schema_changes(
+        self, baseline: OpenAPIParser, current: OpenAPIParser
+    ) -> list[BreakingChange]:
+        """Check parameter, request body and response schemas of changed operations.
 
-            # Check for removed fields
-            if self.policy.get(
-                "breaking_change_detection.breaking_changes.removed_response_field", True
-            ):
-                baseline_props = set(baseline_schema.get("properties", {}).keys())
-                current_props = set(current_schema.get("properties", {}).keys())
+        Changes that restrict what clients may send are reported for parameters
+        and request bodies; changes to what clients receive, for responses.
+        """
+        changes: list[BreakingChange] = []
+        enabled = self._schema_change_types
+        request_changes = enabled & _REQUEST_CHANGES
+        response_changes = enabled & _RESPONSE_CHANGES
+        if not enabled:
+            return changes
 
-                removed_props = baseline_props - current_props
-                for prop in removed_props:
-                    changes.append(
-                        BreakingChange(
-                            change_type="removed_field",
-                            path=f"schemas.{schema_name}.{prop}",
-                            description=f"Field removed: '{prop}' from schema '{schema_name}'",
-                            client_impact="Clients expecting this field will receive null/undefined or fail parsing",
-                            severity=self._get_default_severity(),
-                        )
-                    )
+        comparator = self._comparator(baseline, current)
+        baseline_resolver = baseline.ref_resolver
+        current_resolver = current.ref_resolver
+        for path, method, baseline_op, current_op in self._changed_operations(baseline, current):
+            operation = f"{method.upper()} {path}"
+
+            if request_changes:
+                current_params = _parameters_by_key(current_op, current_resolver)
+                for key, baseline_param in _parameters_by_key(
+                    baseline_op, baseline_resolver
+                ).items():
+                    current_param = current_params.get(key)
+                    if current_param is None:
+                        continue
+                    for change in comparator.compare(
+                        baseline_param.get("schema"), current_param.get("schema")
+                    ):
+                        if change[0] in request_changes:
+                            changes.append(
+                                self._schema_change(
+                                    change,
+                                    path=f"{operation} -> {key[0]}",
+                                    subject=f"{key[1]} parameter '{key[0]}' of {operation}",
+                                )
+                            )
 
-            # Check for optional-to-required flips
-            if self.policy.get(
-                "breaking_change_detection.breaking_changes.optional_to_required_flip", True
-            ):
-                baseline_required = set(baseline_schema.get("required", []))
-                current_required = set(current_schema.get("required", []))
-
-                new_required = current_required - baseline_required
-                for prop in new_required:
-                    if prop in baseline_schema.get("properties", {}):
-                        changes.append(
-                            BreakingChange(
-                                change_type="optional_to_required",
-                                path=f"schemas.{schema_name}.{prop}",
-                                description=f"Field changed from optional to required: '{prop}' in '{schema_name}'",
-                                client_impact="Clients not providing this field will receive validation errors",
-                                severity=self._get_default_severity(),
+                for media_type, *schemas in _body_schemas(
+                    baseline_op.get("requestBody"),
+                    baseline_resolver,
+                    current_op.get("requestBody"),
+                    current_resolver,
+                ):
+                    for change in comparator.compare(*schemas):
+                        if change[0] in request_changes:
+                            changes.append(
+                                self._schema_change(
+                                    change,
+                                    path=f"{operation} -> requestBody",
+                                    subject=f"{media_type} request body of {operation}",
+                                )
                             )
-                        )
+
+            if response_changes:
+                baseline_responses = baseline_op.get("responses", {})
+                current_responses = current_op.get("responses", {})
+                for code, baseline_response in baseline_responses.items():
+                    if code not in current_responses:
+                        continue
+                    for media_type, *schemas in _body_schemas(
+                        baseline_response,
+                        baseline_resolver,
+                        current_responses[code],
+                        current_resolver,
+                    ):
+                        for change in comparator.compare(*schemas):
+                            if change[0] in response_changes:
+                                changes.append(
+                                    self._schema_change(
+                                        change,
+                                        path=f"{operation} -> {code}",
+                                        subject=f"{media_type} {code} response of {operation}",
+                                    )
+                                )
 
         return changes
+
+    def _check_auth_changes(
+        self, baseline: OpenAPIParser, current: OpenAPIParser
+    ) -> list[BreakingChange]:
+        """Check for operations that no longer accept a baseline security requirement."""
+        changes: list[BreakingChange] = []
+
+        if not self.plan.detects("auth_requirement_change"):
+            return changes
+
+        baseline_global = _normalize_security(baseline.security)
+        current_global = _normalize_security(current.security)
+        if baseline_global == current_global:
+            # Only operations whose own content changed can differ
+            operations = self._changed_operations(baseline, current)
+        else:
+            current_ops = current.operation_index.by_key
+            operations = [
+                (path, method, baseline_op, current_ops[(path, method)])
+                for (path, method), baseline_op in baseline.operation_index.by_key.items()
+                if (path, method) in current_ops
+            ]
+
+        for path, method, baseline_op, current_op in operations:
+            baseline_security = (
+                _normalize_security(baseline_op["security"])
+                if "security" in baseline_op
+                else baseline_global
+            )
+            current_security = (
+                _normalize_security(current_op["security"])
+                if "security" in current_op
+                else current_global
+            )
+            if baseline_security == current_security:
+                continue
+            removed = [
+                requirement
+                for requirement in baseline_security
+                if not _accepts(current_security, requirement)
+            ]
+            if not removed:
+                continue
+            operation = f"{method.upper()} {path}"
+            changes.append(
+                BreakingChange(
+                    change_type="auth_requirement_change",
+                    path=operation,
+                    description=(
+                        f"Security requirements changed on {operation}: no longer accepts "
+                        + "; ".join(sorted(_format_requirement(req) for req in removed))
+                    ),
+                    client_impact="Clients authenticating with the removed schemes or scopes will receive 401/403 errors",
+                    severity=self.plan.severity,
+                )
+            )
+
+        return changes
+
+    def _comparator(self, baseline: OpenAPIParser, current: OpenAPIParser) -> SchemaComparator:
+        """Get the schema comparator shared by all checks of one diff."""
+        if self._schema_comparator is None:
+            self._schema_comparator = SchemaComparator(baseline.ref_resolver, current.ref_resolver)
+        return self._schema_comparator
+
+    def _schema_change(self, change: SchemaChange, path: str, subject: str) -> BreakingChange:
+        """Build a breaking change for a schema change found by the comparator."""
+        change_type, location, detail = change
+        field = format_schema_location(location)
+        full_path = f"{path}.{field}" if field else path
+        target = f"'{field}' in {subject}" if field else subject
+
+        if change_type == "removed_field":
+            description = f"Field removed: '{field}' from {subject}"
+            impact = "Clients expecting this field will receive null/undefined or fail parsing"
+        elif change_type == "optional_to_required":
+            description = f"Field changed from optional to required: {target}"
+            impact = "Clients not providing this field will receive validation errors"
+        elif change_type == "required_to_optional":
+            description = f"Field changed from required to optional: {target}"
+            impact = "Clients assuming this field is always present may fail when it is omitted"
+        elif change_type == "narrowed_enum":
+            description = f"Enum values no longer allowed in {target}: {detail}"
+            impact = "Clients sending the removed values will receive validation errors"
+        else:
+            description = f"Allowed range narrowed for {target}: {detail}"
+            impact = "Clients sending values outside the new range will receive validation errors"
+
+        return BreakingChange(
+            change_type=change_type,
+            path=full_path,
+            description=description,
+            client_impact=impact,
+            severity=self.plan.severity,
+        )
+
+
+def _parameters_by_key(
+    operation: dict[str, Any], resolver: RefResolver
+) -> dict[tuple[Any, Any], dict[str, Any]]:
+    """Index an operation's parameters by (name, location), resolving $refs."""
+    parameters: dict[tuple[Any, Any], dict[str, Any]] = {}
+    for parameter in operation.get("parameters", []):
+        ref = _ref_of(parameter)
+        if ref is not None:
+            target = resolver.deref(ref)
+            parameter = target.value if target.found else None
+        if isinstance(parameter, dict):
+            parameters[(parameter.get("name"), parameter.get("in"))] = parameter
+    return parameters
+
+
+#: One security requirement alternative: the (scheme, scopes) pairs it requires
+_Requirement = frozenset[tuple[str, frozenset[str]]]
+
+
+def _normalize_security(requirements: Any) -> frozenset[_Requirement]:
+    """Normalize security requirements to a set of alternatives.
+
+    Each alternative is the set of (scheme, scopes) it requires; an empty
+    alternative means anonymous access is allowed.
+    """
+    if not isinstance(requirements, list) or not requirements:
+        return frozenset({frozenset()})
+    alternatives = set()
+    for requirement in requirements:
+        if isinstance(requirement, dict):
+            alternatives.add(
+                frozenset(
+                    (str(scheme), frozenset(map(str, scopes or ())))
+                    for scheme, scopes in requirement.items()
+                )
+            )
+    return frozenset(alternatives)
+
+
+def _accepts(alternatives: frozenset[_Requirement], credentials: _Requirement) -> bool:
+    """Whether a client satisfying one requirement satisfies some alternative."""
+    held = dict(credentials)
+    return any(
+        all(scheme in held and scopes <= held[scheme] for scheme, scopes in alternative)
+        for alternative in alternatives
+    )
+
+
+def _format_requirement(requirement: _Requirement) -> str:
+    if not requirement:
+        return "anonymous access"
+    return " + ".join(
+        f"{scheme} [{', '.join(sorted(scopes))}]" if scopes else scheme
+        for scheme, scopes in sorted(requirement)
+    )
+
+
+def _body_schemas(
+    baseline: Any,
+    baseline_resolver: RefResolver,
+    current: Any,
+    current_resolver: RefResolver,
+) -> list[tuple[str, Any, Any, RefResolver, RefResolver]]:
+    """Pair the schemas of media types present in both request bodies or responses.
+
+    Request bodies and responses given as ``$ref`` are resolved first.
+
+    Returns:
+        (media type, baseline schema, current schema, baseline resolver,
+        current resolver) tuples; the resolvers are those of the documents
+        containing the schemas
+    """
+    baseline, baseline_resolver = _deref(baseline, baseline_resolver)
+    current, current_resolver = _deref(current, current_resolver)
+    if not isinstance(baseline, dict) or not isinstance(current, dict):
+        return []
+    baseline_content = baseline.get("content")
+    current_content = current.get("content")
+    if not isinstance(baseline_content, dict) or not isinstance(current_content, dict):
+        return []
+    pairs = []
+    for media_type, baseline_media in baseline_content.items():
+        current_media = current_content.get(media_type)
+        if isinstance(baseline_media, dict) and isinstance(current_media, dict):
+            if "schema" in baseline_media and "schema" in current_media:
+                pairs.append(
+                    (
+                        media_type,
+                        baseline_media["schema"],
+                        current_media["schema"],
+                        baseline_resolver,
+                        current_resolver,
+                    )
+                )
+    return pairs
@@ -0,0 +1,195 @@
+"""Executors running independent rules against one parsed spec."""
+
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, TypeVar
+
+from .models import Finding, Timing
+from .parser import OpenAPIParser
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class RuleTask:
+    """One rule or plugin evaluation, runnable on any executor."""
+
+    name: str
+    function: Callable[[OpenAPIParser, Any], list[Finding]]  # Module-level, picklable
+    argument: Any
+
+    def __call__(self, spec: OpenAPIParser) -> list[Finding]:
+        """Evaluate the rule against a spec."""
+        return self.function(spec, self.argument)
+
+
+class RuleExecutor(ABC):
+    """Runs a task once per item against a shared, read-only parsed spec.
+
+    Results are returned in item order whatever the execution order, so
+    findings merge deterministically in rule order.
+    """
+
+    #: Whether tasks run concurrently; serial executors keep the single-pass
+    #: traversal shared by all rules.
+    parallel: bool = True
+
+    @abstractmethod
+    def map(
+        self, task: Callable[[OpenAPIParser, T], R], spec: OpenAPIParser, items: Sequence[T]
+    ) -> list[R]:
+        """Run ``task(spec, item)`` for every item.
+
+        Args:
+            task: Module-level function (process executors pickle it by name)
+            spec: Parsed spec shared by all tasks; tasks must not modify it
+            items: Task arguments, e.g. one rule per item
+
+        Returns:
+            Task results, in item order
+        """
+
+
+class SerialExecutor(RuleExecutor):
+    """Runs tasks one after another in the calling thread."""
+
+    parallel = False
+
+    def map(
+        self, task: Callable[[OpenAPIParser, T], R], spec: OpenAPIParser, items: Sequence[T]
+    ) -> list[R]:
+        return [task(spec, item) for item in items]
+
+
+class ThreadExecutor(RuleExecutor):
+    """Runs tasks in a thread pool.
+
+    Helps rules that release the GIL (I/O, C extensions); pure-Python rules
+    still run one at a time.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        """Initialize executor.
+
+        Args:
+            max_workers: Maximum threads (default: ThreadPoolExecutor's default)
+        """
+        self.max_workers = max_workers
+
+    def map(
+        self, task: Callable[[OpenAPIParser, T], R], spec: OpenAPIParser, items: Sequence[T]
+    ) -> list[R]:
+        if len(items) <= 1:
+            return [task(spec, item) for item in items]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(partial(task, spec), items))
+
+
+class ProcessExecutor(RuleExecutor):
+    """Runs tasks in a process pool, one pool per call.
+
+    The spec is handed to each worker once when it starts (inherited without
+    copying where processes fork), not once per task. Tasks, items and
+    results must be picklable.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        """Initialize executor.
+
+        Args:
+            max_workers: Maximum worker processes (default: CPU count)
+        """
+        self.max_workers = max_workers
+
+    def map(
+        self, task: Callable[[OpenAPIParser, T], R], spec: OpenAPIParser, items: Sequence[T]
+    ) -> list[R]:
+        if len(items) <= 1:
+            return [task(spec, item) for item in items]
+        workers = min(self.max_workers or len(items), len(items))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_share_spec, initargs=(spec,)
+        ) as pool:
+            return list(pool.map(partial(_run_with_shared_spec, task), items))
+
+
+def run_tasks(
+    executor: RuleExecutor, spec: OpenAPIParser, tasks: Sequence[RuleTask]
+) -> list[Finding]:
+    """Run rule tasks on an executor and merge their findings in task order."""
+    results = executor.map(_run_task, spec, tasks)
+    return [finding for findings in results for finding in findings]
+
+
+def run_timed_tasks(
+    executor: RuleExecutor, spec: OpenAPIParser, tasks: Sequence[RuleTask]
+) -> tuple[list[Finding], list[Timing]]:
+    """Run rule tasks like :func:`run_tasks`, timing each task.
+
+    CPU time is that of the thread running the task, so it stays per task
+    on thread executors.
+
+    Returns:
+        Findings in task order, and one Timing per task
+    """
+    results = executor.map(_run_timed_task, spec, tasks)
+    findings = [finding for task_findings, _ in results for finding in task_findings]
+    return findings, [timing for _, timing in results]
+
+
+def _run_task(spec: OpenAPIParser, task: RuleTask) -> list[Finding]:
+    return task(spec)
+
+
+def _run_timed_task(spec: OpenAPIParser, task: RuleTask) -> tuple[list[Finding], Timing]:
+    wall, cpu = time.perf_counter(), time.thread_time()
+    findings = task(spec)
+    timing = Timing(
+        task.name,
+        wall_ms=(time.perf_counter() - wall) * 1000,
+        cpu_ms=(time.thread_time() - cpu) * 1000,
+        findings=len(findings),
+    )
+    return findings, timing
+
+
+EXECUTOR_KINDS = ("serial", "thread", "process")
+
+
+def create_executor(kind: str, max_workers: int | None = None) -> RuleExecutor:
+    """Create an executor by name.
+
+    Args:
+        kind: One of ``EXECUTOR_KINDS``
+        max_workers: Maximum threads or processes (ignored for "serial")
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if kind == "serial":
+        return SerialExecutor()
+    if kind == "thread":
+        return ThreadExecutor(max_workers)
+    if kind == "process":
+        return ProcessExecutor(max_workers)
+    expected = ", ".join(EXECUTOR_KINDS)
+    raise ValueError(f"Unknown rule executor: {kind} (expected one of {expected})")
+
+
+# Per-process spec for process executor workers, set once by the pool initializer
+_shared_spec: dict[str, Any] = {}
+
+
+def _share_spec(spec: OpenAPIParser) -> None:
+    """Store the spec shared by all tasks in a worker process."""
+    _shared_spec["spec"] = spec
+
+
+def _run_with_shared_spec(task: Callable[[OpenAPIParser, T], R], item: T) -> R:
+    """Run one task in a worker process against the shared spec."""
+    return task(_shared_spec["spec"], item)
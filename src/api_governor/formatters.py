@@ -32,7 +32,7 @@ class JSONFormatter:
         Returns:
             Dictionary representation
         """
-        return {
+        data: dict[str, Any] = {
             "version": "1.0",
             "spec_path": self.result.spec_path,
             "policy_name": self.result.policy_name,
@@ -49,6 +49,13 @@ class JSONFormatter:
             "breaking_changes": [bc.to_dict() for bc in self.result.breaking_changes],
             "checklist": self.result.checklist,
         }
+        if self.result.cache_status is not None:
+            data["cache"] = self.result.cache_status
+        if self.result.partial:
+            data["partial"] = True
+        if self.result.profile is not None:
+            data["profile"] = self.result.profile.to_dict()
+        return data
 
     def write(self, output_dir: Path) -> Path:
         """Write JSON to file.
@@ -101,7 +108,7 @@ class SARIFFormatter:
 
     def _create_run(self) -> dict[str, Any]:
         """Create a SARIF run object."""
-        return {
+        run: dict[str, Any] = {
             "tool": {
                 "driver": {
                     "name": "API Governor",
@@ -118,6 +125,9 @@ class SARIFFormatter:
                 }
             ],
         }
+        if self.result.profile is not None:
+            run["properties"] = {"profile": self.result.profile.to_dict()}
+        return run
 
     def _create_rules(self) -> list[dict[str, Any]]:
         """Create SARIF rule definitions from findings."""
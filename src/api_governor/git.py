@@ -0,0 +1,70 @@
+"""Reading spec versions straight from a git repository."""
+
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+
+class GitError(Exception):
+    """Raised when a file cannot be read from a git revision."""
+
+
+def _git(cwd: Path, *args: str) -> bytes:
+    """Run a git command and return its stdout."""
+    try:
+        completed = subprocess.run(["git", "-C", str(cwd), *args], capture_output=True, check=False)
+    except FileNotFoundError as e:
+        raise GitError("git executable not found") from e
+    if completed.returncode != 0:
+        message = completed.stderr.decode(errors="replace").strip()
+        raise GitError(message or f"git {' '.join(args)} failed")
+    return completed.stdout
+
+
+@dataclass(frozen=True)
+class GitBlob:
+    """A file as stored at a git revision.
+
+    The blob SHA identifies the content exactly, so it can key caches
+    without reading the content.
+    """
+
+    repo: Path  # Repository top-level directory
+    rev: str
+    path: str  # Repository-relative POSIX path
+    sha: str  # Blob object id
+
+    @classmethod
+    def resolve(cls, rev: str, path: str | Path) -> "GitBlob":
+        """Find the blob of a working-tree file at a revision.
+
+        Args:
+            rev: Any revision git understands, e.g. ``origin/main`` or a tag
+            path: Path of the file in the working tree; its location in the
+                revision is taken relative to the repository root
+
+        Raises:
+            GitError: If the path is not in a repository or not in the revision
+        """
+        path = Path(path).resolve()
+        repo = Path(_git(path.parent, "rev-parse", "--show-toplevel").decode().strip())
+        try:
+            relative = path.relative_to(repo.resolve()).as_posix()
+        except ValueError as e:
+            raise GitError(f"{path} is not inside repository {repo}") from e
+        entry = _git(repo, "ls-tree", "-z", rev, "--", relative).split(b"\t", 1)[0].split()
+        if len(entry) != 3 or entry[1] != b"blob":
+            raise GitError(f"{relative} not found at revision {rev}")
+        return cls(repo=repo, rev=rev, path=relative, sha=entry[2].decode())
+
+    @property
+    def worktree_path(self) -> Path:
+        """Get the file's location in the working tree (relative refs resolve from here)."""
+        return self.repo / self.path
+
+    def read(self) -> bytes:
+        """Read the blob content from the object store."""
+        return _git(self.repo, "cat-file", "blob", self.sha)
+
+    def __str__(self) -> str:
+        return f"{self.rev}:{self.path}"
@@ -1,13 +1,32 @@
 """Main API Governor orchestrator."""
 
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import pairwise
 from pathlib import Path
+from typing import Any
 
-import yaml
-
+from . import __version__
+from .cache import DiskCache, content_hash
 from .diff import SpecDiffer
-from .models import Finding, GovernanceResult, PolicyConfig, Severity
+from .executors import RuleExecutor, SerialExecutor, run_tasks
+from .git import GitBlob
+from .models import (
+    BatchResult,
+    BreakingChange,
+    Finding,
+    GovernanceResult,
+    HistoryResult,
+    PolicyConfig,
+    Severity,
+    VersionDiff,
+)
 from .output import OutputGenerator
-from .parser import OpenAPIParseError, OpenAPIParser
+from .parser import OpenAPIParseError, OpenAPIParser, load_yaml
+from .plugins import PluginManager
+from .policy import validate_policy
+from .profiling import Profiler
 from .rules import RuleEngine
 
 
@@ -20,6 +39,12 @@ class APIGovernor:
         policy_path: str | Path | None = None,
         baseline_path: str | Path | None = None,
         output_dir: str | Path = "governance",
+        cache_dir: str | Path | None = None,
+        plugins: PluginManager | None = None,
+        baseline_rev: str | None = None,
+        rule_executor: RuleExecutor | None = None,
+        profile: bool = False,
+        profile_trace: str | Path | None = None,
     ):
         """Initialize API Governor.
 
@@ -28,57 +53,360 @@ class APIGovernor:
             policy_path: Path to policy YAML file (optional, uses default)
             baseline_path: Path to baseline spec for breaking change detection
             output_dir: Directory for output artifacts
+            cache_dir: Directory for persistent parsed-spec and result caches (optional)
+            plugins: Plugin manager whose rules run after the built-in rules (optional)
+            baseline_rev: Git revision to read the baseline from (optional); the
+                file read is ``baseline_path`` if given, else ``spec_path``
+            rule_executor: Executor running rules and plugins as parallel tasks
+                (optional; by default they run in the calling thread)
+            profile: Record wall time, CPU time and finding counts per phase
+                and per rule or plugin in ``result.profile``
+            profile_trace: Path to dump cProfile stats of the slowest rule or
+                plugin to (optional; implies ``profile``)
         """
         self.spec_path = Path(spec_path)
         self.policy_path = Path(policy_path) if policy_path else self._get_default_policy()
         self.baseline_path = Path(baseline_path) if baseline_path else None
         self.output_dir = Path(output_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.plugins = plugins
+        self.baseline_rev = baseline_rev
+        self.rule_executor = rule_executor
+        self.profile_trace = Path(profile_trace) if profile_trace else None
+        self.profile = profile or self.profile_trace is not None
+        self._spec_cache = DiskCache(self.cache_dir, "specs") if self.cache_dir else None
+        self._result_cache = DiskCache(self.cache_dir, "results") if self.cache_dir else None
 
         self._policy: PolicyConfig | None = None
         self._parser: OpenAPIParser | None = None
         self._baseline_parser: OpenAPIParser | None = None
+        self._baseline_blob: GitBlob | None = None
 
-    def _get_default_policy(self) -> Path:
+    @staticmethod
+    def _get_default_policy() -> Path:
         """Get path to default policy file."""
         skill_dir = Path(__file__).parent.parent.parent
         return skill_dir / "skills" / "api-governor" / "policy" / "default.internal.yaml"
 
+    @staticmethod
+    def _read_policy(policy_path: Path) -> PolicyConfig:
+        """Read, validate and compile a policy file.
+
+        Raises:
+            FileNotFoundError: If the policy file does not exist
+            PolicyError: If the policy violates the policy schema
+        """
+        if not policy_path.exists():
+            raise FileNotFoundError(f"Policy file not found: {policy_path}")
+
+        data = load_yaml(policy_path.read_text())
+        validate_policy(data, str(policy_path))
+        return PolicyConfig.from_dict(data)
+
     def _load_policy(self) -> PolicyConfig:
         """Load policy configuration."""
-        if self._policy is not None:
-            return self._policy
+        if self._policy is None:
+            self._policy = self._read_policy(self.policy_path)
+        return self._policy
 
-        if not self.policy_path.exists():
-            raise FileNotFoundError(f"Policy file not found: {self.policy_path}")
+    @classmethod
+    def run_batch(
+        cls,
+        spec_paths: Iterable[str | Path],
+        policy_path: str | Path | None = None,
+        cache_dir: str | Path | None = None,
+        plugins: PluginManager | None = None,
+        jobs: int | None = None,
+        fail_fast: Severity | None = None,
+    ) -> BatchResult:
+        """Run governance analysis on many specs in one process pool.
 
-        with open(self.policy_path) as f:
-            data = yaml.safe_load(f)
+        The policy is loaded once and shipped to each worker process when it
+        starts, so per-spec cost is only parsing and rule evaluation.
 
-        self._policy = PolicyConfig.from_dict(data)
-        return self._policy
+        Args:
+            spec_paths: Paths to OpenAPI specs to analyze
+            policy_path: Path to policy YAML file (optional, uses default)
+            cache_dir: Directory for persistent parsed-spec and result caches (optional)
+            plugins: Plugin manager whose rules run after the built-in rules (optional)
+            jobs: Number of worker processes (default: CPU count; 1 runs in-process)
+            fail_fast: Gating severity for each spec, see :meth:`run`
+
+        Returns:
+            BatchResult with one GovernanceResult per spec, in input order
+        """
+        specs = [Path(p) for p in spec_paths]
+        resolved_policy = Path(policy_path) if policy_path else cls._get_default_policy()
+        policy = cls._read_policy(resolved_policy)
+        options: dict[str, Any] = {
+            "policy_path": resolved_policy,
+            "policy": policy,
+            "cache_dir": cache_dir,
+            "plugins": plugins,
+            "fail_fast": fail_fast,
+        }
+
+        jobs = jobs or os.cpu_count() or 1
+        jobs = min(jobs, len(specs)) or 1
+        if jobs == 1:
+            _init_batch_worker(options)
+            results = [_run_batch_spec(spec) for spec in specs]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_batch_worker, initargs=(options,)
+            ) as executor:
+                chunksize = max(1, len(specs) // (jobs * 4))
+                results = list(executor.map(_run_batch_spec, specs, chunksize=chunksize))
+
+        return BatchResult(policy_name=policy.name, results=results)
+
+    @classmethod
+    def run_history(
+        cls,
+        spec_paths: Iterable[str | Path],
+        policy_path: str | Path | None = None,
+        cache_dir: str | Path | None = None,
+        jobs: int | None = None,
+    ) -> HistoryResult:
+        """Detect breaking changes across an ordered chain of spec versions.
+
+        Adjacent versions are diffed in turn. With several jobs the chain is
+        split into contiguous segments diffed in a process pool; each version
+        is parsed once per segment, so only segment boundaries are parsed twice.
+
+        Args:
+            spec_paths: Paths to the spec versions, oldest first
+            policy_path: Path to policy YAML file (optional, uses default)
+            cache_dir: Directory for the persistent parsed-spec cache (optional)
+            jobs: Number of worker processes (default: CPU count; 1 runs in-process)
+
+        Returns:
+            HistoryResult with one VersionDiff per adjacent pair, in chain order
+
+        Raises:
+            ValueError: If fewer than two versions are given
+            OpenAPIParseError: If a version cannot be parsed
+        """
+        specs = [Path(p) for p in spec_paths]
+        if len(specs) < 2:
+            raise ValueError("History mode needs at least two spec versions")
+        resolved_policy = Path(policy_path) if policy_path else cls._get_default_policy()
+        policy = cls._read_policy(resolved_policy)
+        options: dict[str, Any] = {
+            "policy_path": resolved_policy,
+            "policy": policy,
+            "cache_dir": cache_dir,
+            "plugins": None,
+        }
+
+        pairs = len(specs) - 1
+        jobs = jobs or os.cpu_count() or 1
+        jobs = min(jobs, pairs)
+        if jobs == 1:
+            _init_batch_worker(options)
+            diffs = _diff_history_segment(specs)
+        else:
+            bounds = [pairs * i // jobs for i in range(jobs + 1)]
+            segments = [specs[start : end + 1] for start, end in pairwise(bounds)]
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_batch_worker, initargs=(options,)
+            ) as executor:
+                results = executor.map(_diff_history_segment, segments)
+                diffs = [diff for segment in results for diff in segment]
+
+        steps = [
+            VersionDiff(str(baseline), str(current), breaking_changes)
+            for (baseline, current), breaking_changes in zip(pairwise(specs), diffs, strict=True)
+        ]
+        return HistoryResult(
+            policy_name=policy.name, versions=[str(spec) for spec in specs], steps=steps
+        )
+
+    @classmethod
+    def generate_batch_artifacts(
+        cls,
+        batch: BatchResult,
+        output_dir: str | Path = "governance",
+        policy_path: str | Path | None = None,
+    ) -> dict[str, dict[str, Path]]:
+        """Generate output artifacts for every spec in a batch.
+
+        Artifacts for each spec go to a subdirectory of ``output_dir`` that
+        mirrors the spec's path, so specs sharing a file name don't collide.
+
+        Args:
+            batch: BatchResult from run_batch
+            output_dir: Root directory for output artifacts
+            policy_path: Path to policy YAML file (optional, uses default)
+
+        Returns:
+            Dict mapping spec paths to their artifact name/path dicts
+        """
+        policy = cls._read_policy(Path(policy_path) if policy_path else cls._get_default_policy())
+        artifacts: dict[str, dict[str, Path]] = {}
+        for result in batch.results:
+            spec = Path(result.spec_path).with_suffix("")
+            parts = [p for p in spec.parts if p not in (spec.anchor, "", ".", "..")]
+            spec_dir = Path(output_dir).joinpath(*parts)
+            spec_dir.mkdir(parents=True, exist_ok=True)
+            artifacts[result.spec_path] = OutputGenerator(result, policy, spec_dir).generate_all()
+        return artifacts
+
+    def _make_parser(self, spec_path: Path, positions: bool = True) -> OpenAPIParser:
+        """Create the parser for a spec file.
+
+        Args:
+            spec_path: Spec file to parse
+            positions: Index source positions; only findings on the current
+                spec carry lines, so baselines skip the indexing cost
+        """
+        return OpenAPIParser(spec_path, cache=self._spec_cache, positions=positions)
 
-    def run(self) -> GovernanceResult:
+    def _make_baseline_parser(self) -> OpenAPIParser | None:
+        """Create the baseline parser, or None if no baseline is configured."""
+        if self.baseline_rev:
+            return OpenAPIParser.from_git(self._git_baseline(), cache=self._spec_cache)
+        if self.baseline_path and self.baseline_path.exists():
+            return self._make_parser(self.baseline_path, positions=False)
+        return None
+
+    def _git_baseline(self) -> GitBlob:
+        """Resolve the baseline blob at ``baseline_rev``, once per governor.
+
+        Raises:
+            GitError: If the file cannot be found at the revision
+        """
+        if self._baseline_blob is None:
+            assert self.baseline_rev is not None
+            path = self.baseline_path or self.spec_path
+            self._baseline_blob = GitBlob.resolve(self.baseline_rev, path)
+        return self._baseline_blob
+
+    def _result_cache_key(self) -> str | None:
+        """Hash all inputs that determine the result, or None if unreadable."""
+        parts: list[bytes | str] = ["result", __version__, str(self.spec_path)]
+        try:
+            parts.append(self.spec_path.read_bytes())
+            parts.append(self.policy_path.read_bytes())
+            if self.baseline_rev:
+                parts.extend(["rev", self._git_baseline().sha])
+            elif self.baseline_path and self.baseline_path.exists():
+                parts.extend([str(self.baseline_path), self.baseline_path.read_bytes()])
+        except OSError:
+            return None
+
+        if self.plugins is not None:
+            for plugin in self.plugins.plugins:
+                plugin_class = type(plugin)
+                parts.append(
+                    f"{plugin_class.__module__}.{plugin_class.__qualname__}"
+                    f":{plugin.rule_id}:{plugin.version}"
+                )
+        return content_hash(*parts)
+
+    def run(self, fail_fast: Severity | None = None) -> GovernanceResult:
         """Run governance analysis.
 
+        When a cache directory is configured, results are cached by the
+        content of the spec, policy and baseline plus tool and plugin
+        versions, and ``result.cache_status`` reports "hit" or "miss". Files
+        pulled in through external refs are re-hashed on lookup, so editing
+        one invalidates the cached result.
+
+        Args:
+            fail_fast: Gating severity, e.g. ``Severity.BLOCKER`` for pre-merge
+                gates. Checks that can report at this severity run first and
+                evaluation stops at the first such finding; the result is then
+                marked ``partial`` (and not cached). If no check reaches the
+                gate, the result is the same as without fail-fast.
+
+        Profiled runs bypass the result cache, since they time the evaluation.
+        In profiled runs, each rule and plugin walks the spec on its own so its
+        time can be attributed; in fail-fast mode only phases are timed.
+
         Returns:
             GovernanceResult with findings and recommendations
         """
         policy = self._load_policy()
+        caching = self._result_cache is not None and not self.profile
+        key = self._result_cache_key() if caching else None
+        if self._result_cache is None or key is None:
+            return self._evaluate(policy, fail_fast)
+
+        cached = self._result_cache.get(key)
+        if isinstance(cached, tuple) and len(cached) == 2:
+            cached_result, dependencies = cached
+            if (
+                isinstance(cached_result, GovernanceResult)
+                and self._dependency_hashes(dependencies) == dependencies
+            ):
+                cached_result.cache_status = "hit"
+                return cached_result
+
+        result = self._evaluate(policy, fail_fast)
+        if not result.partial:
+            try:
+                self._result_cache.put(key, (result, self._dependency_hashes(self._dependencies())))
+            except OSError:
+                pass  # Caching is best-effort
+        result.cache_status = "miss"
+        return result
+
+    def _dependencies(self) -> list[str]:
+        """Get the files loaded through external refs during the last evaluation."""
+        paths: list[str] = []
+        for parser in (self._parser, self._baseline_parser):
+            if parser is None or parser.documents is None:
+                continue
+            root = parser.spec_path.resolve()
+            paths.extend(str(path) for path in parser.documents.paths if path != root)
+        return paths
+
+    @staticmethod
+    def _dependency_hashes(paths: Iterable[str]) -> dict[str, str]:
+        """Hash the current content of files a cached result depends on."""
+        hashes = {}
+        for path in paths:
+            try:
+                hashes[path] = content_hash(Path(path).read_bytes())
+            except OSError:
+                hashes[path] = ""
+        return hashes
+
+    def _evaluate(
+        self, policy: PolicyConfig, fail_fast: Severity | None = None
+    ) -> GovernanceResult:
+        """Compute the governance result without consulting the result cache."""
+        profiler = Profiler()
+        result = self._analyze(policy, fail_fast, profiler)
+        if self.profile:
+            if self.profile_trace is not None and self._parser is not None:
+                profiler.trace_slowest(self._parser, self.profile_trace)
+            result.profile = profiler.profile
+        return result
+
+    def _analyze(
+        self, policy: PolicyConfig, fail_fast: Severity | None, profiler: Profiler
+    ) -> GovernanceResult:
+        """Run the analysis steps, timing each with the profiler."""
         findings: list[Finding] = []
         checklist: dict[str, bool] = {}
 
         # Step 1: Parse spec
         try:
-            self._parser = OpenAPIParser(self.spec_path)
-            self._parser.parse()
+            with profiler.phase("parse"):
+                self._parser = self._make_parser(self.spec_path)
+                self._parser.parse()
             checklist["OpenAPI parseable"] = True
         except OpenAPIParseError as e:
+            mark = getattr(e.__cause__, "problem_mark", None)
             findings.append(
                 Finding(
                     rule_id="PARSE001",
                     severity=Severity.BLOCKER,
                     message=f"Failed to parse OpenAPI spec: {e}",
                     path=str(self.spec_path),
+                    line=mark.line + 1 if mark is not None else None,
                     recommendation="Fix the spec syntax and try again",
                 )
             )
@@ -91,9 +419,8 @@ class APIGovernor:
             )
 
         # Step 2: Validate refs
-        ref_errors = self._parser.validate_refs()
-        if ref_errors:
-            for error in ref_errors:
+        with profiler.phase("refs", findings):
+            for error in self._parser.validate_refs():
                 findings.append(
                     Finding(
                         rule_id="REF001",
@@ -102,10 +429,53 @@ class APIGovernor:
                         recommendation="Fix unresolved $ref references",
                     )
                 )
+        if fail_fast is not None and any(f.severity.at_least(fail_fast) for f in findings):
+            return self._result(policy, findings, [], checklist, partial=True)
+
+        # Breaking changes only produce a (BLOCKER) finding when escalated, so
+        # fail-fast mode looks for them before running the rules
+        escalate = policy.plan.breaking_changes.escalate_without_deprecation_plan
+        breaking_changes: list[BreakingChange] | None = None
+        diffed = False
+        if fail_fast is not None and escalate:
+            with profiler.phase("diff"):
+                breaking_changes = self._detect_breaking_changes(policy, stop_at_first=True)
+            diffed = True
+            if breaking_changes:
+                findings.append(_escalation(breaking_changes))
+                checklist["Breaking changes accompanied by deprecation plan"] = False
+                return self._result(policy, findings, breaking_changes, checklist, partial=True)
 
         # Step 3: Apply governance rules
-        rule_engine = RuleEngine(policy)
-        findings.extend(rule_engine.evaluate(self._parser))
+        rule_engine = RuleEngine(policy, self.rule_executor)
+        executor = self.rule_executor
+        if fail_fast is None and self.profile:
+            # Each rule and plugin runs as a task of its own, timed separately
+            executor = executor or SerialExecutor()
+            with profiler.phase("rules", findings):
+                findings.extend(profiler.run_tasks(executor, self._parser, rule_engine.tasks()))
+            if self.plugins is not None:
+                with profiler.phase("plugins", findings):
+                    plugin_tasks = self.plugins.tasks(policy)
+                    findings.extend(profiler.run_tasks(executor, self._parser, plugin_tasks))
+        elif fail_fast is None and executor is not None and executor.parallel:
+            # Rules and plugins run side by side, merged in the usual order
+            tasks = rule_engine.tasks()
+            if self.plugins is not None:
+                tasks.extend(self.plugins.tasks(policy))
+            findings.extend(run_tasks(executor, self._parser, tasks))
+        else:
+            with profiler.phase("rules", findings):
+                if fail_fast is None:
+                    findings.extend(rule_engine.evaluate(self._parser))
+                else:
+                    rule_findings, stopped = rule_engine.evaluate_until(self._parser, fail_fast)
+                    findings.extend(rule_findings)
+                    if stopped:
+                        return self._result(policy, findings, [], checklist, partial=True)
+            if self.plugins is not None:
+                with profiler.phase("plugins", findings):
+                    findings.extend(self.plugins.run_all(self._parser, policy))
 
         # Update checklist based on findings
         checklist["Standard error envelope present"] = not any(
@@ -117,54 +487,59 @@ class APIGovernor:
         )
 
         # Step 4: Breaking change detection
-        breaking_changes = []
-        if self.baseline_path and self.baseline_path.exists():
-            self._baseline_parser = OpenAPIParser(self.baseline_path)
-            try:
-                self._baseline_parser.parse()
-                differ = SpecDiffer(policy)
-                breaking_changes = differ.diff(self._baseline_parser, self._parser)
+        if not diffed:
+            with profiler.phase("diff"):
+                breaking_changes = self._detect_breaking_changes(policy)
+        if breaking_changes is not None:
+            # Escalate breaking changes to findings if no deprecation plan
+            if breaking_changes and escalate:
+                findings.append(_escalation(breaking_changes))
+            checklist["Breaking changes accompanied by deprecation plan"] = not breaking_changes
 
-                # Escalate breaking changes to findings if no deprecation plan
-                escalate = policy.get(
-                    "breaking_change_detection.escalate_to_blocker_if.no_deprecation_plan", True
-                )
-                if breaking_changes and escalate:
-                    findings.append(
-                        Finding(
-                            rule_id="BREAK001",
-                            severity=Severity.BLOCKER,
-                            message=f"Breaking changes detected ({len(breaking_changes)}) without deprecation plan",
-                            recommendation="Create DEPRECATION_PLAN.md or revert breaking changes",
-                        )
-                    )
+        return self._result(policy, findings, breaking_changes or [], checklist)
 
-                checklist["Breaking changes accompanied by deprecation plan"] = not breaking_changes
-            except OpenAPIParseError:
-                pass  # Baseline parse errors are non-fatal
+    def _detect_breaking_changes(
+        self, policy: PolicyConfig, stop_at_first: bool = False
+    ) -> list[BreakingChange] | None:
+        """Diff the spec against the baseline, or return None if there is none."""
+        self._baseline_parser = self._make_baseline_parser()
+        if self._baseline_parser is None:
+            return None
+        try:
+            self._baseline_parser.parse()
+        except OpenAPIParseError:
+            return None  # Baseline parse errors are non-fatal
 
-        # Determine overall status
-        has_blockers = any(f.severity == Severity.BLOCKER for f in findings)
-        has_majors = any(f.severity == Severity.MAJOR for f in findings)
+        assert self._parser is not None
+        differ = SpecDiffer(policy)
+        return differ.diff(self._baseline_parser, self._parser, stop_at_first=stop_at_first)
 
-        if has_blockers:
+    def _result(
+        self,
+        policy: PolicyConfig,
+        findings: list[Finding],
+        breaking_changes: list[BreakingChange],
+        checklist: dict[str, bool],
+        partial: bool = False,
+    ) -> GovernanceResult:
+        """Build the result, deriving its status from the findings."""
+        if any(f.severity == Severity.BLOCKER for f in findings):
             status = "FAIL"
-        elif has_majors:
+        elif any(f.severity == Severity.MAJOR for f in findings):
             status = "WARN"
         else:
             status = "PASS"
 
-        result = GovernanceResult(
+        return GovernanceResult(
             spec_path=str(self.spec_path),
             policy_name=policy.name,
             status=status,
             findings=findings,
             breaking_changes=breaking_changes,
             checklist=checklist,
+            partial=partial,
         )
 
-        return result
-
     def generate_artifacts(self, result: GovernanceResult | None = None) -> dict[str, Path]:
         """Generate output artifacts.
 
@@ -181,4 +556,55 @@ class APIGovernor:
         policy = self._load_policy()
 
         generator = OutputGenerator(result, policy, self.output_dir)
-        return generator.generate_all()
+        if result.profile is None:
+            return generator.generate_all()
+        # Timed apart and added once done, so nothing serializes the phase half-way
+        profiler = Profiler()
+        with profiler.phase("artifacts"):
+            artifacts = generator.generate_all()
+        result.profile.phases.extend(profiler.profile.phases)
+        return artifacts
+
+
+def _escalation(breaking_changes: list[BreakingChange]) -> Finding:
+    """Build the finding that escalates breaking changes without a deprecation plan."""
+    return Finding(
+        rule_id="BREAK001",
+        severity=Severity.BLOCKER,
+        message=f"Breaking changes detected ({len(breaking_changes)}) without deprecation plan",
+        recommendation="Create DEPRECATION_PLAN.md or revert breaking changes",
+    )
+
+
+# Per-process state for batch workers, set once by the pool initializer
+_batch_options: dict[str, Any] = {}
+
+
+def _init_batch_worker(options: dict[str, Any]) -> None:
+    """Store shared batch options in a worker process."""
+    _batch_options.clear()
+    _batch_options.update(options)
+
+
+def _run_batch_spec(spec_path: Path) -> GovernanceResult:
+    """Run governance on one spec inside a batch worker."""
+    governor = APIGovernor(
+        spec_path,
+        policy_path=_batch_options["policy_path"],
+        cache_dir=_batch_options["cache_dir"],
+        plugins=_batch_options["plugins"],
+    )
+    governor._policy = _batch_options["policy"]
+    return governor.run(fail_fast=_batch_options["fail_fast"])
+
+
+def _diff_history_segment(spec_paths: list[Path]) -> list[list[BreakingChange]]:
+    """Diff adjacent versions of one segment of a release chain, parsing each once."""
+    cache_dir = _batch_options["cache_dir"]
+    cache = DiskCache(Path(cache_dir), "specs") if cache_dir else None
+    parsers = []
+    for spec_path in spec_paths:
+        parser = OpenAPIParser(spec_path, cache=cache)
+        parser.parse()
+        parsers.append(parser)
+    return SpecDiffer(_batch_options["policy"]).diff_history(parsers)
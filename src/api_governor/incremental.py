@@ -0,0 +1,250 @@
+"""Incremental rule evaluation for edited specs."""
+
+from collections.abc import Collection, Mapping
+from typing import Any
+
+from .models import Finding, PolicyConfig
+from .parser import OpenAPIParser, structural_hash
+from .positions import SourceMap, json_pointer
+from .rules import RuleEngine
+from .traversal import SpecVisitor, SpecWalker
+
+
+def section_digests(parser: OpenAPIParser) -> dict[str, bytes]:
+    """Digest each independently tracked section of a spec, keyed by JSON pointer.
+
+    Path items and component schemas reuse the parser's structural hashes;
+    other component sections and top-level keys are hashed whole. Comparing
+    the digests of two versions with :func:`changed_pointers` yields the
+    change set for :meth:`IncrementalRuleEngine.evaluate`.
+    """
+    hashes = parser.hashes
+    digests: dict[str, bytes] = {}
+    for key, value in parser.spec.items():
+        if key == "paths":
+            continue
+        if key == "components" and isinstance(value, dict):
+            for section, section_value in value.items():
+                if section != "schemas":
+                    digests[json_pointer(("components", section))] = structural_hash(section_value)
+            continue
+        digests[json_pointer((key,))] = structural_hash(value)
+    for path, digest in hashes.path_items.items():
+        digests[json_pointer(("paths", path))] = digest
+    for name, digest in hashes.schema_items.items():
+        digests[json_pointer(("components", "schemas", name))] = digest
+    return digests
+
+
+def changed_pointers(previous: Mapping[str, bytes], current: Mapping[str, bytes]) -> set[str]:
+    """Get the pointers of sections added, removed or modified between two versions."""
+    return {
+        pointer
+        for pointer in previous.keys() | current.keys()
+        if previous.get(pointer) != current.get(pointer)
+    }
+
+
+def _overlaps(pointer: str, inputs: Collection[str]) -> bool:
+    """Check whether a changed pointer is at, above or below any input."""
+    return any(
+        pointer == target or pointer.startswith(target + "/") or target.startswith(pointer + "/")
+        for target in inputs
+    )
+
+
+def _path_key(pointer: str) -> str | None:
+    """Get the path key of a pointer into a path item, or None."""
+    if not pointer.startswith("/paths/"):
+        return None
+    token = pointer[len("/paths/") :].split("/", 1)[0]
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _anchor_line(source_map: SourceMap | None, pointer: str) -> int | None:
+    """Get the source line of a pointer's node or nearest indexed ancestor."""
+    if source_map is None:
+        return None
+    tokens = [t.replace("~1", "/").replace("~0", "~") for t in pointer.split("/")[1:]]
+    return source_map.line(*tokens)
+
+
+class _PathMarker(SpecVisitor):
+    """Records where each path's findings start in path-scoped visitors."""
+
+    def __init__(self, visitors: list[SpecVisitor]):
+        super().__init__()
+        self.visitors = visitors
+        self.marks: list[tuple[str, list[int]]] = []
+
+    def visit_path(self, path: str, path_item: dict[str, Any]) -> None:
+        self.marks.append((path, [len(v.findings) for v in self.visitors]))
+
+    def split(self) -> dict[str, list[list[Finding]]]:
+        """Split each visitor's findings into per-path slices."""
+        ends = [len(v.findings) for v in self.visitors]
+        per_path: dict[str, list[list[Finding]]] = {}
+        for i in range(len(self.marks) - 1, -1, -1):
+            path, starts = self.marks[i]
+            per_path[path] = [
+                v.findings[start:end]
+                for v, start, end in zip(self.visitors, starts, ends, strict=True)
+            ]
+            ends = starts
+        return per_path
+
+
+class IncrementalRuleEngine(RuleEngine):
+    """Rule engine that re-evaluates only what a change can affect.
+
+    Findings of path-scoped rules (``SpecVisitor.scope == "path"``) are cached
+    per path item and recomputed for changed path items only, unless one of
+    the rules' spec-wide ``inputs`` changed. Findings of global rules are
+    cached per rule and recomputed only when one of their ``inputs`` changed.
+    Cached findings keep correct source lines when unchanged sections move.
+    """
+
+    def __init__(self, policy: PolicyConfig):
+        """Initialize with policy configuration."""
+        super().__init__(policy)
+        self._path_findings: dict[str, list[list[Finding]]] = {}
+        self._global_findings: dict[int, list[Finding]] = {}
+        self._anchors: dict[tuple[str, Any], int | None] = {}
+        self.last_evaluated_paths: list[str] = []
+        self.last_evaluated_rules: list[str] = []
+
+    @property
+    def path_findings(self) -> Mapping[str, list[list[Finding]]]:
+        """Get cached path-scoped findings, per path item and per rule."""
+        return self._path_findings
+
+    def evaluate(
+        self,
+        parser: OpenAPIParser,
+        changed_paths: Collection[str] | None = None,
+        changed_pointers: Collection[str] | None = None,
+    ) -> list[Finding]:
+        """Evaluate rules, reusing cached findings for unchanged parts of the spec.
+
+        Args:
+            parser: Parsed spec
+            changed_paths: Path keys whose path items changed since the last
+                call, when nothing outside ``paths`` changed
+            changed_pointers: JSON pointers of everything that changed since
+                the last call (e.g. from :func:`changed_pointers`); takes
+                precedence over ``changed_paths``. If both are None,
+                everything is re-evaluated.
+
+        Returns:
+            Findings in the same order as a full evaluation
+        """
+        pointers: set[str] | None = None
+        if changed_pointers is not None:
+            pointers = set(changed_pointers)
+        elif changed_paths is not None:
+            pointers = {json_pointer(("paths", path)) for path in changed_paths}
+
+        visitors = [rule(self.policy) for rule in self._rules]
+        scoped = [i for i, v in enumerate(visitors) if v.enabled and v.scope == "path"]
+        unscoped = [i for i, v in enumerate(visitors) if v.enabled and v.scope != "path"]
+        path_visitors = [visitors[i] for i in scoped]
+        paths = parser.paths
+        source_map = parser.source_map
+
+        changed_keys: set[str] = set()
+        outside: list[str] = []  # Changed pointers outside any path item
+        for pointer in pointers or ():
+            key = _path_key(pointer)
+            if key is None:
+                outside.append(pointer)
+            else:
+                changed_keys.add(key)
+
+        if pointers is None or any(
+            _overlaps(pointer, visitor.inputs) or pointer in ("", "/paths")
+            for pointer in outside
+            for visitor in path_visitors
+        ):
+            self._path_findings = {}
+            stale = list(paths)
+        else:
+            for path in [p for p in self._path_findings if p not in paths]:
+                del self._path_findings[path]
+                self._anchors.pop(("path", path), None)
+            stale = [p for p in paths if p in changed_keys or p not in self._path_findings]
+        rerun = [
+            i
+            for i in unscoped
+            if pointers is None
+            or i not in self._global_findings
+            or any(_overlaps(pointer, visitors[i].inputs) for pointer in pointers)
+        ]
+
+        # Global rules see the whole spec; path-scoped rules only stale paths
+        walker = SpecWalker(visitors[i] for i in rerun)
+        walker.walk(parser)
+        marker = _PathMarker(path_visitors)
+        path_walker = SpecWalker([marker, *path_visitors])
+        path_walker.walk(parser, paths=stale)
+
+        for path, per_rule in marker.split().items():
+            self._path_findings[path] = per_rule
+            self._anchors["path", path] = source_map.line("paths", path) if source_map else None
+        for i in rerun:
+            self._global_findings[i] = visitors[i].findings
+            self._anchors["rule", i] = _anchor_line(source_map, self._anchor(visitors[i]))
+        if source_map is not None:
+            self._move_cached(source_map, visitors, set(stale), set(rerun))
+        self.last_evaluated_paths = stale
+        self.last_evaluated_rules = [type(visitors[i]).__name__ for i in rerun]
+
+        findings: list[Finding] = []
+        for i in range(len(visitors)):
+            if i in scoped:
+                slot = scoped.index(i)
+                for path in paths:
+                    findings.extend(self._path_findings[path][slot])
+            elif i in unscoped:
+                findings.extend(self._global_findings[i])
+        return findings
+
+    @staticmethod
+    def _anchor(visitor: SpecVisitor) -> str:
+        """Get the pointer whose line a global rule's findings move with."""
+        return visitor.inputs[0] if visitor.inputs else ""
+
+    def _move_cached(
+        self,
+        source_map: SourceMap,
+        visitors: list[SpecVisitor],
+        fresh_paths: set[str],
+        fresh_rules: set[int],
+    ) -> None:
+        """Shift the lines of reused findings by how far their anchor moved."""
+        for path, per_rule in self._path_findings.items():
+            if path not in fresh_paths:
+                position = source_map.get(json_pointer(("paths", path)))
+                line = position[0] if position else None
+                delta = self._delta(("path", path), line)
+                if delta:
+                    self._path_findings[path] = [_shifted(f, delta) for f in per_rule]
+        for i, rule_findings in self._global_findings.items():
+            if i not in fresh_rules:
+                line = _anchor_line(source_map, self._anchor(visitors[i]))
+                delta = self._delta(("rule", i), line)
+                if delta:
+                    self._global_findings[i] = _shifted(rule_findings, delta)
+
+    def _delta(self, unit: tuple[str, Any], line: int | None) -> int:
+        previous = self._anchors.get(unit)
+        self._anchors[unit] = line
+        if previous is None or line is None:
+            return 0
+        return line - previous
+
+
+def _shifted(findings: list[Finding], delta: int) -> list[Finding]:
+    return [
+        finding.with_line(finding.line + delta) if finding.line is not None else finding
+        for finding in findings
+    ]
@@ -0,0 +1,473 @@
+"""Language Server Protocol server with incremental re-linting."""
+
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+from urllib.parse import unquote, urlparse
+
+import yaml
+
+from . import __version__
+from .governor import APIGovernor
+from .incremental import IncrementalRuleEngine, changed_pointers, section_digests
+from .models import Finding, PolicyConfig, Severity
+from .parser import (
+    OpenAPIParser,
+    YAMLLoader,
+    load_document_with_positions,
+    structural_hash,
+)
+from .plugins import PluginManager
+from .positions import SourceMap, json_pointer, load_yaml_with_positions
+
+# LSP DiagnosticSeverity
+_SEVERITY = {
+    Severity.BLOCKER: 1,
+    Severity.MAJOR: 2,
+    Severity.MINOR: 3,
+    Severity.INFO: 4,
+}
+
+# JSON-RPC error codes
+METHOD_NOT_FOUND = -32601
+
+# TextDocumentSyncKind.Incremental
+SYNC_INCREMENTAL = 2
+
+Position = tuple[int, int, int]  # line, start column, end column
+
+
+@dataclass
+class _Block:
+    """A top-level YAML mapping entry, or a path item under ``paths``."""
+
+    key: str
+    line: int
+    text: str
+    column: int = 0
+
+
+def _block_key(line: str) -> str | None:
+    """Get the key of a mapping entry line, or None if it has no scalar key."""
+    try:
+        for token in yaml.scan(line.strip()):
+            if isinstance(token, yaml.ScalarToken):
+                return str(token.value)
+            if isinstance(token, yaml.ValueToken):
+                return None
+    except yaml.YAMLError:
+        pass
+    return None
+
+
+def _is_content(line: str) -> bool:
+    stripped = line.strip()
+    return bool(stripped) and not stripped.startswith("#")
+
+
+def _split_blocks(lines: list[str], start: int, end: int, indent: int) -> list[_Block] | None:
+    """Split lines[start:end] into mapping entries at the given indentation.
+
+    Returns None when the layout is not a plain block mapping (e.g. flow
+    style or a sequence), in which case the caller falls back to a full parse.
+    """
+    blocks: list[_Block] = []
+    current: list[str] = []
+    for number in range(start, end):
+        line = lines[number]
+        if _is_content(line):
+            line_indent = len(line) - len(line.lstrip(" "))
+            if line_indent < indent:
+                return None
+            if line_indent == indent:
+                stripped = line.strip()
+                if stripped in ("---", "...") and indent == 0:
+                    continue
+                key = _block_key(line) if stripped[0] not in "-{[?" else None
+                if key is None:
+                    return None
+                if blocks:
+                    blocks[-1].text = "\n".join(current)
+                blocks.append(_Block(key, number, "", indent))
+                current = []
+        if blocks:
+            current.append(line)
+    if blocks:
+        blocks[-1].text = "\n".join(current)
+    return blocks
+
+
+@dataclass
+class SpecDocument:
+    """An open spec document, re-parsed block by block as it is edited."""
+
+    uri: str
+    text: str = ""
+    version: int | None = None
+    spec: dict[str, Any] | None = None
+    source_map: SourceMap | None = None
+    path_positions: dict[str, Position] = field(default_factory=dict)
+    section_positions: dict[str, Position] = field(default_factory=dict)
+    _fragments: dict[str, tuple[Any, SourceMap]] = field(default_factory=dict)
+    _section_texts: dict[str, str] = field(default_factory=dict)
+    _path_texts: dict[str, str] = field(default_factory=dict)
+
+    def apply_change(self, change: dict[str, Any]) -> None:
+        """Apply one LSP content change (full or range-based)."""
+        if "range" not in change:
+            self.text = change["text"]
+            return
+        start = self._offset(change["range"]["start"])
+        end = self._offset(change["range"]["end"])
+        self.text = self.text[:start] + change["text"] + self.text[end:]
+
+    def _offset(self, position: dict[str, int]) -> int:
+        """Convert an LSP (UTF-16) position to a string offset."""
+        offset = 0
+        lines = self.text.split("\n")
+        for line in lines[: position["line"]]:
+            offset += len(line) + 1
+        if position["line"] >= len(lines):
+            return len(self.text)
+        units = 0
+        line = lines[position["line"]]
+        for i, char in enumerate(line):
+            if units >= position["character"]:
+                return offset + i
+            units += 2 if ord(char) > 0xFFFF else 1
+        return offset + len(line)
+
+    def update(self) -> set[str] | None:
+        """Re-parse the document, reusing fragments whose text is unchanged.
+
+        Returns:
+            Path keys whose path items changed, or None when anything outside
+            ``paths`` changed (or the document had to be parsed as a whole)
+        """
+        lines = self.text.split("\n")
+        blocks = None
+        if self.text.lstrip()[:1] not in ("{", "["):
+            blocks = _split_blocks(lines, 0, len(lines), 0)
+        if blocks:
+            try:
+                return self._update_blocks(lines, blocks)
+            except yaml.YAMLError:
+                pass  # e.g. an alias whose anchor lives in another block
+
+        self._fragments = {}
+        self._section_texts = {}
+        self._path_texts = {}
+        self.path_positions = {}
+        self.section_positions = {}
+        spec, self.source_map = load_document_with_positions(self.text)
+        self.spec = spec if isinstance(spec, dict) else None
+        return None
+
+    def _load_fragment(self, text: str) -> tuple[Any, SourceMap]:
+        if text not in self._fragments:
+            self._fragments[text] = load_yaml_with_positions(text, YAMLLoader)
+        return self._fragments[text]
+
+    def _update_blocks(self, lines: list[str], blocks: list[_Block]) -> set[str] | None:
+        fragments: dict[str, tuple[Any, SourceMap]] = {}
+        spec: dict[str, Any] = {}
+        section_texts: dict[str, str] = {}
+        path_texts: dict[str, str] = {}
+        section_positions: dict[str, Position] = {}
+        path_positions: dict[str, Position] = {}
+        # Fragment positions are relative to the fragment's first line
+        source_maps: list[tuple[SourceMap, int]] = []
+
+        for index, block in enumerate(blocks):
+            section_positions[block.key] = (block.line, 0, len(block.key))
+            end = blocks[index + 1].line if index + 1 < len(blocks) else len(lines)
+            children = None
+            if block.key == "paths" and lines[block.line].rstrip().endswith(":"):
+                first = next((n for n in range(block.line + 1, end) if _is_content(lines[n])), None)
+                if first is not None:
+                    indent = len(lines[first]) - len(lines[first].lstrip(" "))
+                    children = _split_blocks(lines, block.line + 1, end, indent)
+
+            if children is None:
+                value, source_map = self._load_fragment(block.text)
+                if not isinstance(value, dict) or len(value) != 1:
+                    raise yaml.YAMLError(f"Unexpected fragment for {block.key}")
+                fragments[block.text] = value, source_map
+                source_maps.append((source_map, block.line))
+                section_texts[block.key] = block.text
+                spec.update(value)
+                continue
+
+            paths: dict[str, Any] = {}
+            for child in children:
+                text = f"paths:\n{child.text}"
+                value, source_map = self._load_fragment(text)
+                items = value.get("paths") if isinstance(value, dict) else None
+                if not isinstance(items, dict) or len(items) != 1:
+                    raise yaml.YAMLError(f"Unexpected fragment for path {child.key}")
+                fragments[text] = value, source_map
+                # Line 2 of the fragment is the child's first line
+                source_maps.append((source_map, child.line - 1))
+                (path_key,) = items
+                paths.update(items)
+                path_texts[path_key] = child.text
+                end_column = child.column + len(child.key)
+                path_positions[path_key] = (child.line, child.column, end_column)
+            section_texts["paths"] = lines[block.line]
+            spec["paths"] = paths
+            source_maps.append((SourceMap({"/paths": SourceMap.pack(block.line + 1, 1)}), 0))
+
+        changed: set[str] | None = None
+        if self.spec is not None and section_texts == self._section_texts:
+            changed = {p for p, t in path_texts.items() if self._path_texts.get(p) != t}
+            changed |= self._path_texts.keys() - path_texts.keys()  # Deleted path items
+
+        self._fragments = fragments
+        self._section_texts = section_texts
+        self._path_texts = path_texts
+        self.section_positions = section_positions
+        self.path_positions = path_positions
+        self.source_map = SourceMap.combine(source_maps)
+        self.spec = spec
+        return changed
+
+
+class LanguageServer:
+    """Minimal LSP server publishing governance diagnostics for open specs."""
+
+    def __init__(self, policy_path: str | Path | None = None, plugins: PluginManager | None = None):
+        """Initialize server.
+
+        Args:
+            policy_path: Path to policy YAML file (optional, uses default)
+            plugins: Plugin manager whose rules run after the built-in rules (optional)
+        """
+        self.policy_path = Path(policy_path) if policy_path else APIGovernor._get_default_policy()
+        self.plugins = plugins
+        self._policy: PolicyConfig | None = None
+        self._documents: dict[str, SpecDocument] = {}
+        self._engines: dict[str, IncrementalRuleEngine] = {}
+        self._digests: dict[str, dict[str, bytes]] = {}  # Section digests per document
+        self._writer: IO[bytes] | None = None
+        self._shutdown = False
+        self.running = True
+
+    @property
+    def policy(self) -> PolicyConfig:
+        """Get the loaded policy."""
+        if self._policy is None:
+            self._policy = APIGovernor._read_policy(self.policy_path)
+        return self._policy
+
+    def lint(self, document: SpecDocument) -> list[dict[str, Any]]:
+        """Re-lint a document and return LSP diagnostics."""
+        try:
+            changed = document.update()
+        except Exception as e:
+            mark = getattr(e, "problem_mark", None)
+            line = mark.line if mark is not None else max(getattr(e, "lineno", 1) - 1, 0)
+            self._engines.pop(document.uri, None)
+            self._digests.pop(document.uri, None)
+            return [self._diagnostic("PARSE001", Severity.BLOCKER, str(e), (line, 0, 1))]
+
+        spec = document.spec
+        if spec is None or ("openapi" not in spec and "swagger" not in spec):
+            return []  # Not an OpenAPI document
+
+        parser = OpenAPIParser.from_spec(spec, self._path(document.uri), document.source_map)
+        engine = self._engines.get(document.uri)
+        if engine is None:
+            engine = self._engines[document.uri] = IncrementalRuleEngine(self.policy)
+            self._digests.pop(document.uri, None)
+        pointers = self._changes(document, parser, changed)
+        findings = engine.evaluate(parser, changed_pointers=pointers)
+        if self.plugins is not None:
+            # Plugins are not incremental: they rerun on every edit
+            findings = findings + self.plugins.run_all(parser, self.policy)
+
+        # Findings without a source line fall back to their path item key
+        located: dict[int, Position] = {}
+        for path, per_rule in engine.path_findings.items():
+            position = document.path_positions.get(path)
+            if position is not None:
+                for rule_findings in per_rule:
+                    for finding in rule_findings:
+                        located[id(finding)] = position
+
+        diagnostics = [
+            self._diagnostic("REF001", Severity.BLOCKER, error, (0, 0, 1))
+            for error in parser.validate_refs()
+        ]
+        lines = document.text.split("\n")
+        for finding in findings:
+            position = (
+                self._line_position(lines, finding.line)
+                or located.get(id(finding))
+                or self._section_position(document, finding)
+            )
+            diagnostics.append(
+                self._diagnostic(finding.rule_id, finding.severity, finding.message, position)
+            )
+        return diagnostics
+
+    def _changes(
+        self, document: SpecDocument, parser: OpenAPIParser, changed: set[str] | None
+    ) -> set[str] | None:
+        """Get the pointers changed since the last lint, or None if unknown."""
+        previous = self._digests.get(document.uri)
+        if changed is None or previous is None:
+            # Something outside paths changed: find out what by digest
+            digests = self._digests[document.uri] = section_digests(parser)
+            return changed_pointers(previous, digests) if previous is not None else None
+        pointers = set()
+        for path in changed:
+            pointer = json_pointer(("paths", path))
+            pointers.add(pointer)
+            if path in parser.paths:
+                previous[pointer] = structural_hash(parser.paths[path])
+            else:
+                previous.pop(pointer, None)
+        return pointers
+
+    @staticmethod
+    def _line_position(lines: list[str], line: int | None) -> Position | None:
+        """Span the content of a 1-based source line."""
+        if line is None or not 0 < line <= len(lines):
+            return None
+        text = lines[line - 1].rstrip()
+        return line - 1, len(text) - len(text.lstrip()), max(len(text), 1)
+
+    @staticmethod
+    def _section_position(document: SpecDocument, finding: Finding) -> Position:
+        section = (finding.path or "").split(".", 1)[0]
+        return document.section_positions.get(section, (0, 0, 1))
+
+    @staticmethod
+    def _path(uri: str) -> str:
+        parsed = urlparse(uri)
+        return unquote(parsed.path) if parsed.scheme == "file" else uri
+
+    @staticmethod
+    def _diagnostic(
+        code: str, severity: Severity, message: str, position: Position
+    ) -> dict[str, Any]:
+        line, start, end = position
+        return {
+            "range": {
+                "start": {"line": line, "character": start},
+                "end": {"line": line, "character": end},
+            },
+            "severity": _SEVERITY[severity],
+            "code": code,
+            "source": "api-governor",
+            "message": message,
+        }
+
+    def _publish(self, document: SpecDocument, diagnostics: list[dict[str, Any]]) -> None:
+        params: dict[str, Any] = {"uri": document.uri, "diagnostics": diagnostics}
+        if document.version is not None:
+            params["version"] = document.version
+        self._send(
+            {"jsonrpc": "2.0", "method": "textDocument/publishDiagnostics", "params": params}
+        )
+
+    def handle(self, message: dict[str, Any]) -> dict[str, Any] | None:
+        """Handle one LSP message and return the response, if any."""
+        method = message.get("method")
+        params = message.get("params") or {}
+        request_id = message.get("id")
+        result: Any = None
+
+        if method == "initialize":
+            options = params.get("initializationOptions") or {}
+            if options.get("policyPath"):
+                self.policy_path = Path(options["policyPath"])
+                self._policy = None
+            result = {
+                "capabilities": {
+                    "textDocumentSync": {
+                        "openClose": True,
+                        "change": SYNC_INCREMENTAL,
+                        "save": False,
+                    }
+                },
+                "serverInfo": {"name": "api-governor", "version": __version__},
+            }
+        elif method == "textDocument/didOpen":
+            item = params["textDocument"]
+            document = SpecDocument(item["uri"], item["text"], item.get("version"))
+            self._documents[document.uri] = document
+            self._engines.pop(document.uri, None)
+            self._publish(document, self.lint(document))
+        elif method == "textDocument/didChange":
+            uri = params["textDocument"]["uri"]
+            document = self._documents.setdefault(uri, SpecDocument(uri))
+            for change in params["contentChanges"]:
+                document.apply_change(change)
+            document.version = params["textDocument"].get("version")
+            self._publish(document, self.lint(document))
+        elif method == "textDocument/didClose":
+            uri = params["textDocument"]["uri"]
+            self._documents.pop(uri, None)
+            self._engines.pop(uri, None)
+            self._digests.pop(uri, None)
+            self._send(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "textDocument/publishDiagnostics",
+                    "params": {"uri": uri, "diagnostics": []},
+                }
+            )
+        elif method == "shutdown":
+            self._shutdown = True
+        elif method == "exit":
+            self.running = False
+        elif request_id is not None and method not in ("initialized",):
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": METHOD_NOT_FOUND, "message": f"Method not found: {method}"},
+            }
+
+        if request_id is None:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def _send(self, message: dict[str, Any]) -> None:
+        if self._writer is None:
+            return
+        body = json.dumps(message).encode()
+        self._writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+        self._writer.flush()
+
+    @staticmethod
+    def _read_message(reader: IO[bytes]) -> dict[str, Any] | None:
+        length = None
+        while True:
+            header = reader.readline()
+            if not header:
+                return None
+            header = header.strip()
+            if not header:
+                break
+            name, _, value = header.decode().partition(":")
+            if name.lower() == "content-length":
+                length = int(value.strip())
+        if length is None:
+            return None
+        message: dict[str, Any] = json.loads(reader.read(length))
+        return message
+
+    def serve(self, reader: IO[bytes] | None = None, writer: IO[bytes] | None = None) -> None:
+        """Serve LSP messages over a byte stream (stdio by default) until exit."""
+        reader = reader or sys.stdin.buffer
+        self._writer = writer or sys.stdout.buffer
+        while self.running:
+            message = self._read_message(reader)
+            if message is None:
+                break
+            response = self.handle(message)
+            if response is not None:
+                self._send(response)
@@ -1,9 +1,14 @@
 """Data models for API Governor."""
 
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
 from typing import Any
 
+from .policy import POLICY_DEFAULTS, PolicyError
+
 
 class Severity(Enum):
     """Finding severity levels."""
@@ -13,51 +18,358 @@ class Severity(Enum):
     MINOR = "MINOR"
     INFO = "INFO"
 
+    def at_least(self, other: "Severity") -> bool:
+        """Check whether this severity is as severe as ``other`` or more."""
+        return _SEVERITY_RANKS[self] <= _SEVERITY_RANKS[other]
+
+
+_SEVERITY_RANKS = {severity: rank for rank, severity in enumerate(Severity)}
+
+
+class Template:
+    """Message text shared by all findings of one kind.
+
+    Findings and breaking changes built in bulk store a template plus the few
+    values that differ (``args``) instead of a formatted string each; the
+    text is formatted with ``str.format(*args)`` only when it is read.
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str) -> None:
+        """Initialize with ``str.format`` text using positional fields."""
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"Template({self.text!r})"
+
+
+@cache
+def http_method(method: str) -> str:
+    """Get the upper-case name of an HTTP method, shared by all findings that show it."""
+    return method.upper()
+
+
+def _fill(value: str | Template | None, args: tuple[Any, ...]) -> str | None:
+    """Format a template with a finding's args; plain strings are returned as is."""
+    if isinstance(value, Template):
+        return value.text.format(*args)
+    return value
+
 
-@dataclass
 class Finding:
-    """A governance finding."""
+    """A governance finding.
 
-    rule_id: str
-    severity: Severity
-    message: str
-    path: str | None = None
-    line: int | None = None
-    recommendation: str | None = None
+    ``message``, ``path`` and ``recommendation`` may be :class:`Template`
+    instances shared per rule, formatted lazily from ``args``; rule IDs are
+    interned. Findings are slotted, so they carry no per-instance dict;
+    assigning one of these fields stores the plain string.
+    """
+
+    __slots__ = ("rule_id", "severity", "_message", "_path", "line", "_recommendation", "_args")
+
+    def __init__(
+        self,
+        rule_id: str,
+        severity: Severity,
+        message: str | Template,
+        path: str | Template | None = None,
+        line: int | None = None,
+        recommendation: str | Template | None = None,
+        *,
+        args: tuple[Any, ...] = (),
+    ) -> None:
+        """Initialize a finding.
+
+        Args:
+            rule_id: Rule that produced the finding
+            severity: Finding severity
+            message: Message text or template
+            path: Location in the spec, or a template for it
+            line: Source line, if known
+            recommendation: Recommendation text or template
+            args: Values for the template fields
+        """
+        self.rule_id = sys.intern(rule_id)
+        self.severity = severity
+        self._message = message
+        self._path = path
+        self.line = line
+        self._recommendation = recommendation
+        self._args = args
+
+    @property
+    def message(self) -> str:
+        """Get the formatted message."""
+        return _fill(self._message, self._args)  # type: ignore[return-value]
+
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = value
+
+    @property
+    def path(self) -> str | None:
+        """Get the formatted spec location."""
+        return _fill(self._path, self._args)
+
+    @path.setter
+    def path(self, value: str | None) -> None:
+        self._path = value
+
+    @property
+    def recommendation(self) -> str | None:
+        """Get the formatted recommendation."""
+        return _fill(self._recommendation, self._args)
+
+    @recommendation.setter
+    def recommendation(self, value: str | None) -> None:
+        self._recommendation = value
+
+    def with_line(self, line: int | None) -> "Finding":
+        """Copy the finding to another source line, sharing its templates."""
+        return Finding(
+            self.rule_id,
+            self.severity,
+            self._message,
+            self._path,
+            line,
+            self._recommendation,
+            args=self._args,
+        )
+
+    def _key(self) -> tuple[Any, ...]:
+        return (
+            self.rule_id,
+            self.severity,
+            self.message,
+            self.path,
+            self.line,
+            self.recommendation,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not Finding:
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"Finding(rule_id={self.rule_id!r}, severity={self.severity!r}, "
+            f"message={self.message!r}, path={self.path!r}, line={self.line!r}, "
+            f"recommendation={self.recommendation!r})"
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through __init__ so rule IDs are interned again on load
+        return (
+            _finding,
+            (
+                self.rule_id,
+                self.severity,
+                self._message,
+                self._path,
+                self.line,
+                self._recommendation,
+                self._args,
+            ),
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
+        args = self._args
         return {
             "rule_id": self.rule_id,
             "severity": self.severity.value,
-            "message": self.message,
-            "path": self.path,
+            "message": _fill(self._message, args),
+            "path": _fill(self._path, args),
             "line": self.line,
-            "recommendation": self.recommendation,
+            "recommendation": _fill(self._recommendation, args),
         }
 
 
-@dataclass
+def _finding(
+    rule_id: str,
+    severity: Severity,
+    message: str | Template,
+    path: str | Template | None,
+    line: int | None,
+    recommendation: str | Template | None,
+    args: tuple[Any, ...],
+) -> Finding:
+    return Finding(rule_id, severity, message, path, line, recommendation, args=args)
+
+
 class BreakingChange:
-    """A breaking change between spec versions."""
+    """A breaking change between spec versions.
+
+    Like :class:`Finding`, ``path``, ``description`` and ``client_impact``
+    may be shared :class:`Template` instances formatted lazily from ``args``.
+    """
+
+    __slots__ = ("change_type", "_path", "_description", "_client_impact", "severity", "_args")
+
+    def __init__(
+        self,
+        change_type: str,
+        path: str | Template,
+        description: str | Template,
+        client_impact: str | Template,
+        severity: Severity = Severity.MAJOR,
+        *,
+        args: tuple[Any, ...] = (),
+    ) -> None:
+        """Initialize a breaking change.
 
-    change_type: str
-    path: str
-    description: str
-    client_impact: str
-    severity: Severity = Severity.MAJOR
+        Args:
+            change_type: Kind of change, e.g. "removed_operation"
+            path: Operation, parameter or schema field that changed
+            description: Description text or template
+            client_impact: Client impact text or template
+            severity: Change severity
+            args: Values for the template fields
+        """
+        self.change_type = sys.intern(change_type)
+        self._path = path
+        self._description = description
+        self._client_impact = client_impact
+        self.severity = severity
+        self._args = args
+
+    @property
+    def path(self) -> str:
+        """Get the formatted location of the change."""
+        return _fill(self._path, self._args)  # type: ignore[return-value]
+
+    @path.setter
+    def path(self, value: str) -> None:
+        self._path = value
+
+    @property
+    def description(self) -> str:
+        """Get the formatted description."""
+        return _fill(self._description, self._args)  # type: ignore[return-value]
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self._description = value
+
+    @property
+    def client_impact(self) -> str:
+        """Get the formatted client impact."""
+        return _fill(self._client_impact, self._args)  # type: ignore[return-value]
+
+    @client_impact.setter
+    def client_impact(self, value: str) -> None:
+        self._client_impact = value
+
+    @property
+    def endpoint(self) -> str:
+        """Get the operation ("GET /users") or schema ("schemas.User") that changed."""
+        path = self.path
+        if " -> " in path:
+            return path.split(" -> ", 1)[0]
+        if path.startswith("schemas."):
+            return ".".join(path.split(".", 2)[:2])
+        return path
+
+    def _key(self) -> tuple[Any, ...]:
+        return (self.change_type, self.path, self.description, self.client_impact, self.severity)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not BreakingChange:
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"BreakingChange(change_type={self.change_type!r}, path={self.path!r}, "
+            f"description={self.description!r}, client_impact={self.client_impact!r}, "
+            f"severity={self.severity!r})"
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (
+            _breaking_change,
+            (
+                self.change_type,
+                self._path,
+                self._description,
+                self._client_impact,
+                self.severity,
+                self._args,
+            ),
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
+        args = self._args
         return {
             "change_type": self.change_type,
-            "path": self.path,
-            "description": self.description,
-            "client_impact": self.client_impact,
+            "path": _fill(self._path, args),
+            "description": _fill(self._description, args),
+            "client_impact": _fill(self._client_impact, args),
             "severity": self.severity.value,
         }
 
 
+def _breaking_change(
+    change_type: str,
+    path: str | Template,
+    description: str | Template,
+    client_impact: str | Template,
+    severity: Severity,
+    args: tuple[Any, ...],
+) -> BreakingChange:
+    return BreakingChange(change_type, path, description, client_impact, severity, args=args)
+
+
+@dataclass
+class Timing:
+    """Time spent in one phase, rule or plugin of a governance run."""
+
+    name: str
+    wall_ms: float
+    cpu_ms: float
+    findings: int = 0  # Findings reported during the phase or by the rule
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "wall_ms": round(self.wall_ms, 3),
+            "cpu_ms": round(self.cpu_ms, 3),
+            "findings": self.findings,
+        }
+
+
+@dataclass
+class RunProfile:
+    """Timings recorded by a profiled governance run."""
+
+    phases: list[Timing] = field(default_factory=list)
+    rules: list[Timing] = field(default_factory=list)  # Built-in rules, then plugins
+    trace_path: str | None = None  # cProfile stats of the slowest rule, if dumped
+
+    @property
+    def slowest_rule(self) -> Timing | None:
+        """Get the rule or plugin with the most wall time."""
+        return max(self.rules, key=lambda t: t.wall_ms, default=None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        data: dict[str, Any] = {
+            "phases": [t.to_dict() for t in self.phases],
+            "rules": [t.to_dict() for t in self.rules],
+        }
+        if self.trace_path is not None:
+            data["trace"] = self.trace_path
+        return data
+
+
 @dataclass
 class GovernanceResult:
     """Result of governance analysis."""
@@ -68,6 +380,9 @@ class GovernanceResult:
     findings: list[Finding] = field(default_factory=list)
     breaking_changes: list[BreakingChange] = field(default_factory=list)
     checklist: dict[str, bool] = field(default_factory=dict)
+    cache_status: str | None = None  # hit, miss (None when caching is disabled)
+    partial: bool = False  # True when fail-fast mode stopped before all checks ran
+    profile: RunProfile | None = None  # Timings, when the run was profiled
 
     @property
     def blockers(self) -> list[Finding]:
@@ -91,7 +406,7 @@ class GovernanceResult:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return {
+        data: dict[str, Any] = {
             "spec_path": self.spec_path,
             "policy_name": self.policy_name,
             "status": self.status,
@@ -99,22 +414,334 @@ class GovernanceResult:
             "breaking_changes": [bc.to_dict() for bc in self.breaking_changes],
             "checklist": self.checklist,
         }
+        if self.cache_status is not None:
+            data["cache"] = self.cache_status
+        if self.partial:
+            data["partial"] = True
+        if self.profile is not None:
+            data["profile"] = self.profile.to_dict()
+        return data
+
+
+@dataclass
+class BatchResult:
+    """Aggregated result of governance analysis over many specs."""
+
+    policy_name: str
+    results: list[GovernanceResult] = field(default_factory=list)
+
+    @property
+    def status(self) -> str:
+        """Get the worst status across all specs."""
+        statuses = {r.status for r in self.results}
+        for status in ("FAIL", "WARN"):
+            if status in statuses:
+                return status
+        return "PASS"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "policy_name": self.policy_name,
+            "status": self.status,
+            "summary": {
+                "specs": len(self.results),
+                "pass": sum(1 for r in self.results if r.status == "PASS"),
+                "warn": sum(1 for r in self.results if r.status == "WARN"),
+                "fail": sum(1 for r in self.results if r.status == "FAIL"),
+            },
+            "results": [r.to_dict() for r in self.results],
+        }
+
+
+@dataclass
+class VersionDiff:
+    """Breaking changes between two adjacent versions of a release chain."""
+
+    baseline_path: str
+    current_path: str
+    breaking_changes: list[BreakingChange] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "baseline_path": self.baseline_path,
+            "current_path": self.current_path,
+            "breaking_changes": [bc.to_dict() for bc in self.breaking_changes],
+        }
+
+
+@dataclass
+class HistoryResult:
+    """Breaking changes across an ordered chain of spec versions."""
+
+    policy_name: str
+    versions: list[str] = field(default_factory=list)
+    steps: list[VersionDiff] = field(default_factory=list)
+
+    @property
+    def status(self) -> str:
+        """Get "WARN" if any version introduced breaking changes, else "PASS"."""
+        return "WARN" if any(step.breaking_changes for step in self.steps) else "PASS"
+
+    @property
+    def timeline(self) -> dict[str, list[tuple[str, BreakingChange]]]:
+        """Get breaking changes per endpoint, with the version that introduced each.
+
+        Endpoints are ordered by first breaking change; each endpoint's
+        changes are in release order.
+        """
+        timeline: dict[str, list[tuple[str, BreakingChange]]] = {}
+        for step in self.steps:
+            for bc in step.breaking_changes:
+                timeline.setdefault(bc.endpoint, []).append((step.current_path, bc))
+        return timeline
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "policy_name": self.policy_name,
+            "status": self.status,
+            "versions": self.versions,
+            "steps": [step.to_dict() for step in self.steps],
+            "timeline": {
+                endpoint: [{"version": version, **bc.to_dict()} for version, bc in changes]
+                for endpoint, changes in self.timeline.items()
+            },
+        }
+
+
+_MISSING = object()
+
+
+def _setting(config: dict[str, Any], key: str, default: Any, kind: type) -> Any:
+    """Look up a dot-notation setting, checking the type of configured values."""
+    value: Any = config
+    for part in key.split("."):
+        value = value.get(part, _MISSING) if isinstance(value, dict) else _MISSING
+        if value is _MISSING:
+            return default
+    if not isinstance(value, kind):
+        raise PolicyError(f"Policy setting {key}: expected {kind.__name__}, got {value!r}")
+    return value
+
+
+def _severity(config: dict[str, Any], key: str, default: str) -> Severity:
+    """Resolve a severity setting to a Severity member."""
+    level = _setting(config, key, default, str)
+    try:
+        return Severity[level]
+    except KeyError:
+        allowed = ", ".join(s.value for s in Severity)
+        raise PolicyError(f"Policy setting {key}: unknown severity {level!r} ({allowed})") from None
+
+
+@dataclass(frozen=True)
+class SecurityPlan:
+    """Compiled ``security`` settings."""
+
+    require_security_by_default: bool
+    allow_explicitly_public: bool
+    severity: Severity
+
+
+@dataclass(frozen=True)
+class ErrorsPlan:
+    """Compiled ``errors`` settings."""
+
+    require_standard_error_envelope: bool
+    envelope_name: str
+    problem_fields_required: tuple[str, ...]
+    severity: Severity
+
+
+@dataclass(frozen=True)
+class PaginationPlan:
+    """Compiled ``pagination`` settings."""
+
+    required_for_list_endpoints: bool
+    style: str
+    limit_param: str
+    cursor_param: str
+    severity: Severity
+
+
+@dataclass(frozen=True)
+class NamingPlan:
+    """Compiled ``api_style`` naming settings."""
+
+    prefer_kebab_case_paths: bool
+    discourage_verbs_in_paths: bool
+    severity: Severity
+
+
+@dataclass(frozen=True)
+class ObservabilityPlan:
+    """Compiled ``observability`` settings."""
+
+    require_request_id_header: bool
+    severity: Severity
+
+
+@dataclass(frozen=True)
+class VersioningPlan:
+    """Compiled ``versioning`` settings."""
+
+    strategy: str
+    url_versioning: bool
+    prefix: str
+    severity: Severity
+
+
+@dataclass(frozen=True)
+class BreakingChangePlan:
+    """Compiled ``breaking_change_detection`` settings."""
+
+    enabled: bool
+    severity: Severity
+    checks: Mapping[str, bool]  # Configured breaking_changes toggles
+    escalate_without_deprecation_plan: bool
+
+    def detects(self, check: str, default: bool = True) -> bool:
+        """Check whether a breaking change type is enabled."""
+        return self.checks.get(check, default)
+
+
+@dataclass(frozen=True)
+class PolicyPlan:
+    """A policy compiled into typed settings with resolved severities.
+
+    Built once per :class:`PolicyConfig`, so rules and the differ read plain
+    attributes instead of looking up dotted keys for every finding.
+    """
+
+    security: SecurityPlan
+    errors: ErrorsPlan
+    pagination: PaginationPlan
+    naming: NamingPlan
+    observability: ObservabilityPlan
+    versioning: VersioningPlan
+    breaking_changes: BreakingChangePlan
+
+    @classmethod
+    def compile(cls, config: dict[str, Any]) -> "PolicyPlan":
+        """Compile policy data, applying defaults for missing settings.
+
+        Raises:
+            PolicyError: If a setting has the wrong type or an unknown severity
+        """
+        checks = _setting(config, "breaking_change_detection.breaking_changes", {}, dict)
+        for check, enabled in checks.items():
+            if not isinstance(enabled, bool):
+                raise PolicyError(
+                    f"Policy setting breaking_change_detection.breaking_changes.{check}: "
+                    f"expected bool, got {enabled!r}"
+                )
+        return cls(
+            security=SecurityPlan(
+                require_security_by_default=_setting(
+                    config, "security.require_security_by_default", True, bool
+                ),
+                allow_explicitly_public=_setting(
+                    config, "security.allow_public_endpoints_if.explicitly_marked", True, bool
+                ),
+                severity=_severity(
+                    config, "enforcement.default_severity.security_missing", "MAJOR"
+                ),
+            ),
+            errors=ErrorsPlan(
+                require_standard_error_envelope=_setting(
+                    config, "errors.require_standard_error_envelope", True, bool
+                ),
+                envelope_name=_setting(config, "errors.envelope_name", "Error", str),
+                problem_fields_required=tuple(
+                    _setting(
+                        config,
+                        "errors.problem_fields_required",
+                        ["code", "message", "requestId"],
+                        list,
+                    )
+                ),
+                severity=_severity(
+                    config, "enforcement.default_severity.error_model_inconsistent", "MAJOR"
+                ),
+            ),
+            pagination=PaginationPlan(
+                required_for_list_endpoints=_setting(
+                    config, "pagination.required_for_list_endpoints", True, bool
+                ),
+                style=_setting(config, "pagination.style", "cursor", str),
+                limit_param=_setting(config, "pagination.request_params.limit", "limit", str),
+                cursor_param=_setting(config, "pagination.request_params.cursor", "cursor", str),
+                severity=_severity(
+                    config, "enforcement.default_severity.pagination_inconsistent", "MAJOR"
+                ),
+            ),
+            naming=NamingPlan(
+                prefer_kebab_case_paths=_setting(
+                    config, "api_style.prefer_kebab_case_paths", True, bool
+                ),
+                discourage_verbs_in_paths=_setting(
+                    config, "api_style.discourage_verbs_in_paths", True, bool
+                ),
+                severity=_severity(
+                    config, "enforcement.default_severity.naming_inconsistent", "MINOR"
+                ),
+            ),
+            observability=ObservabilityPlan(
+                require_request_id_header=_setting(
+                    config, "observability.require_request_id_header", True, bool
+                ),
+                severity=_severity(
+                    config, "enforcement.default_severity.observability_missing", "MINOR"
+                ),
+            ),
+            versioning=VersioningPlan(
+                strategy=_setting(config, "versioning.strategy", "none_or_header", str),
+                url_versioning=_setting(config, "versioning.url_versioning.enabled", False, bool),
+                prefix=_setting(config, "versioning.url_versioning.prefix", "/v{major}", str),
+                severity=_severity(
+                    config, "enforcement.default_severity.versioning_inconsistent", "MINOR"
+                ),
+            ),
+            breaking_changes=BreakingChangePlan(
+                enabled=_setting(config, "breaking_change_detection.enabled", True, bool),
+                severity=_severity(
+                    config, "breaking_change_detection.default_breaking_severity", "MAJOR"
+                ),
+                checks=dict(checks),
+                escalate_without_deprecation_plan=_setting(
+                    config,
+                    "breaking_change_detection.escalate_to_blocker_if.no_deprecation_plan",
+                    True,
+                    bool,
+                ),
+            ),
+        )
 
 
 @dataclass
 class PolicyConfig:
-    """Policy configuration."""
+    """Policy configuration.
+
+    The typed :class:`PolicyPlan` is compiled on construction, so invalid
+    settings fail here rather than while rules run.
+    """
 
     name: str
     version: str
     config: dict[str, Any]
+    plan: PolicyPlan = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.plan = PolicyPlan.compile(self.config)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "PolicyConfig":
         """Create from dictionary."""
         return cls(
-            name=data.get("policy_name", "Unknown"),
-            version=data.get("policy_version", "0.0"),
+            name=data.get("policy_name", POLICY_DEFAULTS["policy_name"]),
+            version=data.get("policy_version", POLICY_DEFAULTS["policy_version"]),
             config=data,
         )
 
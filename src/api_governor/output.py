@@ -48,6 +48,14 @@ class OutputGenerator:
             f"**Spec:** {self.result.spec_path}",
             "",
         ]
+        if self.result.partial:
+            lines.extend(
+                [
+                    "> **Partial result:** fail-fast mode stopped at the first finding at",
+                    "> the gating severity; further findings may exist.",
+                    "",
+                ]
+            )
 
         # Findings by severity
         for severity in [Severity.BLOCKER, Severity.MAJOR, Severity.MINOR, Severity.INFO]:
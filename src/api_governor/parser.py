@@ -1,10 +1,53 @@
 """OpenAPI spec parser."""
 
+import hashlib
+import json
+import os
+import re
+import threading
+from collections.abc import Callable, Collection, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, cast
 
 import yaml
 
+from . import __version__
+from .cache import DiskCache, content_hash
+from .git import GitBlob
+from .positions import SourceMap, escape_pointer_token, load_yaml_with_positions
+from .refs import RefResolver
+
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLLoader  # type: ignore[assignment]
+
+try:
+    import orjson
+
+    _json_loads: Callable[[str], Any] = orjson.loads
+
+    def _canonical_json(value: Any) -> bytes:
+        return orjson.dumps(
+            value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str
+        )
+
+except ImportError:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
+
+    def _canonical_json(value: Any) -> bytes:
+        return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+
+HTTP_METHODS = ("get", "post", "put", "patch", "delete", "options", "head")
+
+OperationKey = tuple[str, str]
+
+_CONTAINERS = (dict, list)
+
 
 class OpenAPIParseError(Exception):
     """Error parsing OpenAPI spec."""
@@ -12,45 +55,429 @@ class OpenAPIParseError(Exception):
     pass
 
 
+def load_yaml(content: str) -> Any:
+    """Load YAML content, using the libyaml-backed loader when available."""
+    return yaml.load(content, Loader=YAMLLoader)
+
+
+def load_document(content: str, suffix: str = "") -> Any:
+    """Load a JSON or YAML document.
+
+    JSON content is detected by sniffing the first non-whitespace character
+    and handed to the JSON parser (orjson when installed), which is much
+    faster than running it through the YAML loader.
+
+    Args:
+        content: Document text
+        suffix: File suffix hint (e.g. ".yaml", ".json")
+
+    Returns:
+        Parsed document
+    """
+    if suffix == ".json":
+        return _json_loads(content)
+
+    if content.lstrip()[:1] in ("{", "["):
+        try:
+            return _json_loads(content)
+        except ValueError:
+            pass  # Not strict JSON, e.g. a YAML flow mapping
+
+    if suffix in (".yaml", ".yml"):
+        return load_yaml(content)
+
+    # Try YAML first, then JSON
+    try:
+        return load_yaml(content)
+    except yaml.YAMLError:
+        return _json_loads(content)
+
+
+def load_document_with_positions(content: str, suffix: str = "") -> tuple[Any, SourceMap]:
+    """Load a document and index the source positions of its nodes.
+
+    YAML documents are composed once and indexed before construction. JSON
+    documents keep the JSON fast path and get an empty source map, since
+    indexing them would mean running them through the much slower YAML
+    composer.
+
+    Args:
+        content: Document text
+        suffix: File suffix hint (e.g. ".yaml", ".json")
+
+    Returns:
+        Tuple of (parsed document, source map)
+    """
+    if suffix == ".json" or content.lstrip()[:1] in ("{", "["):
+        try:
+            return load_document(content, suffix), SourceMap()
+        except ValueError:
+            pass  # Not strict JSON, e.g. a YAML flow mapping
+
+    try:
+        return load_yaml_with_positions(content, YAMLLoader)
+    except yaml.YAMLError:
+        if suffix in (".yaml", ".yml"):
+            raise
+        return _json_loads(content), SourceMap()
+
+
+@dataclass(frozen=True)
+class OperationIndex:
+    """Immutable index of a spec's operations, built once per parser."""
+
+    operations: tuple[tuple[str, str, dict[str, Any]], ...]
+    by_key: Mapping[OperationKey, dict[str, Any]]
+    by_path: Mapping[str, tuple[tuple[str, dict[str, Any]], ...]]
+    by_operation_id: Mapping[str, OperationKey]
+    by_tag: Mapping[str, tuple[OperationKey, ...]]
+    operation_keys: frozenset[OperationKey]
+    collection_paths: frozenset[str]
+
+    @classmethod
+    def build(cls, paths: dict[str, Any]) -> "OperationIndex":
+        """Build the index from a spec's ``paths`` object."""
+        operations: list[tuple[str, str, dict[str, Any]]] = []
+        by_key: dict[OperationKey, dict[str, Any]] = {}
+        by_path: dict[str, tuple[tuple[str, dict[str, Any]], ...]] = {}
+        by_operation_id: dict[str, OperationKey] = {}
+        by_tag: dict[str, list[OperationKey]] = {}
+        collection_paths: set[str] = set()
+
+        for path, path_item in paths.items():
+            # Heuristic: path ends with resource name (not ID pattern)
+            if "{" not in path.split("/")[-1]:
+                collection_paths.add(path)
+            if not isinstance(path_item, dict):
+                continue
+
+            path_ops = []
+            for method in HTTP_METHODS:
+                operation = path_item.get(method)
+                if not isinstance(operation, dict):
+                    continue
+                key = (path, method)
+                operations.append((path, method, operation))
+                path_ops.append((method, operation))
+                by_key[key] = operation
+                operation_id = operation.get("operationId")
+                if operation_id is not None:
+                    by_operation_id.setdefault(operation_id, key)
+                for tag in operation.get("tags", []):
+                    by_tag.setdefault(tag, []).append(key)
+            if path_ops:
+                by_path[path] = tuple(path_ops)
+
+        return cls(
+            operations=tuple(operations),
+            by_key=MappingProxyType(by_key),
+            by_path=MappingProxyType(by_path),
+            by_operation_id=MappingProxyType(by_operation_id),
+            by_tag=MappingProxyType({tag: tuple(keys) for tag, keys in by_tag.items()}),
+            operation_keys=frozenset(by_key),
+            collection_paths=frozenset(collection_paths),
+        )
+
+    def is_collection(self, path: str) -> bool:
+        """Check whether a path looks like a list (collection) endpoint."""
+        return path in self.collection_paths
+
+
+def structural_hash(value: Any) -> bytes:
+    """Hash a document subtree by content, independent of mapping key order.
+
+    Returns a fresh random digest for values that cannot be serialized
+    canonically (e.g. mixed int/str keys without orjson), so they never
+    compare equal.
+    """
+    try:
+        data = _canonical_json(value)
+    except (TypeError, ValueError):
+        return os.urandom(16)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+#: A ``$ref`` value in canonical JSON
+_REF = re.compile(rb'"\$ref":"((?:[^"\\]|\\.)*)"')
+
+_COMPONENTS_REF = "#/components/"
+_SCHEMAS_REF = "#/components/schemas/"
+
+_NO_REFS: frozenset[str] = frozenset()
+
+
+def _hash_with_refs(value: Any) -> tuple[bytes, frozenset[str]]:
+    """Get a subtree's structural hash and the targets of its refs.
+
+    Refs to component schemas are left out, since they are compared under
+    their own names. Other refs into ``components`` are reduced to the
+    component they point into (``#/components/parameters/Limit``); refs
+    elsewhere are kept as written.
+    """
+    try:
+        data = _canonical_json(value)
+    except (TypeError, ValueError):
+        return os.urandom(16), _NO_REFS
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    # Most subtrees only ref schemas: count instead of extracting
+    if data.count(b'"$ref":"') == data.count(b'"$ref":"#/components/schemas/'):
+        return digest, _NO_REFS
+    targets = map(_ref_target, set(_REF.findall(data)))
+    return digest, frozenset(t for t in targets if not t.startswith(_SCHEMAS_REF))
+
+
+def _ref_target(raw: bytes) -> str:
+    ref = json.loads(b'"' + raw + b'"') if b"\\" in raw else raw.decode()
+    if ref.startswith(_COMPONENTS_REF):
+        return "/".join(ref.split("/", 4)[:4])
+    return str(ref)
+
+
+def _combine(parts: Iterable[tuple[Any, bytes]]) -> bytes:
+    """Combine child digests into a parent (Merkle) digest, in key order."""
+    digest = hashlib.blake2b(digest_size=16)
+    for key, child in sorted(parts, key=lambda part: str(part[0])):
+        digest.update(str(key).encode())
+        digest.update(b"\0")
+        digest.update(child)
+    return digest.digest()
+
+
+@dataclass(frozen=True)
+class SpecHashes:
+    """Merkle-style structural hashes of a spec's paths and component schemas.
+
+    Each operation and component schema is hashed from its canonical JSON
+    form; path items and the ``paths``/``schemas`` collections combine their
+    children's digests. Equal digests mean equal subtrees, so a differ can
+    skip them without descending.
+
+    An operation's digest covers only its own text. The other components it
+    refers to (parameters, request bodies, responses, ...) are hashed one by
+    one, and the ref targets of operations and components are recorded, so
+    operations reaching a changed component can be found too (see
+    :meth:`changed_components`).
+    """
+
+    paths: bytes
+    path_items: Mapping[str, bytes]
+    operations: Mapping[OperationKey, bytes]
+    schemas: bytes
+    schema_items: Mapping[str, bytes]
+    components: Mapping[str, bytes]  # Keyed by pointer; all sections but schemas
+    operation_refs: Mapping[OperationKey, frozenset[str]]  # Operations with refs only
+    component_refs: Mapping[str, frozenset[str]]  # Components with refs only
+
+    @classmethod
+    def build(
+        cls,
+        paths: dict[str, Any],
+        schemas: dict[str, Any],
+        components: dict[str, Any] | None = None,
+    ) -> "SpecHashes":
+        """Hash a spec's ``paths``, ``components.schemas`` and other ``components``."""
+        path_items: dict[str, bytes] = {}
+        operations: dict[OperationKey, bytes] = {}
+        operation_refs: dict[OperationKey, frozenset[str]] = {}
+        for path, path_item in paths.items():
+            if not isinstance(path_item, dict):
+                path_items[path] = structural_hash(path_item)
+                continue
+            children = []
+            for key, value in path_item.items():
+                child, refs = _hash_with_refs(value)
+                if key in HTTP_METHODS and isinstance(value, dict):
+                    operations[(path, key)] = child
+                    if refs:
+                        operation_refs[(path, key)] = refs
+                children.append((key, child))
+            path_items[path] = _combine(children)
+
+        component_items: dict[str, bytes] = {}
+        component_refs: dict[str, frozenset[str]] = {}
+        for section, items in (components or {}).items():
+            if section == "schemas" or not isinstance(items, dict):
+                continue
+            for name, item in items.items():
+                pointer = f"{_COMPONENTS_REF}{section}/{escape_pointer_token(name)}"
+                component_items[pointer], refs = _hash_with_refs(item)
+                if refs:
+                    component_refs[pointer] = refs
+
+        schema_items = {name: structural_hash(schema) for name, schema in schemas.items()}
+        return cls(
+            paths=_combine(path_items.items()),
+            path_items=MappingProxyType(path_items),
+            operations=MappingProxyType(operations),
+            schemas=_combine(schema_items.items()),
+            schema_items=MappingProxyType(schema_items),
+            components=MappingProxyType(component_items),
+            operation_refs=MappingProxyType(operation_refs),
+            component_refs=MappingProxyType(component_refs),
+        )
+
+    def changed_components(self, other: "SpecHashes") -> frozenset[str]:
+        """Get components (other than schemas) whose content differs from ``other``'s.
+
+        A component also counts as changed when it refers to a changed one;
+        components with equal text have equal refs, so changes are propagated
+        along this spec's refs.
+        """
+        changed = {
+            pointer
+            for pointer in self.components.keys() | other.components.keys()
+            if self.components.get(pointer) != other.components.get(pointer)
+        }
+        propagating = True
+        while propagating:
+            propagating = False
+            for pointer, targets in self.component_refs.items():
+                if pointer not in changed and refs_reach(targets, changed):
+                    changed.add(pointer)
+                    propagating = True
+        return frozenset(changed)
+
+
+def refs_reach(targets: Iterable[str], changed: Collection[str]) -> bool:
+    """Check whether ref targets include a changed component.
+
+    Targets outside ``components`` (other documents, other parts of the spec)
+    are not hashed, so they always count as possibly changed.
+    """
+    return any(target in changed or not target.startswith(_COMPONENTS_REF) for target in targets)
+
+
 class OpenAPIParser:
     """Parser for OpenAPI specifications."""
 
-    def __init__(self, spec_path: str | Path):
-        """Initialize parser with spec path."""
+    def __init__(
+        self,
+        spec_path: str | Path,
+        cache: DiskCache | None = None,
+        positions: bool = False,
+        documents: "DocumentCache | None" = None,
+    ):
+        """Initialize parser with spec path.
+
+        Args:
+            spec_path: Path to the OpenAPI spec file
+            cache: Optional parsed-spec cache keyed by file content hash
+            positions: Index source positions while loading (see ``source_map``)
+            documents: Cache of documents loaded for external refs (optional,
+                created on first use and shared with referenced documents)
+        """
         self.spec_path = Path(spec_path)
+        self.cache = cache
+        self.positions = positions
+        self.documents = documents
         self._spec: dict[str, Any] | None = None
+        self._source_map: SourceMap | None = None
+        self._ref_resolver: RefResolver | None = None
+        self._operation_index: OperationIndex | None = None
+        self._hashes: SpecHashes | None = None
+        self.git_blob: GitBlob | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Derived indexes are rebuilt on demand, e.g. in a worker process
+        state = self.__dict__.copy()
+        state["_operation_index"] = None
+        state["_hashes"] = None
+        return state
+
+    @classmethod
+    def from_spec(
+        cls,
+        spec: dict[str, Any],
+        spec_path: str | Path = "<memory>",
+        source_map: SourceMap | None = None,
+    ) -> "OpenAPIParser":
+        """Create a parser around an already-loaded spec document."""
+        parser = cls(spec_path)
+        parser._spec = spec
+        parser._source_map = source_map
+        return parser
+
+    @classmethod
+    def from_git(
+        cls, blob: GitBlob, cache: DiskCache | None = None, positions: bool = False
+    ) -> "OpenAPIParser":
+        """Create a parser for a spec stored at a git revision.
+
+        The content is read from the object store, without temp files. With a
+        cache, parsed specs are keyed by blob SHA, so an unchanged blob is
+        neither read nor parsed again. Relative file refs resolve against the
+        working tree.
+        """
+        parser = cls(blob.worktree_path, cache=cache, positions=positions)
+        parser.git_blob = blob
+        return parser
 
     def parse(self) -> dict[str, Any]:
         """Parse the OpenAPI spec file."""
         if self._spec is not None:
             return self._spec
 
-        if not self.spec_path.exists():
+        source: object = self.spec_path
+        read = self.spec_path.read_bytes
+        identity: tuple[str, ...] = ()
+        if self.git_blob is not None:
+            source, read = self.git_blob, self.git_blob.read
+            identity = ("blob", self.git_blob.sha)
+        elif not self.spec_path.exists():
             raise OpenAPIParseError(f"Spec file not found: {self.spec_path}")
 
         try:
-            content = self.spec_path.read_text()
-            if self.spec_path.suffix in (".yaml", ".yml"):
-                self._spec = yaml.safe_load(content)
-            elif self.spec_path.suffix == ".json":
-                import json
-
-                self._spec = json.loads(content)
-            else:
-                # Try YAML first, then JSON
-                try:
-                    self._spec = yaml.safe_load(content)
-                except yaml.YAMLError:
-                    import json
-
-                    self._spec = json.loads(content)
+            self._spec = self._load(read, *identity)
         except Exception as e:
-            raise OpenAPIParseError(f"Failed to parse {self.spec_path}: {e}") from e
+            raise OpenAPIParseError(f"Failed to parse {source}: {e}") from e
 
         if self._spec is None:
-            raise OpenAPIParseError(f"Failed to parse {self.spec_path}: empty or invalid content")
+            raise OpenAPIParseError(f"Failed to parse {source}: empty or invalid content")
         return self._spec
 
+    def _load(self, read: Callable[[], bytes], *identity: str) -> Any:
+        """Load spec content, going through the parsed-spec cache if enabled.
+
+        Args:
+            read: Returns the document content
+            *identity: Parts identifying the content exactly (e.g. a git blob
+                SHA) to key the cache by instead of the content, so that
+                ``read`` is only called on a cache miss
+        """
+        suffix = self.spec_path.suffix
+        if self.cache is None:
+            if not self.positions:
+                return load_document(read().decode(), suffix)
+            spec, self._source_map = load_document_with_positions(read().decode(), suffix)
+            return spec
+
+        content = b"" if identity else read()
+        key_source: tuple[bytes | str, ...] = identity or (content,)
+        if not self.positions:
+            key = content_hash(__version__, suffix, *key_source)
+            spec = self.cache.get(key)
+            if spec is None:
+                spec = load_document((content or read()).decode(), suffix)
+                if spec is not None:
+                    self._cache_put(key, spec)
+            return spec
+
+        key = content_hash(__version__, "positions", suffix, *key_source)
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = load_document_with_positions((content or read()).decode(), suffix)
+            if entry[0] is not None:
+                self._cache_put(key, entry)
+        spec, self._source_map = entry
+        return spec
+
+    def _cache_put(self, key: str, value: Any) -> None:
+        assert self.cache is not None
+        try:
+            self.cache.put(key, value)
+        except OSError:
+            pass  # Caching is best-effort
+
     @property
     def spec(self) -> dict[str, Any]:
         """Get parsed spec."""
@@ -59,6 +486,13 @@ class OpenAPIParser:
         assert self._spec is not None
         return self._spec
 
+    @property
+    def source_map(self) -> SourceMap | None:
+        """Get source positions of spec nodes, or None if positions are disabled."""
+        if self.positions and self._spec is None:
+            self.parse()
+        return self._source_map
+
     @property
     def version(self) -> str:
         """Get OpenAPI version."""
@@ -84,48 +518,214 @@ class OpenAPIParser:
         """Get global security requirements."""
         return cast(list[dict[str, Any]], self.spec.get("security", []))
 
+    @property
+    def operation_index(self) -> OperationIndex:
+        """Get the operation index, building it on first access."""
+        if self._operation_index is None:
+            self._operation_index = OperationIndex.build(self.paths)
+        return self._operation_index
+
+    @property
+    def hashes(self) -> SpecHashes:
+        """Get structural hashes of paths and schemas, computed on first access."""
+        if self._hashes is None:
+            components = self.components
+            self._hashes = SpecHashes.build(self.paths, components.get("schemas", {}), components)
+        return self._hashes
+
     def get_operations(self) -> list[tuple[str, str, dict[str, Any]]]:
         """Get all operations as (path, method, operation) tuples."""
-        operations = []
-        for path, path_item in self.paths.items():
-            for method in ("get", "post", "put", "patch", "delete", "options", "head"):
-                if method in path_item:
-                    operations.append((path, method, path_item[method]))
-        return operations
+        return list(self.operation_index.operations)
+
+    @property
+    def ref_resolver(self) -> RefResolver:
+        """Get the memoizing $ref resolver for this spec."""
+        if self._ref_resolver is None:
+            if self.documents is None:
+                self.documents = DocumentCache(self.cache)
+            self.documents.add(self)
+            self._ref_resolver = RefResolver(self.spec, self.spec_path, self.documents)
+        return self._ref_resolver
 
     def resolve_ref(self, ref: str) -> dict[str, Any]:
         """Resolve a $ref reference."""
-        if not ref.startswith("#/"):
-            raise OpenAPIParseError(f"External refs not supported: {ref}")
-
-        parts = ref[2:].split("/")
-        value = self.spec
-        for part in parts:
-            if isinstance(value, dict):
-                value = value.get(part, {})
-            else:
-                return {}
-        return value
+        target = self.ref_resolver.resolve(ref)
+        if target.error is not None:
+            raise OpenAPIParseError(target.error)
+        return cast(dict[str, Any], target.value) if target.found else {}
 
     def validate_refs(self) -> list[str]:
-        """Validate all internal references are resolvable."""
-        errors = []
+        """Validate all references are resolvable.
+
+        Refs in documents loaded through external refs are validated too, with
+        their locations prefixed by the document path.
+        """
+        errors = self._validate_document_refs("")
+        if self.documents is None:
+            return errors
 
-        def check_refs(obj: Any, path: str = "") -> None:
-            if isinstance(obj, dict):
+        root = self.spec_path.resolve()
+        done = {root}
+        while pending := [path for path in self.documents.paths if path not in done]:
+            for path in pending:
+                done.add(path)
+                prefix = os.path.relpath(path, root.parent) + ":"
+                errors.extend(self.documents.get(path)._validate_document_refs(prefix))
+        return errors
+
+    def _validate_document_refs(self, prefix: str) -> list[str]:
+        """Validate the refs of this document.
+
+        The spec is walked iteratively, so nesting depth is not bounded by the
+        recursion limit. Each container only records a (parent, key) link;
+        the location string is built only for refs that fail validation.
+        Referenced files are loaded in parallel before refs are checked.
+        """
+        refs: list[tuple[Any, Any]] = []
+        # Stack entries: (node, link), where link is (parent link, key, is list index)
+        spec = self.spec
+        stack: list[tuple[Any, Any]] = [(spec, None)] if type(spec) in _CONTAINERS else []
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            obj, link = pop()
+            if type(obj) is dict:
                 if "$ref" in obj:
-                    ref = obj["$ref"]
-                    try:
-                        resolved = self.resolve_ref(ref)
-                        if not resolved:
-                            errors.append(f"Unresolved ref at {path}: {ref}")
-                    except OpenAPIParseError as e:
-                        errors.append(f"Invalid ref at {path}: {e}")
-                for key, value in obj.items():
-                    check_refs(value, f"{path}.{key}")
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    check_refs(item, f"{path}[{i}]")
-
-        check_refs(self.spec)
+                    refs.append((obj["$ref"], link))
+                # Push in reverse so refs are collected in document order
+                for key, value in reversed(obj.items()):
+                    if type(value) in _CONTAINERS:
+                        push((value, (link, key, False)))
+            else:
+                for i in range(len(obj) - 1, -1, -1):
+                    item = obj[i]
+                    if type(item) in _CONTAINERS:
+                        push((item, (link, i, True)))
+
+        resolver = self.ref_resolver
+        resolver.prefetch(ref for ref, _ in refs if isinstance(ref, str) and ref[:1] != "#")
+        errors = []
+        for ref, link in refs:
+            target = resolver.check(ref) if isinstance(ref, str) else None
+            if target is None:
+                errors.append(f"Invalid ref at {prefix}{_location(link)}: $ref must be a string")
+            elif target.error is not None:
+                errors.append(f"Invalid ref at {prefix}{_location(link)}: {target.error}")
+            elif not target.resolved:
+                errors.append(f"Unresolved ref at {prefix}{_location(link)}: {ref}")
         return errors
+
+
+class DocumentCache:
+    """Loads each document referenced through ``$ref`` at most once.
+
+    Documents are keyed by resolved path and parsed through the optional
+    parsed-spec disk cache, so unchanged files are not re-parsed across runs
+    either. Sibling files referenced from one document are loaded in
+    parallel threads.
+    """
+
+    def __init__(self, cache: DiskCache | None = None, max_workers: int = 8):
+        """Initialize document cache.
+
+        Args:
+            cache: Optional parsed-spec cache shared by all loaded documents
+            max_workers: Maximum threads used to prefetch referenced files
+        """
+        self.cache = cache
+        self.max_workers = max_workers
+        self._parsers: dict[Path, OpenAPIParser] = {}
+        self._errors: dict[Path, OpenAPIParseError] = {}
+        self._stamps: dict[Path, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks cannot be pickled, e.g. when a parser is sent to a worker process
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def paths(self) -> list[Path]:
+        """Get the resolved paths of all loaded documents, in load order."""
+        with self._lock:
+            return list(self._parsers)
+
+    def add(self, parser: OpenAPIParser) -> None:
+        """Register an already loaded document, e.g. the root spec."""
+        with self._lock:
+            self._parsers.setdefault(parser.spec_path.resolve(), parser)
+
+    def get(self, path: Path) -> OpenAPIParser:
+        """Get the parser for a document, loading it on first use.
+
+        Raises:
+            OpenAPIParseError: If the document cannot be loaded
+        """
+        key = path.resolve()
+        with self._lock:
+            if key in self._parsers:
+                return self._parsers[key]
+            if key in self._errors:
+                raise self._errors[key]
+
+        parser = OpenAPIParser(key, cache=self.cache, documents=self)
+        try:
+            stat = key.stat()
+            parser.parse()
+        except (OSError, OpenAPIParseError) as e:
+            error = e if isinstance(e, OpenAPIParseError) else OpenAPIParseError(str(e))
+            with self._lock:
+                self._errors[key] = error
+            raise error from e
+
+        with self._lock:
+            self._stamps.setdefault(key, (stat.st_mtime_ns, stat.st_size))
+            return self._parsers.setdefault(key, parser)
+
+    def resolver(self, path: Path) -> RefResolver:
+        """Get the ref resolver of a document, loading it on first use."""
+        return self.get(path).ref_resolver
+
+    def prefetch(self, paths: Iterable[Path]) -> None:
+        """Load documents in parallel; load errors surface later from ``get``."""
+        with self._lock:
+            pending = [p for p in set(paths) if p not in self._parsers and p not in self._errors]
+        if len(pending) < 2:
+            return  # Loaded on demand
+
+        def load(path: Path) -> None:
+            try:
+                self.get(path)
+            except OpenAPIParseError:
+                pass
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+            list(executor.map(load, pending))
+
+    def is_stale(self) -> bool:
+        """Check whether any loaded referenced document changed on disk."""
+        with self._lock:
+            stamps = list(self._stamps.items())
+        for path, stamp in stamps:
+            try:
+                stat = path.stat()
+            except OSError:
+                return True
+            if (stat.st_mtime_ns, stat.st_size) != stamp:
+                return True
+        return False
+
+
+def _location(link: Any) -> str:
+    """Materialize a validate_refs location link as ``.key[index]`` text."""
+    parts = []
+    while link is not None:
+        link, key, is_index = link
+        parts.append(f"[{key}]" if is_index else f".{key}")
+    return "".join(reversed(parts))
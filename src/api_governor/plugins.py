@@ -4,9 +4,12 @@ import importlib.util
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Any
 
-from .models import Finding, PolicyConfig, Severity
+from .executors import RuleExecutor, RuleTask, run_tasks
+from .models import Finding, PolicyConfig, Severity, Template, http_method
 from .parser import OpenAPIParser
+from .traversal import SpecVisitor, SpecWalker
 
 
 class RulePlugin(ABC):
@@ -35,6 +38,11 @@ class RulePlugin(ABC):
         """Default severity for findings from this rule."""
         return Severity.MINOR
 
+    @property
+    def version(self) -> str:
+        """Rule version; bump when rule logic changes to invalidate cached results."""
+        return "1.0"
+
     @abstractmethod
     def check(self, spec: OpenAPIParser, policy: PolicyConfig) -> list[Finding]:
         """Run the rule check on the spec.
@@ -48,6 +56,30 @@ class RulePlugin(ABC):
         """
         pass
 
+    def create_visitor(self, policy: PolicyConfig) -> SpecVisitor | None:
+        """Create a visitor that evaluates this rule during a shared traversal.
+
+        Plugins that return a visitor are evaluated in the same single pass
+        over the spec as the other visitor-based plugins. The default returns
+        None, in which case ``check`` is called instead.
+
+        Args:
+            policy: Policy configuration
+
+        Returns:
+            Visitor collecting this rule's findings, or None
+        """
+        return None
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Plugins loaded from files live in modules that worker processes
+        # started by spawn or forkserver cannot import by name
+        cls = type(self)
+        path = _plugin_files.get(cls.__module__)
+        if path is None:
+            return super().__reduce_ex__(protocol)
+        return _restore_plugin, (cls.__module__, str(path), cls.__qualname__, vars(self))
+
 
 class PluginManager:
     """Manages loading and running custom rule plugins."""
@@ -76,14 +108,7 @@ class PluginManager:
         if not path.exists():
             raise FileNotFoundError(f"Plugin file not found: {path}")
 
-        # Load module from file
-        spec = importlib.util.spec_from_file_location(path.stem, path)
-        if spec is None or spec.loader is None:
-            raise ImportError(f"Failed to load plugin: {path}")
-
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[path.stem] = module
-        spec.loader.exec_module(module)
+        module = _import_file(path.stem, path)
 
         # Find all RulePlugin subclasses in module
         for attr_name in dir(module):
@@ -109,34 +134,78 @@ class PluginManager:
             except Exception as e:
                 print(f"Warning: Failed to load plugin {plugin_file}: {e}")
 
-    def run_all(self, spec: OpenAPIParser, policy: PolicyConfig) -> list[Finding]:
+    def run_all(
+        self, spec: OpenAPIParser, policy: PolicyConfig, executor: RuleExecutor | None = None
+    ) -> list[Finding]:
         """Run all registered plugins.
 
         Args:
             spec: Parsed OpenAPI specification
             policy: Policy configuration
+            executor: Runs each plugin as a separate task when parallel
+                (optional; by default visitor plugins share one traversal
+                and the others run one after another)
 
         Returns:
-            Combined list of findings from all plugins
+            Combined list of findings from all plugins, in registration order
         """
+        if executor is not None and executor.parallel:
+            return run_tasks(executor, spec, self.tasks(policy))
+
         findings: list[Finding] = []
 
+        # Visitor-based plugins share a single traversal of the spec
+        walker = SpecWalker()
+        visitors: dict[int, SpecVisitor] = {}
+        setup_errors: dict[int, Exception] = {}
+        for plugin in self._plugins:
+            try:
+                visitor = plugin.create_visitor(policy)
+            except Exception as e:
+                setup_errors[id(plugin)] = e
+                continue
+            if visitor is not None:
+                visitors[id(plugin)] = visitor
+                walker.add(visitor, isolate=True)
+        if visitors:
+            walker.walk(spec)
+
         for plugin in self._plugins:
+            if id(plugin) in setup_errors:
+                findings.append(self._error_finding(plugin, setup_errors[id(plugin)]))
+                continue
+
+            visitor = visitors.get(id(plugin))
+            if visitor is not None:
+                error = walker.error_for(visitor)
+                if error is not None:
+                    findings.append(self._error_finding(plugin, error))
+                else:
+                    findings.extend(visitor.findings)
+                continue
+
             try:
                 plugin_findings = plugin.check(spec, policy)
                 findings.extend(plugin_findings)
             except Exception as e:
                 # Add error as a finding
-                findings.append(
-                    Finding(
-                        rule_id=f"PLUGIN_ERROR_{plugin.rule_id}",
-                        severity=Severity.INFO,
-                        message=f"Plugin {plugin.name} failed: {e}",
-                    )
-                )
+                findings.append(self._error_finding(plugin, e))
 
         return findings
 
+    def tasks(self, policy: PolicyConfig) -> list[RuleTask]:
+        """Get one task per plugin, for running plugins on an executor."""
+        return [RuleTask(plugin.rule_id, _run_plugin, (plugin, policy)) for plugin in self._plugins]
+
+    @staticmethod
+    def _error_finding(plugin: RulePlugin, error: Exception) -> Finding:
+        """Create a finding reporting a plugin failure."""
+        return Finding(
+            rule_id=f"PLUGIN_ERROR_{plugin.rule_id}",
+            severity=Severity.INFO,
+            message=f"Plugin {plugin.name} failed: {error}",
+        )
+
     @property
     def plugins(self) -> list[RulePlugin]:
         """Get all registered plugins."""
@@ -157,12 +226,115 @@ class PluginManager:
         return None
 
 
+# Files of modules loaded by PluginManager.load_from_file, by module name
+_plugin_files: dict[str, Path] = {}
+
+
+def _import_file(name: str, path: Path) -> Any:
+    """Import a Python file as a module registered under the given name."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Failed to load plugin: {path}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    _plugin_files[name] = path.resolve()
+    return module
+
+
+def _restore_plugin(
+    module_name: str, path: str, qualname: str, state: dict[str, Any]
+) -> RulePlugin:
+    """Unpickle a file-loaded plugin, importing its file first if needed."""
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = _import_file(module_name, Path(path))
+    cls: Any = module
+    for name in qualname.split("."):
+        cls = getattr(cls, name)
+    plugin: RulePlugin = cls.__new__(cls)
+    vars(plugin).update(state)
+    return plugin
+
+
+def _run_plugin(spec: OpenAPIParser, task: tuple[RulePlugin, PolicyConfig]) -> list[Finding]:
+    """Run one plugin on its own, reporting a failure as a finding."""
+    plugin, policy = task
+    try:
+        visitor = plugin.create_visitor(policy)
+        if visitor is None:
+            return plugin.check(spec, policy)
+        return SpecWalker([visitor]).run(spec)
+    except Exception as e:
+        return [PluginManager._error_finding(plugin, e)]
+
+
 # Example built-in plugins
 
 
-class RequireDescriptionRule(RulePlugin):
+class PluginVisitor(SpecVisitor):
+    """Visitor base for plugins evaluated during the shared traversal."""
+
+    def __init__(self, plugin: RulePlugin, policy: PolicyConfig):
+        """Initialize visitor for a plugin."""
+        super().__init__()
+        self.plugin = plugin
+        self.policy = policy
+        self.rule_id = plugin.rule_id
+        self.severity = plugin.default_severity
+
+
+class VisitorRulePlugin(RulePlugin):
+    """Plugin whose rule logic lives in a :class:`PluginVisitor`."""
+
+    visitor_class: type[PluginVisitor]
+
+    def create_visitor(self, policy: PolicyConfig) -> SpecVisitor | None:
+        return self.visitor_class(self, policy)
+
+    def check(self, spec: OpenAPIParser, policy: PolicyConfig) -> list[Finding]:
+        visitor = self.create_visitor(policy)
+        assert visitor is not None
+        return SpecWalker([visitor]).run(spec)
+
+
+# Finding text shared by every finding of a built-in plugin; args are
+# (path, method, METHOD, ...)
+_OPERATION_PATH = Template("{0}.{1}")
+_REQUEST_BODY_PATH = Template("{0}.{1}.requestBody")
+_RESPONSE_PATH = Template("{0}.{1}.responses.{3}")
+_DESCRIPTION_MESSAGE = Template("Operation {2} {0} missing description")
+_REQUEST_EXAMPLE_MESSAGE = Template("Request body missing example: {2} {0}")
+_RESPONSE_EXAMPLE_MESSAGE = Template("Response {3} missing example: {2} {0}")
+_PATH_DEPTH_MESSAGE = Template("Path exceeds max depth of {1}: {0}")
+_PATH_DEPTH_RECOMMENDATION = Template("Consider flattening the path structure to max {1} segments")
+
+
+class _RequireDescriptionVisitor(PluginVisitor):
+    scope = "path"
+    inputs = ()
+
+    def visit_operation(self, path: str, method: str, operation: dict[str, Any]) -> None:
+        if not operation.get("description"):
+            self.findings.append(
+                Finding(
+                    rule_id=self.rule_id,
+                    severity=self.severity,
+                    message=_DESCRIPTION_MESSAGE,
+                    path=_OPERATION_PATH,
+                    line=self.line_of("paths", path, method),
+                    recommendation="Add a description field to document the operation",
+                    args=(path, method, http_method(method)),
+                )
+            )
+
+
+class RequireDescriptionRule(VisitorRulePlugin):
     """Ensures all operations have descriptions."""
 
+    visitor_class = _RequireDescriptionVisitor
+
     @property
     def rule_id(self) -> str:
         return "CUSTOM_REQUIRE_DESCRIPTION"
@@ -179,27 +351,55 @@ class RequireDescriptionRule(RulePlugin):
     def default_severity(self) -> Severity:
         return Severity.MINOR
 
-    def check(self, spec: OpenAPIParser, policy: PolicyConfig) -> list[Finding]:
-        findings: list[Finding] = []
 
-        for path, method, operation in spec.get_operations():
-            if not operation.get("description"):
-                findings.append(
+class _RequireExamplesVisitor(PluginVisitor):
+    scope = "path"
+    inputs = ()
+
+    def visit_operation(self, path: str, method: str, operation: dict[str, Any]) -> None:
+        # Check request body
+        request_body = operation.get("requestBody", {})
+        content = request_body.get("content", {})
+        for _media_type, schema_data in content.items():
+            schema = schema_data.get("schema", {})
+            if not schema_data.get("example") and not schema.get("example"):
+                self.findings.append(
                     Finding(
                         rule_id=self.rule_id,
-                        severity=self.default_severity,
-                        message=f"Operation {method.upper()} {path} missing description",
-                        path=f"{path}.{method}",
-                        recommendation="Add a description field to document the operation",
+                        severity=self.severity,
+                        message=_REQUEST_EXAMPLE_MESSAGE,
+                        path=_REQUEST_BODY_PATH,
+                        line=self.line_of("paths", path, method, "requestBody"),
+                        recommendation="Add an example to the request body schema",
+                        args=(path, method, http_method(method)),
                     )
                 )
 
-        return findings
+    def visit_response(
+        self, path: str, method: str, status_code: str, response: dict[str, Any]
+    ) -> None:
+        response_content = response.get("content", {})
+        for _media_type, schema_data in response_content.items():
+            schema = schema_data.get("schema", {})
+            if not schema_data.get("example") and not schema.get("example"):
+                self.findings.append(
+                    Finding(
+                        rule_id=self.rule_id,
+                        severity=self.severity,
+                        message=_RESPONSE_EXAMPLE_MESSAGE,
+                        path=_RESPONSE_PATH,
+                        line=self.line_of("paths", path, method, "responses", status_code),
+                        recommendation="Add an example to the response schema",
+                        args=(path, method, http_method(method), status_code),
+                    )
+                )
 
 
-class RequireExamplesRule(RulePlugin):
+class RequireExamplesRule(VisitorRulePlugin):
     """Ensures request/response schemas have examples."""
 
+    visitor_class = _RequireExamplesVisitor
+
     @property
     def rule_id(self) -> str:
         return "CUSTOM_REQUIRE_EXAMPLES"
@@ -216,48 +416,37 @@ class RequireExamplesRule(RulePlugin):
     def default_severity(self) -> Severity:
         return Severity.INFO
 
-    def check(self, spec: OpenAPIParser, policy: PolicyConfig) -> list[Finding]:
-        findings: list[Finding] = []
-
-        for path, method, operation in spec.get_operations():
-            # Check request body
-            request_body = operation.get("requestBody", {})
-            content = request_body.get("content", {})
-            for _media_type, schema_data in content.items():
-                schema = schema_data.get("schema", {})
-                if not schema_data.get("example") and not schema.get("example"):
-                    findings.append(
-                        Finding(
-                            rule_id=self.rule_id,
-                            severity=self.default_severity,
-                            message=f"Request body missing example: {method.upper()} {path}",
-                            path=f"{path}.{method}.requestBody",
-                            recommendation="Add an example to the request body schema",
-                        )
-                    )
-
-            # Check responses
-            for status_code, response in operation.get("responses", {}).items():
-                response_content = response.get("content", {})
-                for _media_type, schema_data in response_content.items():
-                    schema = schema_data.get("schema", {})
-                    if not schema_data.get("example") and not schema.get("example"):
-                        findings.append(
-                            Finding(
-                                rule_id=self.rule_id,
-                                severity=self.default_severity,
-                                message=f"Response {status_code} missing example: {method.upper()} {path}",
-                                path=f"{path}.{method}.responses.{status_code}",
-                                recommendation="Add an example to the response schema",
-                            )
-                        )
 
-        return findings
+class _MaxPathDepthVisitor(PluginVisitor):
+    scope = "path"
+    inputs = ()
+
+    def __init__(self, plugin: RulePlugin, policy: PolicyConfig):
+        super().__init__(plugin, policy)
+        self.max_depth = policy.get("custom_rules.max_path_depth", 5)
+
+    def visit_path(self, path: str, path_item: dict[str, Any]) -> None:
+        # Count path segments (excluding empty strings from leading/trailing slashes)
+        segments = [s for s in path.split("/") if s]
+        if len(segments) > self.max_depth:
+            self.findings.append(
+                Finding(
+                    rule_id=self.rule_id,
+                    severity=self.severity,
+                    message=_PATH_DEPTH_MESSAGE,
+                    path=path,
+                    line=self.line_of("paths", path),
+                    recommendation=_PATH_DEPTH_RECOMMENDATION,
+                    args=(path, self.max_depth),
+                )
+            )
 
 
-class MaxPathDepthRule(RulePlugin):
+class MaxPathDepthRule(VisitorRulePlugin):
     """Enforces maximum path depth."""
 
+    visitor_class = _MaxPathDepthVisitor
+
     @property
     def rule_id(self) -> str:
         return "CUSTOM_MAX_PATH_DEPTH"
@@ -274,26 +463,6 @@ class MaxPathDepthRule(RulePlugin):
     def default_severity(self) -> Severity:
         return Severity.MINOR
 
-    def check(self, spec: OpenAPIParser, policy: PolicyConfig) -> list[Finding]:
-        findings: list[Finding] = []
-        max_depth = policy.get("custom_rules.max_path_depth", 5)
-
-        for path in spec.paths.keys():
-            # Count path segments (excluding empty strings from leading/trailing slashes)
-            segments = [s for s in path.split("/") if s]
-            if len(segments) > max_depth:
-                findings.append(
-                    Finding(
-                        rule_id=self.rule_id,
-                        severity=self.default_severity,
-                        message=f"Path exceeds max depth of {max_depth}: {path}",
-                        path=path,
-                        recommendation=f"Consider flattening the path structure to max {max_depth} segments",
-                    )
-                )
-
-        return findings
-
 
 # Default plugin manager instance
 default_manager = PluginManager()
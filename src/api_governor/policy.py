@@ -0,0 +1,69 @@
+"""Policy validation against the policy JSON schema."""
+
+import json
+from functools import cache
+from importlib import resources
+from pathlib import Path
+from typing import Any
+
+import jsonschema
+
+SCHEMA_NAME = "policy.schema.json"
+
+#: Schema location in a source checkout; wheels ship a copy inside the package
+SCHEMA_PATH = Path(__file__).parent.parent.parent / "schemas" / SCHEMA_NAME
+
+#: Values :class:`PolicyConfig` uses for top-level settings a policy leaves out
+POLICY_DEFAULTS: dict[str, Any] = {"policy_name": "Unknown", "policy_version": "0.0"}
+
+
+class PolicyError(ValueError):
+    """Raised when a policy is malformed or violates the policy schema."""
+
+
+def _schema_text() -> str:
+    """Read the policy schema from the installed package or the source checkout.
+
+    Raises:
+        FileNotFoundError: If the schema is in neither place
+    """
+    packaged = resources.files(__package__).joinpath(SCHEMA_NAME)
+    if packaged.is_file():
+        return packaged.read_text()
+    if SCHEMA_PATH.exists():
+        return SCHEMA_PATH.read_text()
+    raise FileNotFoundError(f"Policy schema not found: {SCHEMA_NAME} (broken installation?)")
+
+
+@cache
+def _validator() -> jsonschema.Draft7Validator:
+    """Get a validator for the policy schema."""
+    return jsonschema.Draft7Validator(json.loads(_schema_text()))
+
+
+def validate_policy(data: Any, source: str = "policy") -> None:
+    """Validate policy data against ``schemas/policy.schema.json``.
+
+    Top-level settings that :class:`PolicyConfig` defaults
+    (:data:`POLICY_DEFAULTS`) may be left out, so partial policies are valid.
+
+    Args:
+        data: Policy data as loaded from YAML
+        source: Name of the policy for error messages
+
+    Raises:
+        PolicyError: If the data is not a mapping or violates the schema
+        FileNotFoundError: If the policy schema is missing from the installation
+    """
+    if not isinstance(data, dict):
+        raise PolicyError(f"Invalid policy {source}: expected a mapping")
+    errors = sorted(
+        _validator().iter_errors({**POLICY_DEFAULTS, **data}),
+        key=lambda e: [str(part) for part in e.absolute_path],
+    )
+    if errors:
+        details = "; ".join(
+            f"{'.'.join(str(part) for part in e.absolute_path) or '<root>'}: {e.message}"
+            for e in errors
+        )
+        raise PolicyError(f"Invalid policy {source}: {details}")
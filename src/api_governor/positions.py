@@ -0,0 +1,170 @@
+"""Source positions for parsed spec nodes."""
+
+from collections.abc import Iterable
+from typing import Any
+
+import yaml
+
+
+def escape_pointer_token(token: str | int) -> str:
+    """Escape one JSON pointer reference token (RFC 6901)."""
+    token = str(token)
+    if "~" in token or "/" in token:
+        token = token.replace("~", "~0").replace("/", "~1")
+    return token
+
+
+def json_pointer(parts: Iterable[str | int]) -> str:
+    """Build a JSON pointer from unescaped reference tokens."""
+    return "".join("/" + escape_pointer_token(part) for part in parts)
+
+
+class SourceMap:
+    """Compact index from JSON pointers to 1-based (line, column) positions.
+
+    Only mappings and sequences are indexed (at the position of their key or
+    list item); scalars resolve to the nearest indexed ancestor. Positions
+    are packed into a single int per node to keep the index small.
+    """
+
+    __slots__ = ("_positions",)
+
+    _SHIFT = 32
+
+    def __init__(self, positions: dict[str, int] | None = None):
+        """Initialize with packed positions keyed by JSON pointer."""
+        self._positions = positions or {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getstate__(self) -> dict[str, int]:
+        return self._positions
+
+    def __setstate__(self, state: dict[str, int]) -> None:
+        self._positions = state
+
+    @classmethod
+    def pack(cls, line: int, column: int) -> int:
+        """Pack a 1-based line and column into one int."""
+        return (line << cls._SHIFT) | column
+
+    @classmethod
+    def combine(cls, parts: Iterable[tuple["SourceMap", int]]) -> "SourceMap":
+        """Merge the source maps of document fragments into one.
+
+        Args:
+            parts: (source map, line offset) pairs; later parts win when
+                several index the same pointer
+
+        Returns:
+            Source map of the whole document
+        """
+        positions: dict[str, int] = {}
+        for source_map, offset in parts:
+            shift = offset << cls._SHIFT
+            if shift:
+                positions.update((k, v + shift) for k, v in source_map._positions.items())
+            else:
+                positions.update(source_map._positions)
+        return cls(positions)
+
+    def get(self, pointer: str) -> tuple[int, int] | None:
+        """Get the exact position of a node, or None if it is not indexed."""
+        packed = self._positions.get(pointer)
+        if packed is None:
+            return None
+        return packed >> self._SHIFT, packed & ((1 << self._SHIFT) - 1)
+
+    def locate(self, *parts: str | int) -> tuple[int, int] | None:
+        """Get the position of a node or of its nearest indexed ancestor.
+
+        Args:
+            *parts: Unescaped reference tokens, e.g. ``("paths", "/users", "get")``
+
+        Returns:
+            (line, column), or None when no ancestor is indexed
+        """
+        tokens = [escape_pointer_token(part) for part in parts]
+        while tokens:
+            position = self.get("/" + "/".join(tokens))
+            if position is not None:
+                return position
+            tokens.pop()
+        return None
+
+    def line(self, *parts: str | int) -> int | None:
+        """Get the 1-based line of a node or of its nearest indexed ancestor."""
+        position = self.locate(*parts)
+        return position[0] if position else None
+
+
+def load_yaml_with_positions(content: str, loader: type[Any]) -> tuple[Any, SourceMap]:
+    """Load a YAML (or JSON) document and index its node positions.
+
+    The document is composed once; the position index is taken from the
+    composed node graph before it is constructed into Python objects, so no
+    second parse is needed.
+
+    Args:
+        content: Document text
+        loader: PyYAML loader class (e.g. ``CSafeLoader``)
+
+    Returns:
+        Tuple of (document, source map)
+    """
+    instance = loader(content)
+    try:
+        node = instance.get_single_node()
+        if node is None:
+            return None, SourceMap()
+        # Without anchors no node can be reached twice, so skip alias tracking
+        source_map = _index_nodes(node, track_aliases="&" in content)
+        return instance.construct_document(node), source_map
+    finally:
+        instance.dispose()
+
+
+def _index_nodes(root: yaml.Node, track_aliases: bool = True) -> SourceMap:
+    shift = SourceMap._SHIFT
+    scalar = yaml.ScalarNode
+    mapping = yaml.MappingNode
+    sequence = yaml.SequenceNode
+    positions: dict[str, int] = {}
+    seen: set[int] | None = set() if track_aliases else None
+    stack: list[tuple[yaml.Node, str]] = [(root, "")]
+    pop = stack.pop
+    push = stack.append
+
+    # Hot loop: exact type checks and inlined token escaping
+    while stack:
+        node, pointer = pop()
+        if seen is not None:
+            if id(node) in seen:
+                continue  # Alias of an already indexed node
+            seen.add(id(node))
+
+        node_type = type(node)
+        if node_type is mapping:
+            prefix = pointer + "/"
+            for key_node, value_node in node.value:
+                if type(value_node) is scalar or type(key_node) is not scalar:
+                    continue
+                key = key_node.value
+                if "/" in key or "~" in key:
+                    key = key.replace("~", "~0").replace("/", "~1")
+                child = prefix + key
+                mark = key_node.start_mark
+                positions[child] = ((mark.line + 1) << shift) | (mark.column + 1)
+                push((value_node, child))
+        elif node_type is sequence:
+            prefix = pointer + "/"
+            for index, item in enumerate(node.value):
+                if type(item) is scalar:
+                    continue
+                child = prefix + str(index)
+                mark = item.start_mark
+                positions[child] = ((mark.line + 1) << shift) | (mark.column + 1)
+                push((item, child))
+
+    return SourceMap(positions)
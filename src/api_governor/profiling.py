@@ -0,0 +1,80 @@
+"""Timing instrumentation for profiled governance runs."""
+
+import cProfile
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+
+from .executors import RuleExecutor, RuleTask, run_timed_tasks
+from .models import Finding, RunProfile, Timing
+from .parser import OpenAPIParser
+
+
+class Profiler:
+    """Records timings of the phases, rules and plugins of a run."""
+
+    def __init__(self, profile: RunProfile | None = None) -> None:
+        """Initialize profiler.
+
+        Args:
+            profile: Profile to add timings to (default: a new one)
+        """
+        self.profile = profile if profile is not None else RunProfile()
+        self._tasks: dict[str, RuleTask] = {}
+
+    @contextmanager
+    def phase(self, name: str, findings: Sequence[Finding] = ()) -> Iterator[None]:
+        """Time a phase of the run.
+
+        The timing is added when the phase starts and filled in when it ends,
+        so a result built inside the phase still sees it.
+
+        Args:
+            name: Phase name, e.g. "parse"
+            findings: The run's findings list; what the phase appends is counted
+        """
+        timing = Timing(name, wall_ms=0.0, cpu_ms=0.0)
+        self.profile.phases.append(timing)
+        count = len(findings)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            timing.wall_ms = (time.perf_counter() - wall) * 1000
+            timing.cpu_ms = (time.process_time() - cpu) * 1000
+            timing.findings = len(findings) - count
+
+    def run_tasks(
+        self, executor: RuleExecutor, spec: OpenAPIParser, tasks: Sequence[RuleTask]
+    ) -> list[Finding]:
+        """Run rule tasks on an executor, recording one timing per task."""
+        findings, timings = run_timed_tasks(executor, spec, tasks)
+        self.profile.rules.extend(timings)
+        self._tasks.update((task.name, task) for task in tasks)
+        return findings
+
+    def trace_slowest(self, spec: OpenAPIParser, path: str | Path) -> Path | None:
+        """Run the slowest rule again under cProfile and dump its stats.
+
+        The stats file loads with ``pstats`` and converts to flame graphs
+        with tools such as flameprof or gprof2dot.
+
+        Args:
+            spec: Parsed spec the rule ran against
+            path: Where to write the stats
+
+        Returns:
+            The stats path, or None if no rule was timed
+        """
+        slowest = self.profile.slowest_rule
+        if slowest is None or slowest.name not in self._tasks:
+            return None
+        task = self._tasks[slowest.name]
+        profiler = cProfile.Profile()
+        profiler.runcall(task, spec)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(path)
+        self.profile.trace_path = str(path)
+        return path
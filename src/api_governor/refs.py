@@ -0,0 +1,201 @@
+"""JSON reference ($ref) resolution."""
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Protocol
+from urllib.parse import unquote, urlparse
+
+
+def unescape_pointer_token(token: str) -> str:
+    """Unescape one JSON pointer reference token (RFC 6901)."""
+    if "%" in token:
+        token = unquote(token)  # Pointers in URI fragments are percent-encoded
+    if "~" in token:
+        token = token.replace("~1", "/").replace("~0", "~")
+    return token
+
+
+def iter_refs(document: Any) -> Iterator[str]:
+    """Yield every ``$ref`` string in a document, in no particular order."""
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                yield ref
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+class DocumentLoader(Protocol):
+    """Provides resolvers for documents referenced by external refs."""
+
+    def resolver(self, path: Path) -> "RefResolver":
+        """Get the resolver for a document, loading it if needed."""
+        ...
+
+    def prefetch(self, paths: Iterable[Path]) -> None:
+        """Load several documents ahead of resolution."""
+        ...
+
+
+@dataclass(frozen=True)
+class RefTarget:
+    """Resolution result for one ``$ref`` string."""
+
+    ref: str
+    value: Any = None
+    found: bool = False
+    error: str | None = None  # Set when the ref itself is invalid
+    # Resolver of the document containing the target, for refs inside it
+    source: "RefResolver | None" = field(default=None, compare=False, repr=False)
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the ref points at a non-empty value."""
+        return self.error is None and self.found and bool(self.value)
+
+
+class RefResolver:
+    """Resolves ``$ref`` pointers against one document.
+
+    Each pointer is resolved at most once; results are memoized in a table
+    keyed by the ref string, so a schema referenced thousands of times costs
+    one lookup. Chains of refs whose targets are themselves refs are followed
+    with cycle detection. Refs to other files (``common.yaml#/Error``) are
+    resolved relative to ``base_path`` through a shared document loader.
+    """
+
+    def __init__(
+        self,
+        document: Any,
+        base_path: Path | None = None,
+        documents: DocumentLoader | None = None,
+    ):
+        """Initialize resolver.
+
+        Args:
+            document: Parsed document that local refs point into
+            base_path: Path of the document, for resolving relative file refs
+            documents: Loader for referenced documents (None disables file refs)
+        """
+        self.document = document
+        self.base_path = base_path
+        self.documents = documents
+        self._targets: dict[str, RefTarget] = {}
+        self._checked: dict[str, RefTarget] = {}
+        self._table: Mapping[str, RefTarget] | None = None
+
+    def resolve(self, ref: str) -> RefTarget:
+        """Resolve a ref to its direct target, without following ref chains."""
+        target = self._targets.get(ref)
+        if target is None:
+            target = self._targets[ref] = self._lookup(ref)
+        return target
+
+    def external_path(self, ref: str) -> Path | None:
+        """Get the file a ref points into, or None for local and remote refs."""
+        if ref.startswith("#") or self.documents is None or self.base_path is None:
+            return None
+        file_part = ref.split("#", 1)[0]
+        if urlparse(file_part).scheme not in ("", "file"):
+            return None
+        return (self.base_path.parent / unquote(file_part)).resolve()
+
+    def prefetch(self, refs: Iterable[str]) -> None:
+        """Load the documents behind a batch of refs, in parallel when possible."""
+        if self.documents is None:
+            return
+        paths = {path for ref in set(refs) if (path := self.external_path(ref)) is not None}
+        if paths:
+            self.documents.prefetch(paths)
+
+    def _lookup(self, ref: str) -> RefTarget:
+        if not ref.startswith("#"):
+            return self._lookup_external(ref)
+        if ref == "#":
+            return RefTarget(ref, self.document, found=True, source=self)
+        if not ref.startswith("#/"):
+            return RefTarget(ref, error=f"Invalid JSON pointer: {ref}")
+
+        value = self.document
+        for token in ref[2:].split("/"):
+            token = unescape_pointer_token(token)
+            if isinstance(value, dict):
+                if token not in value:
+                    return RefTarget(ref)
+                value = value[token]
+            elif isinstance(value, list) and token.isdigit() and int(token) < len(value):
+                value = value[int(token)]
+            else:
+                return RefTarget(ref)
+        return RefTarget(ref, value, found=True, source=self)
+
+    def _lookup_external(self, ref: str) -> RefTarget:
+        path = self.external_path(ref)
+        if path is None or self.documents is None:
+            return RefTarget(ref, error=f"External refs not supported: {ref}")
+
+        try:
+            resolver = self.documents.resolver(path)
+        except Exception as e:
+            return RefTarget(ref, error=f"Cannot load {ref.split('#', 1)[0]}: {e}")
+        fragment = ref.split("#", 1)[1] if "#" in ref else ""
+        target = resolver.resolve(f"#{fragment}")
+        return RefTarget(ref, target.value, target.found, target.error, target.source)
+
+    def deref(self, ref: str) -> RefTarget:
+        """Resolve a ref, following targets that are themselves refs.
+
+        Returns:
+            Final target; its ``error`` describes the cycle if the chain loops
+        """
+        chain = [ref]
+        seen = {(id(self), ref)}
+        target = self.resolve(ref)
+        while target.found and isinstance(target.value, dict):
+            next_ref = target.value.get("$ref")
+            if not isinstance(next_ref, str):
+                break
+            # Refs inside the target are relative to the document containing it
+            resolver = target.source or self
+            if (id(resolver), next_ref) in seen:
+                cycle = " -> ".join([*chain, next_ref])
+                return RefTarget(ref, error=f"Circular $ref chain: {cycle}")
+            chain.append(next_ref)
+            seen.add((id(resolver), next_ref))
+            target = resolver.resolve(next_ref)
+        return target
+
+    @property
+    def table(self) -> Mapping[str, RefTarget]:
+        """Get every distinct ref in the document mapped to its resolved target.
+
+        Built on first access with one pass over the document; each distinct
+        ref is resolved once, however often it occurs.
+        """
+        if self._table is None:
+            table: dict[str, RefTarget] = {}
+            for ref in iter_refs(self.document):
+                if ref not in table:
+                    table[ref] = self.check(ref)
+            self._table = MappingProxyType(table)
+        return self._table
+
+    def check(self, ref: str) -> RefTarget:
+        """Resolve a ref for validation: direct target, or the cycle error."""
+        checked = self._checked.get(ref)
+        if checked is not None:
+            return checked
+
+        target = self.resolve(ref)
+        if target.error is None and target.found:
+            final = self.deref(ref)
+            if final.error is not None:
+                target = final
+        self._checked[ref] = target
+        return target
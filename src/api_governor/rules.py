@@ -1,284 +1,439 @@
 """Governance rule engine."""
 
 from collections.abc import Callable
+from functools import partial
+from typing import Any
 
-from .models import Finding, PolicyConfig, Severity
+from .executors import RuleExecutor, RuleTask, run_tasks
+from .models import Finding, PolicyConfig, Severity, Template, http_method
 from .parser import OpenAPIParser
+from .positions import json_pointer
+from .traversal import SpecVisitor, SpecWalker
 
+# Finding text shared by every finding of a rule; args are (path, method, METHOD, ...)
+_OPERATION_PATH = Template("paths.{0}.{1}")
+_PARAMETERS_PATH = Template("paths.{0}.{1}.parameters")
+_SEC001_MESSAGE = Template("Missing security requirement on {2} {0}")
+_SEC001_RECOMMENDATION = "Add security requirement or mark as public with x-public: true"
+_PAGINATION_MESSAGE = Template("List endpoint missing '{3}' parameter: {2} {0}")
+_PAG001_RECOMMENDATION = Template("Add '{3}' query parameter for pagination")
+_PAG002_RECOMMENDATION = Template("Add '{3}' query parameter for cursor pagination")
 
-class RuleEngine:
-    """Engine for evaluating governance rules against OpenAPI specs."""
+# Naming findings; args are (path, segment)
+_PATH_ITEM_PATH = Template("paths.{0}")
+_NAM001_MESSAGE = Template("Path segment not in kebab-case: '{1}' in {0}")
+_NAM001_RECOMMENDATION = "Use kebab-case for path segments (lowercase with hyphens)"
+_NAM002_MESSAGE = Template("Verb in path segment: '{1}' in {0}")
+_NAM002_RECOMMENDATION = "Use nouns for resources; HTTP methods convey the action"
 
-    def __init__(self, policy: PolicyConfig):
-        """Initialize with policy configuration."""
-        self.policy = policy
-        self._rules: list[Callable[[OpenAPIParser], list[Finding]]] = []
-        self._register_default_rules()
 
-    def _register_default_rules(self) -> None:
-        """Register default governance rules."""
-        self._rules.extend(
-            [
-                self._check_security,
-                self._check_error_envelope,
-                self._check_pagination,
-                self._check_naming,
-                self._check_observability,
-                self._check_versioning,
-            ]
-        )
-
-    def evaluate(self, parser: OpenAPIParser) -> list[Finding]:
-        """Evaluate all rules against the spec."""
-        findings: list[Finding] = []
-        for rule in self._rules:
-            findings.extend(rule(parser))
-        return findings
-
-    def _check_security(self, parser: OpenAPIParser) -> list[Finding]:
-        """Check security requirements."""
-        findings: list[Finding] = []
-        require_security = self.policy.get("security.require_security_by_default", True)
-        allow_public = self.policy.get("security.allow_public_endpoints_if.explicitly_marked", True)
-        _public_marker = self.policy.get(
-            "security.allow_public_endpoints_if.marker", "x-public: true"
-        )  # noqa: F841
-        severity = Severity[
-            self.policy.get("enforcement.default_severity.security_missing", "MAJOR")
-        ]
-
-        if not require_security:
-            return findings
+class SecurityRule(SpecVisitor):
+    """Check security requirements."""
 
-        global_security = parser.security
+    scope = "path"
+    inputs = ("/security",)
 
-        for path, method, operation in parser.get_operations():
-            op_security = operation.get("security", global_security)
-            is_public = operation.get("x-public", False)
-
-            if not op_security and not (allow_public and is_public):
-                findings.append(
-                    Finding(
-                        rule_id="SEC001",
-                        severity=severity,
-                        message=f"Missing security requirement on {method.upper()} {path}",
-                        path=f"paths.{path}.{method}",
-                        recommendation="Add security requirement or mark as public with x-public: true",
-                    )
+    def __init__(self, policy: PolicyConfig):
+        """Initialize with policy configuration."""
+        super().__init__()
+        plan = policy.plan.security
+        self.enabled = plan.require_security_by_default
+        self.allow_public = plan.allow_explicitly_public
+        self.severity = plan.severity
+        self._global_security: list[dict[str, Any]] = []
+
+    def begin(self, parser: OpenAPIParser) -> None:
+        self._global_security = parser.security
+
+    def visit_operation(self, path: str, method: str, operation: dict[str, Any]) -> None:
+        op_security = operation.get("security", self._global_security)
+        is_public = operation.get("x-public", False)
+
+        if not op_security and not (self.allow_public and is_public):
+            self.findings.append(
+                Finding(
+                    rule_id="SEC001",
+                    severity=self.severity,
+                    message=_SEC001_MESSAGE,
+                    path=_OPERATION_PATH,
+                    line=self.line_of("paths", path, method),
+                    recommendation=_SEC001_RECOMMENDATION,
+                    args=(path, method, http_method(method)),
                 )
+            )
 
-        return findings
-
-    def _check_error_envelope(self, parser: OpenAPIParser) -> list[Finding]:
-        """Check for consistent error envelope."""
-        findings: list[Finding] = []
-        require_envelope = self.policy.get("errors.require_standard_error_envelope", True)
-        envelope_name = self.policy.get("errors.envelope_name", "Error")
-        required_fields = self.policy.get(
-            "errors.problem_fields_required", ["code", "message", "requestId"]
-        )
-        severity = Severity[
-            self.policy.get("enforcement.default_severity.error_model_inconsistent", "MAJOR")
-        ]
 
-        if not require_envelope:
-            return findings
+class ErrorEnvelopeRule(SpecVisitor):
+    """Check for consistent error envelope."""
 
+    def __init__(self, policy: PolicyConfig):
+        """Initialize with policy configuration."""
+        super().__init__()
+        plan = policy.plan.errors
+        self.enabled = plan.require_standard_error_envelope
+        self.envelope_name = plan.envelope_name
+        self.required_fields = plan.problem_fields_required
+        self.severity = plan.severity
+        self.inputs = (json_pointer(("components", "schemas", self.envelope_name)),)
+
+    def end(self, parser: OpenAPIParser) -> None:
         # Check if Error schema exists
         schemas = parser.components.get("schemas", {})
-        error_schema = schemas.get(envelope_name)
+        error_schema = schemas.get(self.envelope_name)
 
         if not error_schema:
-            findings.append(
+            self.findings.append(
                 Finding(
                     rule_id="ERR001",
-                    severity=severity,
-                    message=f"Missing standard error schema '{envelope_name}'",
+                    severity=self.severity,
+                    message=f"Missing standard error schema '{self.envelope_name}'",
                     path="components.schemas",
-                    recommendation=f"Add {envelope_name} schema with fields: {', '.join(required_fields)}",
+                    line=self.line_of("components", "schemas"),
+                    recommendation=f"Add {self.envelope_name} schema with fields: {', '.join(self.required_fields)}",
                 )
             )
-            return findings
+            return
 
         # Check required fields
         schema_props = error_schema.get("properties", {})
-        _schema_required = error_schema.get("required", [])  # noqa: F841
 
-        for field in required_fields:
+        for field in self.required_fields:
             if field not in schema_props:
-                findings.append(
+                self.findings.append(
                     Finding(
                         rule_id="ERR002",
-                        severity=severity,
+                        severity=self.severity,
                         message=f"Error schema missing field: {field}",
-                        path=f"components.schemas.{envelope_name}",
-                        recommendation=f"Add '{field}' property to {envelope_name} schema",
+                        path=f"components.schemas.{self.envelope_name}",
+                        line=self.line_of("components", "schemas", self.envelope_name),
+                        recommendation=f"Add '{field}' property to {self.envelope_name} schema",
                     )
                 )
 
-        return findings
-
-    def _check_pagination(self, parser: OpenAPIParser) -> list[Finding]:
-        """Check pagination conventions."""
-        findings: list[Finding] = []
-        require_pagination = self.policy.get("pagination.required_for_list_endpoints", True)
-        style = self.policy.get("pagination.style", "cursor")
-        limit_param = self.policy.get("pagination.request_params.limit", "limit")
-        cursor_param = self.policy.get("pagination.request_params.cursor", "cursor")
-        _items_field = self.policy.get("pagination.response_shape.items", "items")  # noqa: F841
-        _next_cursor_field = self.policy.get("pagination.response_shape.nextCursor", "nextCursor")  # noqa: F841
-        severity = Severity[
-            self.policy.get("enforcement.default_severity.pagination_inconsistent", "MAJOR")
-        ]
 
-        if not require_pagination:
-            return findings
+class PaginationRule(SpecVisitor):
+    """Check pagination conventions."""
 
-        for path, method, operation in parser.get_operations():
-            # Check GET endpoints that look like list operations
-            if method != "get":
-                continue
+    scope = "path"
+    inputs = ()
 
-            # Heuristic: path ends with resource name (not ID pattern)
-            if "{" in path.split("/")[-1]:
-                continue
+    def __init__(self, policy: PolicyConfig):
+        """Initialize with policy configuration."""
+        super().__init__()
+        plan = policy.plan.pagination
+        self.enabled = plan.required_for_list_endpoints
+        self.style = plan.style
+        self.limit_param = plan.limit_param
+        self.cursor_param = plan.cursor_param
+        self.severity = plan.severity
+        self._collection_paths: frozenset[str] = frozenset()
+
+    def begin(self, parser: OpenAPIParser) -> None:
+        self._collection_paths = parser.operation_index.collection_paths
+
+    def visit_operation(self, path: str, method: str, operation: dict[str, Any]) -> None:
+        # Check GET endpoints that look like list operations
+        if method != "get":
+            return
+
+        # Heuristic: path ends with resource name (not ID pattern)
+        if path not in self._collection_paths:
+            return
+
+        # Check for pagination parameters
+        params = {p.get("name"): p for p in operation.get("parameters", [])}
+
+        has_limit = self.limit_param in params
+        has_cursor = self.cursor_param in params
+
+        if not has_limit:
+            self.findings.append(
+                Finding(
+                    rule_id="PAG001",
+                    severity=self.severity,
+                    message=_PAGINATION_MESSAGE,
+                    path=_PARAMETERS_PATH,
+                    line=self.line_of("paths", path, method, "parameters"),
+                    recommendation=_PAG001_RECOMMENDATION,
+                    args=(path, method, http_method(method), self.limit_param),
+                )
+            )
 
-            # Check for pagination parameters
-            params = {p.get("name"): p for p in operation.get("parameters", [])}
+        if self.style == "cursor" and not has_cursor:
+            self.findings.append(
+                Finding(
+                    rule_id="PAG002",
+                    severity=self.severity,
+                    message=_PAGINATION_MESSAGE,
+                    path=_PARAMETERS_PATH,
+                    line=self.line_of("paths", path, method, "parameters"),
+                    recommendation=_PAG002_RECOMMENDATION,
+                    args=(path, method, http_method(method), self.cursor_param),
+                )
+            )
 
-            has_limit = limit_param in params
-            has_cursor = cursor_param in params
 
-            if not has_limit:
-                findings.append(
-                    Finding(
-                        rule_id="PAG001",
-                        severity=severity,
-                        message=f"List endpoint missing '{limit_param}' parameter: {method.upper()} {path}",
-                        path=f"paths.{path}.{method}.parameters",
-                        recommendation=f"Add '{limit_param}' query parameter for pagination",
-                    )
-                )
+class NamingRule(SpecVisitor):
+    """Check naming conventions."""
 
-            if style == "cursor" and not has_cursor:
-                findings.append(
-                    Finding(
-                        rule_id="PAG002",
-                        severity=severity,
-                        message=f"List endpoint missing '{cursor_param}' parameter: {method.upper()} {path}",
-                        path=f"paths.{path}.{method}.parameters",
-                        recommendation=f"Add '{cursor_param}' query parameter for cursor pagination",
-                    )
-                )
+    scope = "path"
+    inputs = ()
 
-        return findings
+    VERB_PATTERNS = ("get", "create", "update", "delete", "fetch", "list", "add", "remove")
 
-    def _check_naming(self, parser: OpenAPIParser) -> list[Finding]:
-        """Check naming conventions."""
-        findings: list[Finding] = []
-        prefer_kebab = self.policy.get("api_style.prefer_kebab_case_paths", True)
-        discourage_verbs = self.policy.get("api_style.discourage_verbs_in_paths", True)
-        severity = Severity[
-            self.policy.get("enforcement.default_severity.naming_inconsistent", "MINOR")
-        ]
+    def __init__(self, policy: PolicyConfig):
+        """Initialize with policy configuration."""
+        super().__init__()
+        plan = policy.plan.naming
+        self.prefer_kebab = plan.prefer_kebab_case_paths
+        self.discourage_verbs = plan.discourage_verbs_in_paths
+        self.enabled = self.prefer_kebab or self.discourage_verbs
+        self.severity = plan.severity
+        self._verb_prefixes = tuple(f"{verb}-" for verb in self.VERB_PATTERNS)
+        self._verb_suffixes = tuple(f"-{verb}" for verb in self.VERB_PATTERNS)
+
+    def visit_path(self, path: str, path_item: dict[str, Any]) -> None:
+        # Check kebab-case
+        if self.prefer_kebab:
+            segments = path.strip("/").split("/")
+            for segment in segments:
+                if "{" in segment:
+                    continue
+                if "_" in segment or (segment != segment.lower()):
+                    self.findings.append(
+                        Finding(
+                            rule_id="NAM001",
+                            severity=self.severity,
+                            message=_NAM001_MESSAGE,
+                            path=_PATH_ITEM_PATH,
+                            line=self.line_of("paths", path),
+                            recommendation=_NAM001_RECOMMENDATION,
+                            args=(path, segment),
+                        )
+                    )
 
-        verb_patterns = ["get", "create", "update", "delete", "fetch", "list", "add", "remove"]
-
-        for path in parser.paths.keys():
-            # Check kebab-case
-            if prefer_kebab:
-                segments = path.strip("/").split("/")
-                for segment in segments:
-                    if "{" in segment:
-                        continue
-                    if "_" in segment or (segment != segment.lower()):
-                        findings.append(
-                            Finding(
-                                rule_id="NAM001",
-                                severity=severity,
-                                message=f"Path segment not in kebab-case: '{segment}' in {path}",
-                                path=f"paths.{path}",
-                                recommendation="Use kebab-case for path segments (lowercase with hyphens)",
-                            )
+        # Check for verbs in paths
+        if self.discourage_verbs:
+            segments = path.lower().strip("/").split("/")
+            for segment in segments:
+                if "{" in segment:
+                    continue
+                if (
+                    segment in self.VERB_PATTERNS
+                    or segment.startswith(self._verb_prefixes)
+                    or segment.endswith(self._verb_suffixes)
+                ):
+                    self.findings.append(
+                        Finding(
+                            rule_id="NAM002",
+                            severity=self.severity,
+                            message=_NAM002_MESSAGE,
+                            path=_PATH_ITEM_PATH,
+                            line=self.line_of("paths", path),
+                            recommendation=_NAM002_RECOMMENDATION,
+                            args=(path, segment),
                         )
+                    )
 
-            # Check for verbs in paths
-            if discourage_verbs:
-                segments = path.lower().strip("/").split("/")
-                for segment in segments:
-                    if "{" in segment:
-                        continue
-                    for verb in verb_patterns:
-                        if (
-                            segment == verb
-                            or segment.startswith(f"{verb}-")
-                            or segment.endswith(f"-{verb}")
-                        ):
-                            findings.append(
-                                Finding(
-                                    rule_id="NAM002",
-                                    severity=severity,
-                                    message=f"Verb in path segment: '{segment}' in {path}",
-                                    path=f"paths.{path}",
-                                    recommendation="Use nouns for resources; HTTP methods convey the action",
-                                )
-                            )
-                            break
-
-        return findings
-
-    def _check_observability(self, parser: OpenAPIParser) -> list[Finding]:
-        """Check observability headers."""
-        findings: list[Finding] = []
-        require_request_id = self.policy.get("observability.require_request_id_header", True)
-        _header_name = self.policy.get("observability.header_name", "X-Request-Id")  # noqa: F841
-        severity = Severity[
-            self.policy.get("enforcement.default_severity.observability_missing", "MINOR")
-        ]
 
-        if not require_request_id:
-            return findings
+class ObservabilityRule(SpecVisitor):
+    """Check observability headers."""
+
+    inputs = ("/components/schemas/Error",)
 
+    def __init__(self, policy: PolicyConfig):
+        """Initialize with policy configuration."""
+        super().__init__()
+        plan = policy.plan.observability
+        self.enabled = plan.require_request_id_header
+        self.severity = plan.severity
+
+    def end(self, parser: OpenAPIParser) -> None:
         # Check if request ID is in error responses
         schemas = parser.components.get("schemas", {})
         error_schema = schemas.get("Error", {})
         error_props = error_schema.get("properties", {})
 
         if "requestId" not in error_props:
-            findings.append(
+            self.findings.append(
                 Finding(
                     rule_id="OBS001",
-                    severity=severity,
+                    severity=self.severity,
                     message="Error schema missing 'requestId' field for observability",
                     path="components.schemas.Error.properties",
+                    line=self.line_of("components", "schemas", "Error", "properties"),
                     recommendation="Add 'requestId' field to Error schema for request tracing",
                 )
             )
 
-        return findings
 
-    def _check_versioning(self, parser: OpenAPIParser) -> list[Finding]:
-        """Check versioning conventions."""
-        findings: list[Finding] = []
-        strategy = self.policy.get("versioning.strategy", "none_or_header")
-        url_versioning = self.policy.get("versioning.url_versioning.enabled", False)
-        severity = Severity[
-            self.policy.get("enforcement.default_severity.versioning_inconsistent", "MINOR")
-        ]
+class VersioningRule(SpecVisitor):
+    """Check versioning conventions."""
 
-        if strategy == "url" and url_versioning:
-            prefix = self.policy.get("versioning.url_versioning.prefix", "/v{major}")
-            # Check if paths have version prefix
-            has_versioned_paths = any(p.startswith("/v") for p in parser.paths.keys())
-            if not has_versioned_paths:
-                findings.append(
-                    Finding(
-                        rule_id="VER001",
-                        severity=severity,
-                        message=f"URL versioning required but no versioned paths found (expected prefix: {prefix})",
-                        path="paths",
-                        recommendation="Add version prefix to paths, e.g., /v1/users",
-                    )
+    inputs = ("/paths",)
+
+    def __init__(self, policy: PolicyConfig):
+        """Initialize with policy configuration."""
+        super().__init__()
+        plan = policy.plan.versioning
+        self.enabled = plan.strategy == "url" and plan.url_versioning
+        self.prefix = plan.prefix
+        self.severity = plan.severity
+        self._has_versioned_paths = False
+
+    def visit_path(self, path: str, path_item: dict[str, Any]) -> None:
+        if path.startswith("/v"):
+            self._has_versioned_paths = True
+
+    def end(self, parser: OpenAPIParser) -> None:
+        # Check if paths have version prefix
+        if not self._has_versioned_paths:
+            self.findings.append(
+                Finding(
+                    rule_id="VER001",
+                    severity=self.severity,
+                    message=f"URL versioning required but no versioned paths found (expected prefix: {self.prefix})",
+                    path="paths",
+                    line=self.line_of("paths"),
+                    recommendation="Add version prefix to paths, e.g., /v1/users",
                 )
+            )
+
+
+class RuleEngine:
+    """Engine for evaluating governance rules against OpenAPI specs."""
+
+    def __init__(self, policy: PolicyConfig, executor: RuleExecutor | None = None):
+        """Initialize engine.
 
-        return findings
+        Args:
+            policy: Policy configuration
+            executor: Runs each rule as a separate task when parallel
+                (optional; by default all rules share one traversal)
+        """
+        self.policy = policy
+        self.executor = executor
+        self._rules: list[Callable[[PolicyConfig], SpecVisitor]] = []
+        self._register_default_rules()
+
+    def _register_default_rules(self) -> None:
+        """Register default governance rules."""
+        self._rules.extend(
+            [
+                SecurityRule,
+                ErrorEnvelopeRule,
+                PaginationRule,
+                NamingRule,
+                ObservabilityRule,
+                VersioningRule,
+            ]
+        )
+
+    def evaluate(self, parser: OpenAPIParser) -> list[Finding]:
+        """Evaluate all rules against the spec.
+
+        Rules share a single traversal unless a parallel executor is set, in
+        which case each rule walks the spec in its own task. Either way,
+        findings are in rule order, then document order.
+        """
+        if self.executor is None or not self.executor.parallel:
+            walker = SpecWalker(rule(self.policy) for rule in self._rules)
+            return walker.run(parser)
+
+        # Build shared indexes before tasks start, so threads do not race to
+        # build them; process workers get a copy without them and build their own
+        _ = parser.operation_index
+        return run_tasks(self.executor, parser, self.tasks())
+
+    def tasks(self) -> list[RuleTask]:
+        """Get one task per rule, for running rules on an executor."""
+        return [
+            RuleTask(getattr(rule, "__name__", repr(rule)), _run_rule, (rule, self.policy))
+            for rule in self._rules
+        ]
+
+    def evaluate_until(
+        self, parser: OpenAPIParser, threshold: Severity
+    ) -> tuple[list[Finding], bool]:
+        """Evaluate rules, stopping at the first finding at or above a severity.
+
+        Rules whose severity reaches the threshold run first, most severe
+        first and, per severity, rules without traversal hooks before those
+        that walk every path; a walk stops as soon as one of them reports a
+        finding at the threshold. If none does, the remaining rules run in
+        one more walk and the findings equal those of :meth:`evaluate`.
+
+        Args:
+            parser: Parsed spec
+            threshold: Gating severity
+
+        Returns:
+            Findings in rule order, and whether evaluation stopped early
+            (the findings are then partial)
+        """
+        visitors = [rule(self.policy) for rule in self._rules]
+        groups: dict[tuple[int, bool], list[SpecVisitor]] = {}
+        rest: list[SpecVisitor] = []
+        for visitor in visitors:
+            severity = getattr(visitor, "severity", None)
+            if not isinstance(severity, Severity):
+                severity = Severity.BLOCKER  # Undeclared: may report anything
+            if not severity.at_least(threshold):
+                rest.append(visitor)
+                continue
+            rank = list(Severity).index(severity)
+            groups.setdefault((rank, _traverses(visitor)), []).append(visitor)
+
+        gate = _Gate(threshold)
+        for key in sorted(groups):
+            group = groups[key]
+            SpecWalker(group).walk(parser, stop=partial(gate.reached, group))
+            if gate.reached(group):
+                break
+        else:
+            SpecWalker(rest).walk(parser)
+
+        return [finding for visitor in visitors for finding in visitor.findings], gate.tripped
+
+
+def _run_rule(
+    parser: OpenAPIParser, task: tuple[Callable[[PolicyConfig], SpecVisitor], PolicyConfig]
+) -> list[Finding]:
+    """Evaluate one rule in its own traversal."""
+    rule, policy = task
+    return SpecWalker([rule(policy)]).run(parser)
+
+
+def _traverses(visitor: SpecVisitor) -> bool:
+    """Check whether a visitor needs the paths or schemas of the spec walked."""
+    return any(
+        getattr(type(visitor), hook) is not getattr(SpecVisitor, hook)
+        for hook in (
+            "visit_path",
+            "visit_operation",
+            "visit_parameter",
+            "visit_request_body",
+            "visit_response",
+            "visit_schema",
+        )
+    )
+
+
+class _Gate:
+    """Tracks whether visitors reported a finding at or above a severity."""
+
+    def __init__(self, threshold: Severity):
+        self.threshold = threshold
+        self.tripped = False
+        self._checked: dict[int, int] = {}  # Findings already checked, per visitor
+
+    def reached(self, visitors: list[SpecVisitor]) -> bool:
+        """Check the findings reported since the last call."""
+        for visitor in visitors:
+            if self.tripped:
+                break
+            findings = visitor.findings
+            start = self._checked.get(id(visitor), 0)
+            self._checked[id(visitor)] = len(findings)
+            self.tripped = any(f.severity.at_least(self.threshold) for f in findings[start:])
+        return self.tripped
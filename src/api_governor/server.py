@@ -0,0 +1,258 @@
+"""Resident JSON-RPC server for editors and CI agents."""
+
+import json
+import os
+import socketserver
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import IO, Any
+
+from .cache import DiskCache
+from .diff import SpecDiffer
+from .governor import APIGovernor
+from .models import PolicyConfig
+from .parser import OpenAPIParser
+from .plugins import PluginManager
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+FileStamp = tuple[int, int]
+
+
+class RPCError(Exception):
+    """Error returned to the client as a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str):
+        """Initialize with JSON-RPC error code and message."""
+        super().__init__(message)
+        self.code = code
+
+
+def _stamp(path: Path) -> FileStamp:
+    """Get a cheap change stamp for a file."""
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class _WarmGovernor(APIGovernor):
+    """Governor that reuses the server's warm parsers."""
+
+    def __init__(self, server: "GovernorServer", **kwargs: Any):
+        super().__init__(**kwargs)
+        self._server = server
+
+    def _make_parser(self, spec_path: Path, positions: bool = True) -> OpenAPIParser:
+        # Warm parsers always index positions: a baseline may be linted next
+        return self._server.get_parser(spec_path)
+
+
+class GovernorServer:
+    """Keeps policies, plugins and parsed specs warm between requests.
+
+    Requests are newline-delimited JSON-RPC 2.0 messages, read from stdio
+    or from a Unix socket. Supported methods:
+
+    - ``lint``: ``{spec_path, policy_path?, baseline_path?}`` -> result dict
+    - ``diff``: ``{spec_path, baseline_path, policy_path?}`` -> breaking changes
+
+    Requests without ``policy_path`` use the server's ``policy_path``.
+    - ``ping``: -> ``"pong"``
+    - ``shutdown``: stop serving
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        plugins: PluginManager | None = None,
+        max_specs: int = 64,
+        policy_path: str | Path | None = None,
+    ):
+        """Initialize server.
+
+        Args:
+            cache_dir: Directory for persistent parsed-spec and result caches (optional)
+            plugins: Plugin manager whose rules run after the built-in rules (optional)
+            max_specs: Maximum number of parsed specs kept in memory
+            policy_path: Policy for requests that don't name one (optional, uses default)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.policy_path = Path(policy_path) if policy_path else None
+        self.plugins = plugins
+        self.max_specs = max_specs
+        self._spec_cache = DiskCache(self.cache_dir, "specs") if self.cache_dir else None
+        self._policies: dict[Path, tuple[FileStamp, PolicyConfig]] = {}
+        self._parsers: OrderedDict[Path, tuple[FileStamp, OpenAPIParser]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._running = True
+
+    def get_parser(self, spec_path: Path) -> OpenAPIParser:
+        """Get a parser for a spec, reusing it while it and its ref files are unchanged."""
+        key = spec_path.resolve()
+        try:
+            stamp = _stamp(key)
+        except OSError:
+            # Let the parser report the missing file
+            return OpenAPIParser(spec_path, cache=self._spec_cache, positions=True)
+
+        with self._lock:
+            entry = self._parsers.get(key)
+            if entry is not None and entry[0] == stamp:
+                documents = entry[1].documents
+                if documents is None or not documents.is_stale():
+                    self._parsers.move_to_end(key)
+                    return entry[1]
+
+            parser = OpenAPIParser(spec_path, cache=self._spec_cache, positions=True)
+            self._parsers[key] = (stamp, parser)
+            self._parsers.move_to_end(key)
+            while len(self._parsers) > self.max_specs:
+                self._parsers.popitem(last=False)
+            return parser
+
+    def get_policy(self, policy_path: Path) -> PolicyConfig:
+        """Get a policy, reloading it only when the file changes."""
+        key = policy_path.resolve()
+        stamp = _stamp(key)
+        with self._lock:
+            entry = self._policies.get(key)
+            if entry is not None and entry[0] == stamp:
+                return entry[1]
+        policy = APIGovernor._read_policy(policy_path)
+        with self._lock:
+            self._policies[key] = (stamp, policy)
+        return policy
+
+    def _governor(self, params: dict[str, Any]) -> APIGovernor:
+        spec_path = params.get("spec_path")
+        if not isinstance(spec_path, str):
+            raise RPCError(INVALID_PARAMS, "'spec_path' is required")
+
+        policy_path = params.get("policy_path") or self.policy_path
+        governor = _WarmGovernor(
+            self,
+            spec_path=spec_path,
+            policy_path=policy_path,
+            baseline_path=params.get("baseline_path"),
+            cache_dir=self.cache_dir,
+            plugins=self.plugins,
+        )
+        governor._policy = self.get_policy(governor.policy_path)
+        return governor
+
+    def lint(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Run full governance analysis on a spec."""
+        return self._governor(params).run().to_dict()
+
+    def diff(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Detect breaking changes between a baseline and a spec."""
+        if not isinstance(params.get("baseline_path"), str):
+            raise RPCError(INVALID_PARAMS, "'baseline_path' is required")
+
+        governor = self._governor(params)
+        assert governor.baseline_path is not None
+        baseline = self.get_parser(governor.baseline_path)
+        current = self.get_parser(governor.spec_path)
+        changes = SpecDiffer(governor._load_policy()).diff(baseline, current)
+        return {"breaking_changes": [bc.to_dict() for bc in changes]}
+
+    def handle(self, request: Any) -> dict[str, Any] | None:
+        """Handle one JSON-RPC request object.
+
+        Returns:
+            Response object, or None for notifications (requests without id)
+        """
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return self._error(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params") or {}
+
+        try:
+            if not isinstance(params, dict):
+                raise RPCError(INVALID_PARAMS, "params must be an object")
+            if method == "lint":
+                result: Any = self.lint(params)
+            elif method == "diff":
+                result = self.diff(params)
+            elif method == "ping":
+                result = "pong"
+            elif method == "shutdown":
+                self._running = False
+                result = None
+            else:
+                raise RPCError(METHOD_NOT_FOUND, f"Method not found: {method}")
+        except RPCError as e:
+            return self._error(request_id, e.code, str(e))
+        except Exception as e:
+            return self._error(request_id, SERVER_ERROR, str(e))
+
+        if "id" not in request:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    @staticmethod
+    def _error(request_id: Any, code: int, message: str) -> dict[str, Any]:
+        return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+    def handle_line(self, line: str) -> str | None:
+        """Handle one newline-delimited message and return the response line."""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response: dict[str, Any] | None = self._error(None, PARSE_ERROR, f"Parse error: {e}")
+        else:
+            response = self.handle(request)
+        return None if response is None else json.dumps(response)
+
+    def _serve_stream(self, reader: IO[str], writer: IO[str]) -> None:
+        for line in reader:
+            if not line.strip():
+                continue
+            response = self.handle_line(line)
+            if response is not None:
+                writer.write(response + "\n")
+                writer.flush()
+            if not self._running:
+                break
+
+    def serve_stdio(self, stdin: IO[str] | None = None, stdout: IO[str] | None = None) -> None:
+        """Serve requests from stdin until EOF or shutdown."""
+        self._serve_stream(stdin or sys.stdin, stdout or sys.stdout)
+
+    def serve_unix(self, socket_path: str | Path) -> None:
+        """Serve requests on a Unix domain socket until shutdown."""
+        server = self
+        path = Path(socket_path)
+        if path.exists():
+            path.unlink()
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for raw in self.rfile:
+                    line = raw.decode()
+                    if not line.strip():
+                        continue
+                    response = server.handle_line(line)
+                    if response is not None:
+                        self.wfile.write(response.encode() + b"\n")
+                        self.wfile.flush()
+                    if not server._running:
+                        threading.Thread(target=unix_server.shutdown, daemon=True).start()
+                        break
+
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        with Server(str(path), Handler) as unix_server:
+            os.chmod(path, 0o600)
+            unix_server.serve_forever()
+        if path.exists():
+            path.unlink()
@@ -0,0 +1,223 @@
+"""Single-pass OpenAPI spec traversal."""
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from .models import Finding
+from .parser import OpenAPIParser
+from .positions import SourceMap
+
+_HOOKS = (
+    "begin",
+    "visit_path",
+    "visit_operation",
+    "visit_parameter",
+    "visit_request_body",
+    "visit_response",
+    "visit_schema",
+    "end",
+)
+
+
+class SpecVisitor:
+    """Base class for rules evaluated during a single spec traversal.
+
+    Subclasses override only the ``visit_*`` hooks they need. The walker
+    registers overridden hooks as callbacks and skips the rest, so node kinds
+    no visitor cares about cost nothing.
+    """
+
+    #: Visitors with ``enabled = False`` are not registered with the walker.
+    enabled: bool = True
+
+    #: "path" if every finding is emitted from a path, operation, parameter,
+    #: request body or response hook and depends only on that path item plus
+    #: spec-wide inputs read in ``begin``; such findings can be recomputed one
+    #: path at a time. "global" (the default) means any other dependency.
+    scope: str = "global"
+
+    #: JSON pointers of the spec-wide inputs the visitor reads; findings only
+    #: need recomputing when something at, above or below one of them changed.
+    #: For path-scoped visitors, inputs outside their own path item. The
+    #: default ``("",)`` is the whole document.
+    inputs: tuple[str, ...] = ("",)
+
+    #: Source positions of the spec being walked, set by the walker.
+    source_map: SourceMap | None = None
+
+    def __init__(self) -> None:
+        """Initialize visitor state."""
+        self.findings: list[Finding] = []
+
+    def line_of(self, *parts: str | int) -> int | None:
+        """Get the 1-based source line of a spec node, if positions are known.
+
+        Args:
+            *parts: Unescaped JSON pointer tokens, e.g. ``("paths", "/users", "get")``
+        """
+        if self.source_map is None:
+            return None
+        return self.source_map.line(*parts)
+
+    def begin(self, parser: OpenAPIParser) -> None:
+        """Called once before traversal starts."""
+
+    def visit_path(self, path: str, path_item: dict[str, Any]) -> None:
+        """Called for every entry under ``paths``."""
+
+    def visit_operation(self, path: str, method: str, operation: dict[str, Any]) -> None:
+        """Called for every operation of a path item."""
+
+    def visit_parameter(self, path: str, method: str, parameter: dict[str, Any]) -> None:
+        """Called for every operation-level parameter."""
+
+    def visit_request_body(self, path: str, method: str, request_body: dict[str, Any]) -> None:
+        """Called for every operation request body."""
+
+    def visit_response(
+        self, path: str, method: str, status_code: str, response: dict[str, Any]
+    ) -> None:
+        """Called for every operation response."""
+
+    def visit_schema(self, name: str, schema: dict[str, Any]) -> None:
+        """Called for every named component schema."""
+
+    def end(self, parser: OpenAPIParser) -> None:
+        """Called once after traversal finishes."""
+
+
+class SpecWalker:
+    """Walks a spec exactly once, dispatching nodes to registered visitors."""
+
+    def __init__(self, visitors: Iterable[SpecVisitor] = ()) -> None:
+        """Initialize walker with optional visitors."""
+        self._visitors: list[SpecVisitor] = []
+        self._callbacks: dict[str, list[Callable[..., None]]] = {hook: [] for hook in _HOOKS}
+        self.errors: dict[int, Exception] = {}
+        for visitor in visitors:
+            self.add(visitor)
+
+    def add(self, visitor: SpecVisitor, isolate: bool = False) -> None:
+        """Register a visitor's overridden hooks.
+
+        Args:
+            visitor: Visitor to register
+            isolate: Catch exceptions raised by this visitor, record them in
+                ``errors`` and stop dispatching to it instead of aborting
+                the walk
+        """
+        if not visitor.enabled:
+            return
+
+        self._visitors.append(visitor)
+        for hook in _HOOKS:
+            if getattr(type(visitor), hook) is getattr(SpecVisitor, hook):
+                continue
+            callback = getattr(visitor, hook)
+            if isolate:
+                callback = self._isolated(visitor, callback)
+            self._callbacks[hook].append(callback)
+
+    def _isolated(self, visitor: SpecVisitor, callback: Callable[..., None]) -> Callable[..., None]:
+        """Wrap a callback so its failures are recorded instead of raised."""
+        key = id(visitor)
+        errors = self.errors
+
+        def wrapper(*args: Any) -> None:
+            if key in errors:
+                return
+            try:
+                callback(*args)
+            except Exception as e:
+                errors[key] = e
+
+        return wrapper
+
+    def error_for(self, visitor: SpecVisitor) -> Exception | None:
+        """Get the exception raised by an isolated visitor, if any."""
+        return self.errors.get(id(visitor))
+
+    def walk(
+        self,
+        parser: OpenAPIParser,
+        paths: Iterable[str] | None = None,
+        stop: Callable[[], bool] | None = None,
+    ) -> bool:
+        """Traverse the spec once, invoking registered callbacks.
+
+        Args:
+            parser: Parsed spec to traverse
+            paths: Restrict the traversal to these path keys, in spec order;
+                component schemas are not visited when restricted
+            stop: Checked before each path item and before component schemas;
+                once it returns True the rest of the walk, including ``end``,
+                is skipped
+
+        Returns:
+            False if ``stop`` ended the walk early, else True
+        """
+        callbacks = self._callbacks
+        on_path = callbacks["visit_path"]
+        on_operation = callbacks["visit_operation"]
+        on_parameter = callbacks["visit_parameter"]
+        on_request_body = callbacks["visit_request_body"]
+        on_response = callbacks["visit_response"]
+        on_schema = callbacks["visit_schema"]
+        wants_operations = bool(on_operation or on_parameter or on_request_body or on_response)
+
+        source_map = parser.source_map
+        for visitor in self._visitors:
+            visitor.source_map = source_map
+        for begin in callbacks["begin"]:
+            begin(parser)
+
+        if on_path or wants_operations:
+            by_path = parser.operation_index.by_path
+            items: Iterable[tuple[str, Any]] = parser.paths.items()
+            if paths is not None:
+                selected = set(paths)
+                items = [(p, item) for p, item in parser.paths.items() if p in selected]
+            for path, path_item in items:
+                if stop is not None and stop():
+                    return False
+                for cb in on_path:
+                    cb(path, path_item)
+                if not wants_operations:
+                    continue
+
+                for method, operation in by_path.get(path, ()):
+                    for cb in on_operation:
+                        cb(path, method, operation)
+                    if on_parameter:
+                        for parameter in operation.get("parameters", []):
+                            for cb in on_parameter:
+                                cb(path, method, parameter)
+                    if on_request_body:
+                        request_body = operation.get("requestBody")
+                        if request_body is not None:
+                            for cb in on_request_body:
+                                cb(path, method, request_body)
+                    if on_response:
+                        for status_code, response in operation.get("responses", {}).items():
+                            for cb in on_response:
+                                cb(path, method, status_code, response)
+
+        if stop is not None and stop():
+            return False
+
+        if on_schema and paths is None:
+            for name, schema in parser.components.get("schemas", {}).items():
+                for cb in on_schema:
+                    cb(name, schema)
+
+        for end in callbacks["end"]:
+            end(parser)
+        return True
+
+    def run(self, parser: OpenAPIParser) -> list[Finding]:
+        """Walk the spec and return findings in visitor registration order."""
+        self.walk(parser)
+        findings: list[Finding] = []
+        for visitor in self._visitors:
+            findings.extend(visitor.findings)
+        return findings
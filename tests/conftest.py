@@ -0,0 +1,11 @@
+"""Shared test configuration."""
+
+import pytest
+
+from api_governor.cache import CACHE_KEY_ENV
+
+
+@pytest.fixture(autouse=True)
+def _cache_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Sign cache entries with a fixed key instead of creating a per-user key file."""
+    monkeypatch.setenv(CACHE_KEY_ENV, "test-key")
@@ -0,0 +1,213 @@
+"""Tests for persistent caches."""
+
+import os
+import pickle
+import stat
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from api_governor.cache import CACHE_KEY_ENV, DiskCache, content_hash, signing_key
+from api_governor.governor import APIGovernor
+from api_governor.parser import OpenAPIParser
+
+
+class TestDiskCache:
+    """Tests for DiskCache class."""
+
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        """Test storing and loading a value."""
+        cache = DiskCache(tmp_path, "specs")
+        key = content_hash("value")
+
+        assert cache.get(key) is None
+        cache.put(key, {"a": [1, 2]})
+        assert cache.get(key) == {"a": [1, 2]}
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        """Test that unreadable entries are dropped."""
+        cache = DiskCache(tmp_path, "specs")
+        cache.put("k", 1)
+        (tmp_path / "specs" / "k.pickle").write_bytes(b"not a pickle")
+
+        assert cache.get("k") is None
+        assert not (tmp_path / "specs" / "k.pickle").exists()
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Test LRU eviction when over the size limit."""
+        cache = DiskCache(tmp_path, "specs", max_bytes=10_000)
+        cache.put("old", b"x" * 4000)
+        cache.put("used", b"x" * 4000)
+        os.utime(tmp_path / "specs" / "old.pickle", (1, 1))
+        os.utime(tmp_path / "specs" / "used.pickle", (2, 2))
+        assert cache.get("used") is not None  # refreshes mtime
+
+        cache.put("new", b"x" * 4000)
+
+        assert cache.get("old") is None
+        assert cache.get("used") is not None
+        assert cache.get("new") is not None
+
+    def test_unsigned_entries_are_not_unpickled(self, tmp_path: Path) -> None:
+        """Test that entries signed with another key, or forged, are never loaded."""
+        DiskCache(tmp_path, "specs", key=b"other").put("k", 1)
+        assert DiskCache(tmp_path, "specs").get("k") is None
+
+        forged = b"\0" * 32 + pickle.dumps(_Forged())
+        (tmp_path / "specs" / "k.pickle").write_bytes(forged)
+        assert DiskCache(tmp_path, "specs").get("k") is None
+        assert _UNPICKLED == []
+
+    def test_stale_temporary_files_removed(self, tmp_path: Path) -> None:
+        """Test that temporary files left by crashed writes are cleaned up."""
+        (tmp_path / "specs").mkdir()
+        stale = tmp_path / "specs" / "crashed.tmp"
+        stale.write_bytes(b"partial")
+        os.utime(stale, (1, 1))
+        in_flight = tmp_path / "specs" / "writing.tmp"
+        in_flight.write_bytes(b"partial")
+
+        DiskCache(tmp_path, "specs").put("k", 1)
+
+        assert not stale.exists()
+        assert in_flight.exists()
+
+    def test_signing_key_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the per-user key is created once, readable by the user only."""
+        monkeypatch.delenv(CACHE_KEY_ENV)
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+        key = signing_key()
+
+        assert signing_key() == key
+        key_file = tmp_path / "api-governor" / "cache.key"
+        assert key_file.read_bytes() == key
+        if os.name == "posix":
+            assert stat.S_IMODE(key_file.stat().st_mode) == 0o600
+
+    def test_content_hash_separates_parts(self) -> None:
+        """Test that part boundaries affect the key."""
+        assert content_hash("ab", "c") != content_hash("a", "bc")
+
+
+_UNPICKLED: list[str] = []
+
+
+def _unpickled() -> None:
+    _UNPICKLED.append("forged")
+
+
+class _Forged:
+    """Runs code when unpickled, like a crafted cache entry."""
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_unpickled, ())
+
+
+class TestParserCache:
+    """Tests for the parsed-spec cache in OpenAPIParser."""
+
+    def test_warm_parse_skips_loading(self, tmp_path: Path) -> None:
+        """Test that a warm parse is served from the cache."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text("openapi: 3.0.3\ninfo:\n  title: Cached\npaths: {}\n")
+        cache = DiskCache(tmp_path / "cache", "specs")
+
+        first = OpenAPIParser(spec_file, cache=cache).parse()
+        entries = list((tmp_path / "cache" / "specs").glob("*.pickle"))
+        assert len(entries) == 1
+
+        # Poison the entry to prove the second parse reads it
+        cache.put(entries[0].stem, {"openapi": "3.0.3", "info": {"title": "From cache"}})
+        second = OpenAPIParser(spec_file, cache=cache).parse()
+
+        assert first["info"]["title"] == "Cached"
+        assert second["info"]["title"] == "From cache"
+
+    def test_changed_content_misses(self, tmp_path: Path) -> None:
+        """Test that editing the spec invalidates the cached entry."""
+        spec_file = tmp_path / "openapi.yaml"
+        cache = DiskCache(tmp_path / "cache", "specs")
+
+        spec_file.write_text("openapi: 3.0.3\ninfo:\n  title: One\n")
+        OpenAPIParser(spec_file, cache=cache).parse()
+        spec_file.write_text("openapi: 3.0.3\ninfo:\n  title: Two\n")
+
+        assert OpenAPIParser(spec_file, cache=cache).parse()["info"]["title"] == "Two"
+
+
+class TestResultCache:
+    """Tests for the APIGovernor result cache."""
+
+    SPEC = "openapi: 3.0.3\ninfo:\n  title: T\n  version: '1'\npaths:\n  /users:\n    get: {}\n"
+
+    def test_hit_after_miss(self, tmp_path: Path) -> None:
+        """Test that an unchanged run is served from the cache."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(self.SPEC)
+        cache_dir = tmp_path / "cache"
+
+        first = APIGovernor(spec_file, cache_dir=cache_dir).run()
+        second = APIGovernor(spec_file, cache_dir=cache_dir).run()
+
+        assert first.cache_status == "miss"
+        assert second.cache_status == "hit"
+        assert second.to_dict()["cache"] == "hit"
+        assert [f.to_dict() for f in second.findings] == [f.to_dict() for f in first.findings]
+
+    def test_policy_change_misses(self, tmp_path: Path) -> None:
+        """Test that editing the policy invalidates cached results."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(self.SPEC)
+        policy_file = tmp_path / "policy.yaml"
+        policy_file.write_text("policy_name: A\n")
+        cache_dir = tmp_path / "cache"
+
+        APIGovernor(spec_file, policy_path=policy_file, cache_dir=cache_dir).run()
+        policy_file.write_text("policy_name: B\n")
+        result = APIGovernor(spec_file, policy_path=policy_file, cache_dir=cache_dir).run()
+
+        assert result.cache_status == "miss"
+        assert result.policy_name == "B"
+
+    def test_foreign_entry_misses(self, tmp_path: Path) -> None:
+        """Test that a cache entry that is not a result is recomputed."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(self.SPEC)
+        cache_dir = tmp_path / "cache"
+        governor = APIGovernor(spec_file, cache_dir=cache_dir)
+        key = governor._result_cache_key()
+        assert governor._result_cache is not None and key is not None
+        governor._result_cache.put(key, ({"status": "PASS"}, {}))
+
+        result = APIGovernor(spec_file, cache_dir=cache_dir).run()
+
+        assert result.cache_status == "miss"
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        """Test that results carry no cache status without a cache dir."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(self.SPEC)
+
+        result = APIGovernor(spec_file).run()
+
+        assert result.cache_status is None
+        assert "cache" not in result.to_dict()
+
+    def test_referenced_file_change_misses(self, tmp_path: Path) -> None:
+        """Test that editing a file pulled in through an external ref invalidates results."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(self.SPEC + "components:\n  schemas:\n    User: {$ref: 'user.yaml'}\n")
+        user_file = tmp_path / "user.yaml"
+        user_file.write_text("type: object\n")
+        cache_dir = tmp_path / "cache"
+
+        first = APIGovernor(spec_file, cache_dir=cache_dir).run()
+        user_file.write_text("{}\n")
+        second = APIGovernor(spec_file, cache_dir=cache_dir).run()
+
+        assert first.cache_status == "miss"
+        assert second.cache_status == "miss"
+        assert not any(f.rule_id == "REF001" for f in first.findings)
+        assert any(f.rule_id == "REF001" for f in second.findings)
@@ -0,0 +1,302 @@
+"""Tests for breaking change detection."""
+
+import copy
+from typing import Any
+
+from api_governor.diff import SpecDiffer
+from api_governor.models import PolicyConfig
+from api_governor.parser import OpenAPIParser
+
+BASELINE: dict[str, Any] = {
+    "openapi": "3.0.3",
+    "info": {"title": "Test API", "version": "1.0.0"},
+    "paths": {
+        "/users": {
+            "get": {
+                "parameters": [{"name": "limit", "in": "query"}],
+                "responses": {"200": {"description": "OK"}, "400": {"description": "Bad"}},
+            },
+        },
+        "/orders": {"get": {"responses": {"200": {"description": "OK"}}}},
+    },
+    "components": {
+        "schemas": {
+            "User": {"type": "object", "properties": {"id": {"type": "string"}}},
+            "Order": {"type": "object", "properties": {"id": {"type": "string"}}},
+        }
+    },
+}
+
+
+def diff(baseline: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """Diff two specs with the default policy and return change paths."""
+    differ = SpecDiffer(PolicyConfig.from_dict({}))
+    changes = differ.diff(OpenAPIParser.from_spec(baseline), OpenAPIParser.from_spec(current))
+    return [change.path for change in changes]
+
+
+class TestSpecHashes:
+    """Tests for structural hashes."""
+
+    def test_hashes_ignore_key_order(self) -> None:
+        """Test equal subtrees hash equal regardless of mapping order."""
+        current = copy.deepcopy(BASELINE)
+        users = current["paths"]["/users"]["get"]
+        users["responses"] = dict(reversed(list(users["responses"].items())))
+        current["paths"] = dict(reversed(list(current["paths"].items())))
+
+        baseline_hashes = OpenAPIParser.from_spec(BASELINE).hashes
+        current_hashes = OpenAPIParser.from_spec(current).hashes
+        assert baseline_hashes == current_hashes
+
+    def test_hashes_localize_changes(self) -> None:
+        """Test a change alters only the digests on its path to the root."""
+        current = copy.deepcopy(BASELINE)
+        current["paths"]["/users"]["get"]["parameters"] = []
+
+        baseline_hashes = OpenAPIParser.from_spec(BASELINE).hashes
+        current_hashes = OpenAPIParser.from_spec(current).hashes
+        assert baseline_hashes.paths != current_hashes.paths
+        assert baseline_hashes.path_items["/users"] != current_hashes.path_items["/users"]
+        assert baseline_hashes.path_items["/orders"] == current_hashes.path_items["/orders"]
+        assert baseline_hashes.schemas == current_hashes.schemas
+
+    def test_changes_propagate_along_component_refs(self) -> None:
+        """Test operations with unchanged text count as changed through a changed component."""
+        baseline = copy.deepcopy(BASELINE)
+        baseline["paths"]["/orders"]["get"]["parameters"] = [
+            {"$ref": "#/components/parameters/Status"}
+        ]
+        baseline["components"]["parameters"] = {
+            "Status": {"$ref": "#/components/parameters/OrderStatus"},
+            "OrderStatus": {"name": "status", "in": "query", "schema": {"type": "string"}},
+        }
+        current = copy.deepcopy(baseline)
+        current["components"]["parameters"]["OrderStatus"]["in"] = "header"
+
+        baseline_parser = OpenAPIParser.from_spec(baseline)
+        current_parser = OpenAPIParser.from_spec(current)
+        assert baseline_parser.hashes.changed_components(current_parser.hashes) == {
+            "#/components/parameters/Status",
+            "#/components/parameters/OrderStatus",
+        }
+        changed = SpecDiffer._find_changed_operations(baseline_parser, current_parser)
+        assert [(path, method) for path, method, _, _ in changed] == [("/orders", "get")]
+
+
+class TestSpecDiffer:
+    """Tests for SpecDiffer class."""
+
+    def test_identical_specs(self) -> None:
+        """Test identical specs produce no changes."""
+        assert diff(BASELINE, copy.deepcopy(BASELINE)) == []
+
+    def test_changes_in_modified_subtrees(self) -> None:
+        """Test changes are found in the subtrees that differ."""
+        current = copy.deepcopy(BASELINE)
+        current["paths"]["/users"]["get"]["parameters"] = []
+        del current["paths"]["/users"]["get"]["responses"]["400"]
+        del current["paths"]["/orders"]
+        current["components"]["schemas"]["User"]["properties"] = {}
+
+        assert diff(BASELINE, current) == [
+            "GET /orders",
+            "GET /users -> limit",
+            "GET /users -> 400",
+            "schemas.User.id",
+        ]
+
+    def test_nested_fields_through_refs(self) -> None:
+        """Test nested and array item fields are compared through $ref chains."""
+        baseline = copy.deepcopy(BASELINE)
+        schemas = baseline["components"]["schemas"]
+        schemas["Address"] = {"properties": {"street": {}, "city": {}}}
+        schemas["AddressAlias"] = {"$ref": "#/components/schemas/Address"}
+        schemas["User"]["properties"]["address"] = {"$ref": "#/components/schemas/AddressAlias"}
+        schemas["User"]["properties"]["tags"] = {"items": {"properties": {"id": {}}}}
+        current = copy.deepcopy(baseline)
+        current_user = current["components"]["schemas"]["User"]
+        current_user["properties"]["address"] = {"properties": {"street": {}}}
+        current_user["properties"]["tags"]["items"]["properties"] = {}
+
+        assert diff(baseline, current) == ["schemas.User.address.city", "schemas.User.tags[].id"]
+
+    def test_inline_operation_schemas(self) -> None:
+        """Test removed response fields and newly required request fields."""
+        baseline = copy.deepcopy(BASELINE)
+        body = {"content": {"application/json": {"schema": {"properties": {"a": {}, "b": {}}}}}}
+        operation = baseline["paths"]["/users"]["get"]
+        operation["requestBody"] = copy.deepcopy(body)
+        operation["responses"]["200"].update(copy.deepcopy(body))
+        current = copy.deepcopy(baseline)
+        operation = current["paths"]["/users"]["get"]
+        operation["requestBody"]["content"]["application/json"]["schema"]["required"] = ["a"]
+        response_schema = operation["responses"]["200"]["content"]["application/json"]["schema"]
+        del response_schema["properties"]["b"]
+
+        assert diff(baseline, current) == ["GET /users -> requestBody.a", "GET /users -> 200.b"]
+
+    def test_recursive_schemas_compared_once(self) -> None:
+        """Test recursive schemas terminate and shared pairs are memoized."""
+        baseline = copy.deepcopy(BASELINE)
+        node = {"properties": {"value": {}, "child": {"$ref": "#/components/schemas/Alias"}}}
+        baseline["components"]["schemas"]["Node"] = node
+        baseline["components"]["schemas"]["Alias"] = {"$ref": "#/components/schemas/Node"}
+        current = copy.deepcopy(baseline)
+        current["components"]["schemas"]["Node"]["properties"]["child"] = {
+            "properties": {"child": {"$ref": "#/components/schemas/Node"}}
+        }
+        current["components"]["schemas"]["Node"]["required"] = ["value"]
+
+        assert diff(baseline, current) == [
+            "schemas.Node.value",
+            "schemas.Node.child.value",
+        ]
+
+        differ = SpecDiffer(PolicyConfig.from_dict({}))
+        baseline_parser = OpenAPIParser.from_spec(baseline)
+        current_parser = OpenAPIParser.from_spec(current)
+        differ.diff(baseline_parser, current_parser)
+        comparator = differ._comparator(baseline_parser, current_parser)
+        first = comparator.compare(node, current["components"]["schemas"]["Node"])
+        assert comparator.compare(node, current["components"]["schemas"]["Node"]) is first
+
+    def test_recursive_pairs_independent_of_comparison_order(self) -> None:
+        """Test a pair on a cycle compares the same whichever root reached it first."""
+        baseline = copy.deepcopy(BASELINE)
+        schemas = baseline["components"]["schemas"]
+        schemas["Parent"] = {
+            "properties": {"a": {}, "child": {"$ref": "#/components/schemas/Child"}}
+        }
+        schemas["Child"] = {
+            "properties": {"b": {}, "parent": {"$ref": "#/components/schemas/Parent"}}
+        }
+        current = copy.deepcopy(BASELINE)
+        schemas = current["components"]["schemas"]
+        schemas["Parent2"] = {"properties": {"child": {"$ref": "#/components/schemas/Child2"}}}
+        schemas["Child2"] = {"properties": {"parent": {"$ref": "#/components/schemas/Parent2"}}}
+        pairs = [
+            (baseline["components"]["schemas"][name], schemas[f"{name}2"])
+            for name in ("Parent", "Child")
+        ]
+        baseline_parser = OpenAPIParser.from_spec(baseline)
+        current_parser = OpenAPIParser.from_spec(current)
+
+        results = []
+        for order in (pairs, pairs[::-1]):
+            differ = SpecDiffer(PolicyConfig.from_dict({}))
+            comparator = differ._comparator(baseline_parser, current_parser)
+            results.append({id(pair[0]): comparator.compare(*pair) for pair in order})
+
+        assert results[0] == results[1]
+        child = results[0][id(pairs[1][0])]
+        assert [location for _, location, _ in child] == [("b",), ("parent", "a")]
+
+    def test_narrowed_enum_and_numeric_range(self) -> None:
+        """Test removed enum values and tightened bounds in requests and schemas."""
+        baseline = copy.deepcopy(BASELINE)
+        operation = baseline["paths"]["/users"]["get"]
+        operation["parameters"][0]["schema"] = {"type": "integer", "minimum": 1, "maximum": 100}
+        baseline["components"]["schemas"]["User"]["properties"]["role"] = {
+            "enum": ["admin", "member", "guest"]
+        }
+        current = copy.deepcopy(baseline)
+        current["paths"]["/users"]["get"]["parameters"][0]["schema"].update(
+            {"minimum": 1, "exclusiveMinimum": True, "maximum": 50}
+        )
+        current["components"]["schemas"]["User"]["properties"]["role"]["enum"] = ["member"]
+
+        differ = SpecDiffer(PolicyConfig.from_dict({}))
+        changes = differ.diff(OpenAPIParser.from_spec(baseline), OpenAPIParser.from_spec(current))
+        assert [(change.change_type, change.path) for change in changes] == [
+            ("narrowed_enum", "schemas.User.role"),
+            ("narrowed_numeric_range", "GET /users -> limit"),
+            ("narrowed_numeric_range", "GET /users -> limit"),
+        ]
+        assert "'admin', 'guest'" in changes[0].description
+        assert "minimum 1 -> exclusiveMinimum 1" in changes[1].description
+        assert "maximum 100 -> maximum 50" in changes[2].description
+
+    def test_changes_behind_component_refs(self) -> None:
+        """Test operations with unchanged text are diffed when a component they ref changes."""
+        baseline = copy.deepcopy(BASELINE)
+        baseline["paths"]["/orders"]["get"]["parameters"] = [
+            {"$ref": "#/components/parameters/Status"}
+        ]
+        baseline["components"]["parameters"] = {
+            "Status": {"$ref": "#/components/parameters/OrderStatus"},
+            "OrderStatus": {
+                "name": "status",
+                "in": "query",
+                "schema": {"enum": ["open", "closed"]},
+            },
+        }
+        current = copy.deepcopy(baseline)
+        current["components"]["parameters"]["OrderStatus"]["schema"]["enum"] = ["open"]
+
+        assert diff(baseline, current) == ["GET /orders -> status"]
+
+    def test_referenced_request_body_and_response(self) -> None:
+        """Test schemas inside $ref'd request bodies and responses are compared."""
+        baseline = copy.deepcopy(BASELINE)
+        baseline["paths"]["/orders"]["post"] = {
+            "requestBody": {"$ref": "#/components/requestBodies/NewOrder"},
+            "responses": {"201": {"$ref": "#/components/responses/Created"}},
+        }
+        body = {"type": "object", "properties": {"item": {"type": "string"}}}
+        baseline["components"]["requestBodies"] = {
+            "NewOrder": {"content": {"application/json": {"schema": body}}}
+        }
+        created = {
+            "type": "object",
+            "properties": {"id": {"type": "string"}, "total": {"type": "number"}},
+        }
+        baseline["components"]["responses"] = {
+            "Created": {"$ref": "#/components/responses/OrderCreated"},
+            "OrderCreated": {
+                "description": "Created",
+                "content": {"application/json": {"schema": created}},
+            },
+        }
+        current = copy.deepcopy(baseline)
+        components = current["components"]
+        components["requestBodies"]["NewOrder"]["content"]["application/json"]["schema"][
+            "required"
+        ] = ["item"]
+        del components["responses"]["OrderCreated"]["content"]["application/json"]["schema"][
+            "properties"
+        ]["total"]
+
+        assert diff(baseline, current) == [
+            "POST /orders -> requestBody.item",
+            "POST /orders -> 201.total",
+        ]
+
+    def test_required_to_optional_flip(self) -> None:
+        """Test required-to-optional flips are opt-in and reported for responses."""
+        baseline = copy.deepcopy(BASELINE)
+        baseline["components"]["schemas"]["User"]["required"] = ["id"]
+        current = copy.deepcopy(baseline)
+        current["components"]["schemas"]["User"]["required"] = []
+
+        assert diff(baseline, current) == []
+        flags = {"required_to_optional_flip": True}
+        policy = {"breaking_change_detection": {"breaking_changes": flags}}
+        differ = SpecDiffer(PolicyConfig.from_dict(policy))
+        changes = differ.diff(OpenAPIParser.from_spec(baseline), OpenAPIParser.from_spec(current))
+        assert [change.path for change in changes] == ["schemas.User.id"]
+
+    def test_auth_requirement_change(self) -> None:
+        """Test operations that stop accepting a baseline security requirement."""
+        baseline = copy.deepcopy(BASELINE)
+        baseline["security"] = [{"oauth": ["read"]}]
+        current = copy.deepcopy(baseline)
+        current["security"] = [{"oauth": ["read", "admin"]}]
+        current["paths"]["/orders"]["get"]["security"] = [{"oauth": []}]
+
+        assert diff(baseline, current) == ["GET /users"]
+
+        # Dropping auth or accepting an extra scheme is not breaking
+        current["security"] = [{"oauth": ["read"]}, {"apiKey": []}]
+        current["paths"]["/users"]["get"]["security"] = []
+        assert diff(baseline, current) == []
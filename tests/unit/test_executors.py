@@ -0,0 +1,108 @@
+"""Tests for parallel rule executors."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from api_governor.executors import (
+    ProcessExecutor,
+    SerialExecutor,
+    ThreadExecutor,
+    create_executor,
+)
+from api_governor.governor import APIGovernor
+from api_governor.models import Finding, PolicyConfig
+from api_governor.parser import OpenAPIParser
+from api_governor.plugins import (
+    MaxPathDepthRule,
+    PluginManager,
+    RequireDescriptionRule,
+    RulePlugin,
+)
+from api_governor.rules import RuleEngine
+
+SAMPLE_SPEC = Path(__file__).parent.parent.parent / "examples" / "sample_openapi.yaml"
+
+EXECUTORS = [ThreadExecutor(max_workers=4), ProcessExecutor(max_workers=2)]
+
+
+class FailingRule(RulePlugin):
+    """Plugin whose check always raises."""
+
+    @property
+    def rule_id(self) -> str:
+        return "TEST_FAILING"
+
+    @property
+    def name(self) -> str:
+        return "Failing Rule"
+
+    @property
+    def description(self) -> str:
+        return "Always raises"
+
+    def check(self, spec: OpenAPIParser, policy: PolicyConfig) -> list[Finding]:
+        raise RuntimeError("boom")
+
+
+def _as_dicts(findings: list[Finding]) -> list[dict[str, Any]]:
+    return [finding.to_dict() for finding in findings]
+
+
+def _parser() -> OpenAPIParser:
+    parser = OpenAPIParser(SAMPLE_SPEC)
+    parser.parse()
+    return parser
+
+
+def _plugins() -> PluginManager:
+    manager = PluginManager()
+    for plugin in (RequireDescriptionRule, FailingRule, MaxPathDepthRule):
+        manager.register(plugin)
+    return manager
+
+
+class TestRuleExecutors:
+    """Tests for running rules and plugins on executors."""
+
+    @pytest.mark.parametrize("executor", EXECUTORS, ids=["thread", "process"])
+    def test_rule_findings_match_serial(self, executor: Any) -> None:
+        """Test parallel rules produce the serial findings in the same order."""
+        policy = PolicyConfig.from_dict({})
+        expected = RuleEngine(policy).evaluate(_parser())
+        assert expected
+
+        findings = RuleEngine(policy, executor).evaluate(_parser())
+
+        assert _as_dicts(findings) == _as_dicts(expected)
+
+    @pytest.mark.parametrize("executor", EXECUTORS, ids=["thread", "process"])
+    def test_plugin_findings_match_serial(self, executor: Any) -> None:
+        """Test parallel plugins keep order and report failures as findings."""
+        policy = PolicyConfig.from_dict({})
+        expected = _plugins().run_all(_parser(), policy)
+
+        findings = _plugins().run_all(_parser(), policy, executor)
+
+        assert _as_dicts(findings) == _as_dicts(expected)
+        assert any(f.rule_id == "PLUGIN_ERROR_TEST_FAILING" for f in findings)
+
+    def test_governor_result_matches_serial(self, tmp_path: Path) -> None:
+        """Test a governor run with a parallel executor matches a serial run."""
+        serial = APIGovernor(SAMPLE_SPEC, output_dir=tmp_path, plugins=_plugins()).run()
+        parallel = APIGovernor(
+            SAMPLE_SPEC,
+            output_dir=tmp_path,
+            plugins=_plugins(),
+            rule_executor=ThreadExecutor(max_workers=4),
+        ).run()
+
+        assert parallel.to_dict() == serial.to_dict()
+
+    def test_create_executor(self) -> None:
+        """Test executors are created by name and unknown names rejected."""
+        assert isinstance(create_executor("serial"), SerialExecutor)
+        assert create_executor("process", 3).max_workers == 3
+        with pytest.raises(ValueError, match="Unknown rule executor"):
+            create_executor("gpu")
@@ -4,7 +4,7 @@ import json
 from pathlib import Path
 
 from api_governor.formatters import JSONFormatter, SARIFFormatter
-from api_governor.models import Finding, GovernanceResult, Severity
+from api_governor.models import Finding, GovernanceResult, RunProfile, Severity, Timing
 
 
 class TestJSONFormatter:
@@ -85,6 +85,22 @@ class TestSARIFFormatter:
         assert "runs" in parsed
         assert len(parsed["runs"]) == 1
 
+    def test_sarif_run_properties_carry_profile(self) -> None:
+        """Test a profiled result's timings land in the SARIF run property bag."""
+        result = GovernanceResult(
+            spec_path="openapi.yaml",
+            policy_name="test",
+            status="PASS",
+            profile=RunProfile(phases=[Timing("parse", wall_ms=1.5, cpu_ms=1.25)]),
+        )
+
+        run = SARIFFormatter(result).to_sarif()["runs"][0]
+
+        assert run["properties"]["profile"]["phases"] == [
+            {"name": "parse", "wall_ms": 1.5, "cpu_ms": 1.25, "findings": 0}
+        ]
+        assert JSONFormatter(result).to_dict()["profile"] == run["properties"]["profile"]
+
     def test_sarif_with_findings(self) -> None:
         """Test SARIF output with findings."""
         result = GovernanceResult(
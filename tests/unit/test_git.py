@@ -0,0 +1,93 @@
+"""Tests for reading baselines from git revisions."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from api_governor.cache import DiskCache
+from api_governor.git import GitBlob, GitError
+from api_governor.governor import APIGovernor
+from api_governor.parser import OpenAPIParser
+
+SPEC = """
+openapi: 3.0.3
+info:
+  title: Test API
+  version: 1.0.0
+paths:
+  /users:
+    get:
+      responses:
+        '200':
+          description: OK
+"""
+
+
+def git(repo: Path, *args: str) -> None:
+    """Run a git command in a test repository."""
+    subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a repository with one committed spec."""
+    git(tmp_path, "init", "-q")
+    (tmp_path / "api").mkdir()
+    (tmp_path / "api" / "openapi.yaml").write_text(SPEC)
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "v1")
+    return tmp_path
+
+
+class TestGitBlob:
+    """Tests for GitBlob class."""
+
+    def test_resolve_and_read(self, repo: Path) -> None:
+        """Test a working-tree path resolves to its blob at a revision."""
+        spec = repo / "api" / "openapi.yaml"
+        spec.write_text("changed")
+
+        blob = GitBlob.resolve("HEAD", spec)
+
+        assert blob.path == "api/openapi.yaml"
+        assert str(blob) == "HEAD:api/openapi.yaml"
+        assert blob.read().decode() == SPEC
+
+    def test_missing_file_or_revision(self, repo: Path) -> None:
+        """Test unknown paths and revisions raise GitError."""
+        with pytest.raises(GitError, match="not found at revision"):
+            GitBlob.resolve("HEAD", repo / "api" / "missing.yaml")
+        with pytest.raises(GitError):
+            GitBlob.resolve("no-such-rev", repo / "api" / "openapi.yaml")
+
+    def test_cache_hit_skips_reading_blob(
+        self, repo: Path, tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test parsed specs are cached by blob SHA and the blob is not read again."""
+        cache = DiskCache(tmp_path_factory.mktemp("cache"), "specs")
+        blob = GitBlob.resolve("HEAD", repo / "api" / "openapi.yaml")
+        first = OpenAPIParser.from_git(blob, cache=cache).parse()
+
+        def fail(self: GitBlob) -> bytes:
+            raise AssertionError("blob read on cache hit")
+
+        monkeypatch.setattr(GitBlob, "read", fail)
+        assert OpenAPIParser.from_git(blob, cache=cache).parse() == first
+
+
+class TestBaselineRev:
+    """Tests for APIGovernor(baseline_rev=...)."""
+
+    def test_baseline_from_revision(self, repo: Path) -> None:
+        """Test the committed version of the spec is the baseline."""
+        spec = repo / "api" / "openapi.yaml"
+        spec.write_text(SPEC.replace("/users", "/people"))
+
+        result = APIGovernor(spec, baseline_rev="HEAD").run()
+
+        assert [bc.path for bc in result.breaking_changes] == ["GET /users"]
@@ -0,0 +1,240 @@
+"""Tests for the APIGovernor orchestrator."""
+
+import json
+import pstats
+from pathlib import Path
+
+import pytest
+
+from api_governor.formatters import format_result
+from api_governor.governor import APIGovernor
+from api_governor.models import Severity
+from api_governor.output import OutputGenerator
+from api_governor.plugins import default_manager
+from api_governor.policy import PolicyError
+
+SPEC = """
+openapi: 3.0.3
+info:
+  title: Test API
+  version: 1.0.0
+security:
+  - bearerAuth: []
+paths:
+  /users:
+    get:
+      parameters:
+        - name: limit
+          in: query
+        - name: cursor
+          in: query
+      responses:
+        '200':
+          description: OK
+components:
+  schemas:
+    Error:
+      type: object
+      properties:
+        code: {type: string}
+        message: {type: string}
+        requestId: {type: string}
+"""
+
+
+class TestRunBatch:
+    """Tests for APIGovernor.run_batch."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_batch_preserves_order_and_status(self, tmp_path: Path, jobs: int) -> None:
+        """Test that batch results match single runs, in input order."""
+        good = tmp_path / "good.yaml"
+        good.write_text(SPEC)
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("openapi: [unclosed")
+
+        batch = APIGovernor.run_batch([bad, good, good], jobs=jobs)
+
+        assert [r.spec_path for r in batch.results] == [str(bad), str(good), str(good)]
+        assert [r.status for r in batch.results] == ["FAIL", "PASS", "PASS"]
+        assert batch.status == "FAIL"
+        assert batch.to_dict()["summary"] == {"specs": 3, "pass": 2, "warn": 0, "fail": 1}
+        single = APIGovernor(good).run()
+        assert batch.results[1].to_dict() == single.to_dict()
+
+    def test_batch_artifacts_do_not_collide(self, tmp_path: Path) -> None:
+        """Test that specs with the same file name get separate artifact dirs."""
+        for service in ("a", "b"):
+            (tmp_path / service).mkdir()
+            (tmp_path / service / "openapi.yaml").write_text(SPEC)
+        specs = [tmp_path / "a" / "openapi.yaml", tmp_path / "b" / "openapi.yaml"]
+
+        batch = APIGovernor.run_batch(specs, jobs=1)
+        artifacts = APIGovernor.generate_batch_artifacts(batch, tmp_path / "out")
+
+        review_paths = {a["API_REVIEW.md"] for a in artifacts.values()}
+        assert len(review_paths) == 2
+        assert all(p.exists() for p in review_paths)
+
+
+class TestRunHistory:
+    """Tests for APIGovernor.run_history."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_history_diffs_adjacent_versions(self, tmp_path: Path, jobs: int) -> None:
+        """Test each adjacent pair is diffed and changes are grouped per endpoint."""
+        v1 = tmp_path / "v1.yaml"
+        v1.write_text(SPEC)
+        v2 = tmp_path / "v2.yaml"
+        v2.write_text(SPEC.replace("        - name: cursor\n          in: query\n", ""))
+        v3 = tmp_path / "v3.yaml"
+        v3.write_text(SPEC.replace("        - name: limit\n          in: query\n", ""))
+
+        history = APIGovernor.run_history([v1, v2, v3, v1], jobs=jobs)
+
+        assert [len(step.breaking_changes) for step in history.steps] == [1, 1, 0]
+        assert [step.current_path for step in history.steps] == [str(v2), str(v3), str(v1)]
+        assert history.status == "WARN"
+        timeline = history.timeline
+        assert list(timeline) == ["GET /users"]
+        assert [(version, bc.path) for version, bc in timeline["GET /users"]] == [
+            (str(v2), "GET /users -> cursor"),
+            (str(v3), "GET /users -> limit"),
+        ]
+
+    def test_history_needs_two_versions(self, tmp_path: Path) -> None:
+        """Test a single version is rejected."""
+        spec = tmp_path / "v1.yaml"
+        spec.write_text(SPEC)
+
+        with pytest.raises(ValueError):
+            APIGovernor.run_history([spec])
+
+
+class TestFailFast:
+    """Tests for APIGovernor.run(fail_fast=...)."""
+
+    def test_stops_at_gating_severity(self, tmp_path: Path) -> None:
+        """Test a tripped gate returns a partial result that is not cached."""
+        spec = tmp_path / "openapi.yaml"
+        spec.write_text(SPEC.replace("    Error:", "    Problem:"))
+        governor = APIGovernor(spec, cache_dir=tmp_path / "cache")
+
+        partial = governor.run(fail_fast=Severity.MAJOR)
+        full = governor.run()
+
+        assert partial.partial and partial.to_dict()["partial"] is True
+        assert [f.rule_id for f in partial.findings] == ["ERR001"]
+        assert full.cache_status == "miss" and not full.partial
+        assert len(full.findings) > len(partial.findings)
+
+    def test_breaking_changes_checked_first(self, tmp_path: Path) -> None:
+        """Test escalated breaking changes trip a BLOCKER gate before rules run."""
+        baseline = tmp_path / "v1.yaml"
+        baseline.write_text(SPEC)
+        spec = tmp_path / "v2.yaml"
+        spec.write_text(SPEC.replace("/users", "/people"))
+
+        result = APIGovernor(spec, baseline_path=baseline).run(fail_fast=Severity.BLOCKER)
+
+        assert result.partial and result.status == "FAIL"
+        assert [f.rule_id for f in result.findings] == ["BREAK001"]
+        assert [bc.path for bc in result.breaking_changes] == ["GET /users"]
+
+    def test_complete_when_gate_not_reached(self, tmp_path: Path) -> None:
+        """Test the result equals a normal run when nothing reaches the gate."""
+        spec = tmp_path / "openapi.yaml"
+        spec.write_text(SPEC)
+
+        result = APIGovernor(spec).run(fail_fast=Severity.BLOCKER)
+
+        assert not result.partial
+        assert result.to_dict() == APIGovernor(spec).run().to_dict()
+
+
+class TestProfile:
+    """Tests for profiled runs."""
+
+    def test_records_phases_and_rules(self, tmp_path: Path) -> None:
+        """Test timings cover every phase and rule without changing the findings."""
+        spec = tmp_path / "openapi.yaml"
+        spec.write_text(SPEC.replace("    Error:", "    Problem:"))
+        governor = APIGovernor(
+            spec, cache_dir=tmp_path / "cache", plugins=default_manager, profile=True
+        )
+
+        result = governor.run()
+        plain = APIGovernor(spec, plugins=default_manager).run()
+
+        profile = result.profile
+        assert profile is not None and result.cache_status is None
+        assert [t.name for t in profile.phases] == ["parse", "refs", "rules", "plugins", "diff"]
+        assert [t.name for t in profile.rules][-3:] == [p.rule_id for p in default_manager.plugins]
+        assert sum(t.findings for t in profile.rules) == len(result.findings)
+        assert all(t.wall_ms >= 0 and t.cpu_ms >= 0 for t in profile.phases)
+        data = result.to_dict()
+        assert data.pop("profile")["phases"][0]["name"] == "parse"
+        assert data == plain.to_dict()
+
+    def test_traces_slowest_rule(self, tmp_path: Path) -> None:
+        """Test the slowest rule's cProfile stats are dumped and artifacts timed."""
+        spec = tmp_path / "openapi.yaml"
+        spec.write_text(SPEC)
+        trace = tmp_path / "slowest.prof"
+        governor = APIGovernor(spec, output_dir=tmp_path / "out", profile_trace=trace)
+
+        result = governor.run()
+        governor.generate_artifacts(result)
+
+        assert result.profile is not None
+        assert result.profile.trace_path == str(trace)
+        assert pstats.Stats(str(trace)).total_calls > 0
+        assert result.profile.phases[-1].name == "artifacts"
+
+    def test_artifacts_phase_added_once_written(self, tmp_path: Path, monkeypatch) -> None:
+        """Test artifacts never see their own phase, and later output sees it complete."""
+        spec = tmp_path / "openapi.yaml"
+        spec.write_text(SPEC)
+        governor = APIGovernor(spec, output_dir=tmp_path / "out", profile=True)
+        result = governor.run()
+        seen: list[list[str]] = []
+        generate_all = OutputGenerator.generate_all
+
+        def record(generator: OutputGenerator) -> dict[str, Path]:
+            assert generator.result.profile is not None
+            seen.append([t.name for t in generator.result.profile.phases])
+            return generate_all(generator)
+
+        monkeypatch.setattr(OutputGenerator, "generate_all", record)
+        governor.generate_artifacts(result)
+        data = json.loads(format_result(result, "json", tmp_path / "out").read_text())
+
+        assert seen == [["parse", "refs", "rules", "diff"]]
+        assert data["profile"]["phases"][-1]["name"] == "artifacts"
+        assert data["profile"]["phases"][-1]["wall_ms"] > 0
+
+
+class TestPolicyLoading:
+    """Tests for policy validation in APIGovernor."""
+
+    def test_invalid_policy_fails_before_spec_is_read(self, tmp_path: Path) -> None:
+        """Test a bad policy raises PolicyError without touching the spec."""
+        policy = tmp_path / "policy.yaml"
+        policy.write_text(
+            "policy_name: Bad\npolicy_version: '1'\n"
+            "enforcement:\n  default_severity:\n    security_missing: HIGH\n"
+        )
+
+        with pytest.raises(PolicyError, match="security_missing"):
+            APIGovernor(tmp_path / "missing.yaml", policy_path=policy).run()
+
+    def test_policy_validated_against_schema(self, tmp_path: Path) -> None:
+        """Test policies violating the policy schema are rejected, partial ones accepted."""
+        policy = tmp_path / "policy.yaml"
+        policy.write_text("policy_version: '1'\npagination:\n  style: numbered\n")
+
+        with pytest.raises(PolicyError, match="pagination.style"):
+            APIGovernor._read_policy(policy)
+
+        policy.write_text("pagination:\n  style: cursor\n")
+        assert APIGovernor._read_policy(policy).name == "Unknown"
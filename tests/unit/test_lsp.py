@@ -0,0 +1,311 @@
+"""Tests for the LSP server and incremental rule engine."""
+
+import io
+import json
+
+from api_governor.governor import APIGovernor
+from api_governor.incremental import IncrementalRuleEngine, changed_pointers, section_digests
+from api_governor.lsp import METHOD_NOT_FOUND, LanguageServer, SpecDocument
+from api_governor.parser import OpenAPIParser, load_document, load_document_with_positions
+from api_governor.plugins import PluginManager, RequireDescriptionRule
+from api_governor.rules import RuleEngine
+
+SPEC = """openapi: 3.0.3
+info:
+  title: Test API
+  version: 1.0.0
+paths:
+  /users:
+    get:
+      responses:
+        '200':
+          description: OK
+  /orders:
+    get:
+      parameters:
+        - name: limit
+          in: query
+      responses:
+        '200':
+          description: OK
+"""
+
+VERSIONED_PATH = """  /v1/users:
+    get:
+      responses:
+        '200':
+          description: OK
+"""
+
+URI = "file:///tmp/openapi.yaml"
+
+
+def _frame(message: dict) -> bytes:
+    body = json.dumps(message).encode()
+    return f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+
+
+def _read_frames(data: bytes) -> list[dict]:
+    messages = []
+    while data:
+        header, _, data = data.partition(b"\r\n\r\n")
+        length = int(header.split(b":")[1])
+        messages.append(json.loads(data[:length]))
+        data = data[length:]
+    return messages
+
+
+class TestSpecDocument:
+    """Tests for SpecDocument class."""
+
+    def test_update_matches_full_parse(self) -> None:
+        """Test block-wise parsing produces the same spec as a full parse."""
+        document = SpecDocument(URI, SPEC)
+        assert document.update() is None
+        assert document.spec == load_document(SPEC)
+        assert document.path_positions["/orders"] == (10, 2, 9)
+        assert document.section_positions["info"] == (1, 0, 4)
+
+    def test_path_edit_reports_changed_path(self) -> None:
+        """Test editing a path item reports only that path as changed."""
+        document = SpecDocument(URI, SPEC)
+        document.update()
+        # Replace "limit" with "size" on line 13
+        document.apply_change(
+            {
+                "range": {
+                    "start": {"line": 13, "character": 16},
+                    "end": {"line": 13, "character": 21},
+                },
+                "text": "size",
+            }
+        )
+
+        assert document.update() == {"/orders"}
+        assert document.spec == load_document(document.text)
+
+    def test_deleted_path_reported_as_changed(self) -> None:
+        """Test deleting a path item reports that path as changed."""
+        document = SpecDocument(URI, SPEC.replace("  /orders:", VERSIONED_PATH + "  /orders:"))
+        document.update()
+        document.apply_change({"text": SPEC})
+
+        assert document.update() == {"/v1/users"}
+        assert document.spec == load_document(SPEC)
+
+    def test_section_edit_requires_full_evaluation(self) -> None:
+        """Test editing outside paths reports a full change."""
+        document = SpecDocument(URI, SPEC)
+        document.update()
+        document.apply_change({"text": SPEC.replace("Test API", "Other API")})
+
+        assert document.update() is None
+        assert document.spec is not None
+        assert document.spec["info"]["title"] == "Other API"
+
+    def test_source_map_matches_full_parse(self) -> None:
+        """Test block-wise positions match the positions of a full parse."""
+        document = SpecDocument(URI, SPEC)
+        document.update()
+        document.apply_change({"text": SPEC.replace("  /orders:", "  /extra: {}\n  /orders:")})
+        document.update()
+
+        _, expected = load_document_with_positions(document.text)
+        assert document.source_map is not None
+        assert document.source_map.__getstate__() == expected.__getstate__()
+
+    def test_quoted_keys_with_colons(self) -> None:
+        """Test quoted keys containing colons are split at the right place."""
+        text = SPEC.replace("/orders:", "'/orders:search':").replace("info:", '"x-a: b": 1\ninfo:')
+        document = SpecDocument(URI, text)
+        document.update()
+        document.apply_change({"text": text.replace("limit", "size")})
+
+        assert document.update() == {"/orders:search"}
+        assert document.spec == load_document(document.text)
+        assert document.section_positions["x-a: b"] == (1, 0, 6)
+        assert document.path_positions["/orders:search"] == (11, 2, 16)
+
+    def test_json_document(self) -> None:
+        """Test JSON documents fall back to a full parse."""
+        text = json.dumps(load_document(SPEC), indent=2)
+        document = SpecDocument(URI, text)
+
+        assert document.update() is None
+        assert document.spec == load_document(SPEC)
+
+
+class TestIncrementalRuleEngine:
+    """Tests for IncrementalRuleEngine class."""
+
+    def test_incremental_matches_full_evaluation(self) -> None:
+        """Test incremental results match a full evaluation after an edit."""
+        default_policy = APIGovernor._read_policy(APIGovernor._get_default_policy())
+        engine = IncrementalRuleEngine(default_policy)
+        engine.evaluate(OpenAPIParser.from_spec(load_document(SPEC)))
+
+        edited = load_document(SPEC.replace("/orders", "/createOrder"))
+        parser = OpenAPIParser.from_spec(edited)
+        findings = engine.evaluate(parser, {"/createOrder"})
+        expected = RuleEngine(default_policy).evaluate(OpenAPIParser.from_spec(edited))
+
+        assert engine.last_evaluated_paths == ["/createOrder"]
+        assert [(f.rule_id, f.path) for f in findings] == [(f.rule_id, f.path) for f in expected]
+
+    def test_changed_pointers(self) -> None:
+        """Test section digests detect which sections changed."""
+        before = section_digests(OpenAPIParser.from_spec(load_document(SPEC)))
+        edited = load_document(SPEC.replace("Test API", "Other API").replace("limit", "size"))
+        after = section_digests(OpenAPIParser.from_spec(edited))
+
+        assert changed_pointers(before, after) == {"/info", "/paths/~1orders"}
+
+    def test_global_rules_rerun_only_for_their_inputs(self) -> None:
+        """Test global rules are skipped unless a section they read changed."""
+        default_policy = APIGovernor._read_policy(APIGovernor._get_default_policy())
+        engine = IncrementalRuleEngine(default_policy)
+        engine.evaluate(OpenAPIParser.from_spec(load_document(SPEC)))
+
+        edited = load_document(SPEC.replace("Test API", "Other API"))
+        findings = engine.evaluate(OpenAPIParser.from_spec(edited), changed_pointers={"/info"})
+        assert engine.last_evaluated_rules == []
+        assert engine.last_evaluated_paths == []
+
+        edited["components"] = {"schemas": {"Error": {"type": "object"}}}
+        parser = OpenAPIParser.from_spec(edited)
+        findings = engine.evaluate(parser, changed_pointers={"/components/schemas/Error"})
+        expected = RuleEngine(default_policy).evaluate(OpenAPIParser.from_spec(edited))
+
+        assert engine.last_evaluated_rules == ["ErrorEnvelopeRule", "ObservabilityRule"]
+        assert [(f.rule_id, f.path) for f in findings] == [(f.rule_id, f.path) for f in expected]
+
+    def test_reused_findings_follow_moved_lines(self, tmp_path) -> None:
+        """Test cached findings get the new line when an unchanged section moves."""
+        default_policy = APIGovernor._read_policy(APIGovernor._get_default_policy())
+        engine = IncrementalRuleEngine(default_policy)
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(SPEC)
+        engine.evaluate(OpenAPIParser(spec_file, positions=True))
+
+        spec_file.write_text(SPEC.replace("  version: 1.0.0", "  version: 1.0.0\n  x-team: core"))
+        parser = OpenAPIParser(spec_file, positions=True)
+        findings = engine.evaluate(parser, changed_pointers={"/info"})
+        expected = RuleEngine(default_policy).evaluate(OpenAPIParser(spec_file, positions=True))
+
+        assert engine.last_evaluated_paths == []
+        assert [(f.rule_id, f.line) for f in findings] == [(f.rule_id, f.line) for f in expected]
+
+
+class TestLanguageServer:
+    """Tests for LanguageServer class."""
+
+    def test_initialize(self) -> None:
+        """Test the server advertises incremental document sync."""
+        server = LanguageServer()
+        response = server.handle({"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}})
+
+        assert response is not None
+        assert response["result"]["capabilities"]["textDocumentSync"]["change"] == 2
+
+    def test_diagnostics_have_positions(self, tmp_path) -> None:
+        """Test findings are reported at the source lines a full lint gives them."""
+        server = LanguageServer()
+        document = SpecDocument(URI, SPEC)
+        server.lint(document)
+        text = SPEC.replace("  /orders:", "  /extra: {}\n  /orders:")
+        document.apply_change({"text": text})
+
+        diagnostics = server.lint(document)
+
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(text)
+        expected = RuleEngine(server.policy).evaluate(OpenAPIParser(spec_file, positions=True))
+        assert [d["code"] for d in diagnostics] == [f.rule_id for f in expected]
+        for diagnostic, finding in zip(diagnostics, expected, strict=True):
+            if finding.line is not None:
+                assert diagnostic["range"]["start"]["line"] == finding.line - 1
+        pagination = [d for d in diagnostics if d["code"] == "PAG001"]
+        assert pagination[0]["range"]["start"] == {"line": 6, "character": 4}
+        assert pagination[0]["range"]["end"] == {"line": 6, "character": 8}
+
+    def test_deleted_path_item_matches_full_lint(self, tmp_path) -> None:
+        """Test deleting a path item re-runs the rules that read all paths."""
+        policy_file = tmp_path / "policy.yaml"
+        policy_file.write_text(
+            APIGovernor._get_default_policy()
+            .read_text()
+            .replace('strategy: "none_or_header"', 'strategy: "url"')
+            .replace("url_versioning:\n    enabled: false", "url_versioning:\n    enabled: true")
+        )
+        server = LanguageServer(policy_path=policy_file)
+        document = SpecDocument(URI, SPEC.replace("  /orders:", VERSIONED_PATH + "  /orders:"))
+        assert "VER001" not in [d["code"] for d in server.lint(document)]
+
+        document.apply_change({"text": SPEC})
+        diagnostics = server.lint(document)
+
+        assert "VER001" in [d["code"] for d in diagnostics]
+        assert diagnostics == LanguageServer(policy_path=policy_file).lint(SpecDocument(URI, SPEC))
+
+    def test_plugins_run(self) -> None:
+        """Test plugin findings are published with the built-in ones."""
+        plugins = PluginManager()
+        plugins.register(RequireDescriptionRule)
+        server = LanguageServer(plugins=plugins)
+
+        diagnostics = server.lint(SpecDocument(URI, SPEC))
+
+        plugin_lines = [
+            d["range"]["start"]["line"]
+            for d in diagnostics
+            if d["code"] == "CUSTOM_REQUIRE_DESCRIPTION"
+        ]
+        assert plugin_lines == [6, 11]
+
+    def test_parse_error_diagnostic(self) -> None:
+        """Test YAML syntax errors are reported at the offending line."""
+        server = LanguageServer()
+        document = SpecDocument(URI, SPEC + "  bad: [unclosed\n")
+
+        diagnostics = server.lint(document)
+
+        assert [d["code"] for d in diagnostics] == ["PARSE001"]
+        assert diagnostics[0]["severity"] == 1
+
+    def test_non_openapi_document_is_ignored(self) -> None:
+        """Test plain YAML files get no diagnostics."""
+        server = LanguageServer()
+
+        assert server.lint(SpecDocument(URI, "name: value\n")) == []
+
+    def test_unknown_request(self) -> None:
+        """Test unknown requests return a method-not-found error."""
+        server = LanguageServer()
+        response = server.handle({"jsonrpc": "2.0", "id": 7, "method": "workspace/symbol"})
+
+        assert response is not None
+        assert response["error"]["code"] == METHOD_NOT_FOUND
+
+    def test_serve_publishes_diagnostics(self) -> None:
+        """Test the stdio loop publishes diagnostics for opened documents."""
+        messages = [
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didOpen",
+                "params": {"textDocument": {"uri": URI, "text": SPEC, "version": 1}},
+            },
+            {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+            {"jsonrpc": "2.0", "method": "exit"},
+        ]
+        reader = io.BytesIO(b"".join(_frame(m) for m in messages))
+        writer = io.BytesIO()
+
+        LanguageServer().serve(reader, writer)
+
+        output = _read_frames(writer.getvalue())
+        published = [m for m in output if m.get("method") == "textDocument/publishDiagnostics"]
+        assert published[0]["params"]["uri"] == URI
+        assert published[0]["params"]["version"] == 1
+        assert published[0]["params"]["diagnostics"]
+        assert [m["id"] for m in output if "id" in m] == [1, 2]
@@ -1,6 +1,18 @@
 """Tests for data models."""
 
-from api_governor.models import BreakingChange, Finding, GovernanceResult, Severity
+import pickle
+
+import pytest
+
+from api_governor.models import (
+    BreakingChange,
+    Finding,
+    GovernanceResult,
+    PolicyConfig,
+    Severity,
+    Template,
+)
+from api_governor.policy import PolicyError
 
 
 class TestFinding:
@@ -24,6 +36,61 @@ class TestFinding:
         assert result["path"] == "paths./users.get"
         assert result["recommendation"] == "Add security requirement"
 
+    def test_templates_are_formatted_lazily(self) -> None:
+        """Test templated fields read and serialize like formatted strings."""
+        message = Template("Missing security requirement on {2} {0}")
+        finding = Finding(
+            "SEC001",
+            Severity.MAJOR,
+            message,
+            Template("paths.{0}.{1}"),
+            line=12,
+            recommendation="Add security requirement",
+            args=("/users/{id}", "get", "GET"),
+        )
+        expected = Finding(
+            "SEC001",
+            Severity.MAJOR,
+            "Missing security requirement on GET /users/{id}",
+            "paths./users/{id}.get",
+            line=12,
+            recommendation="Add security requirement",
+        )
+
+        assert finding == expected
+        assert finding.to_dict() == expected.to_dict()
+        assert not hasattr(finding, "__dict__")
+
+        moved = finding.with_line(20)
+        assert moved.line == 20
+        assert moved.message == expected.message
+
+    def test_templated_fields_are_assignable(self) -> None:
+        """Test assigning a templated field keeps the others formatted."""
+        finding = Finding(
+            "SEC001",
+            Severity.MAJOR,
+            Template("Missing security on {0}"),
+            Template("paths.{0}"),
+            args=("/users",),
+        )
+
+        finding.message = "Custom message"
+
+        assert finding.message == "Custom message"
+        assert finding.path == "paths./users"
+        assert finding.to_dict()["message"] == "Custom message"
+
+    def test_pickle_round_trip(self) -> None:
+        """Test pickled findings keep their values and interned rule IDs."""
+        rule_id = "".join(["CUSTOM_", "RULE"])
+        finding = Finding(rule_id, Severity.INFO, Template("Path {0}"), args=("/a",))
+
+        restored = pickle.loads(pickle.dumps(finding))
+
+        assert restored == finding
+        assert restored.rule_id is finding.rule_id
+
 
 class TestGovernanceResult:
     """Tests for GovernanceResult model."""
@@ -68,3 +135,50 @@ class TestBreakingChange:
 
         assert result["change_type"] == "removed_operation"
         assert result["severity"] == "MAJOR"
+
+    def test_templated_change(self) -> None:
+        """Test templated fields are formatted from args, including the endpoint."""
+        change = BreakingChange(
+            "removed_parameter",
+            Template("{0} {1} -> {2}"),
+            Template("Parameter removed: '{2}' from {0} {1}"),
+            "Clients sending this parameter will have it ignored or may receive errors",
+            args=("GET", "/users", "limit"),
+        )
+
+        assert change.path == "GET /users -> limit"
+        assert change.description == "Parameter removed: 'limit' from GET /users"
+        assert change.endpoint == "GET /users"
+        assert pickle.loads(pickle.dumps(change)) == change
+
+
+class TestPolicyConfig:
+    """Tests for PolicyConfig model and its compiled plan."""
+
+    def test_plan_resolves_settings_and_defaults(self) -> None:
+        """Test configured settings are typed and missing ones get defaults."""
+        policy = PolicyConfig.from_dict(
+            {
+                "enforcement": {"default_severity": {"security_missing": "BLOCKER"}},
+                "breaking_change_detection": {"breaking_changes": {"removed_operation": False}},
+            }
+        )
+
+        assert policy.plan.security.severity is Severity.BLOCKER
+        assert policy.plan.naming.severity is Severity.MINOR
+        assert policy.plan.errors.problem_fields_required == ("code", "message", "requestId")
+        assert not policy.plan.breaking_changes.detects("removed_operation")
+        assert policy.plan.breaking_changes.detects("removed_parameter")
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"enforcement": {"default_severity": {"naming_inconsistent": "HIGH"}}},
+            {"pagination": {"style": ["cursor"]}},
+            {"breaking_change_detection": {"breaking_changes": {"narrowed_enum": "yes"}}},
+        ],
+    )
+    def test_invalid_settings_raise(self, config: dict) -> None:
+        """Test malformed settings are rejected when the policy is built."""
+        with pytest.raises(PolicyError, match="Policy setting"):
+            PolicyConfig.from_dict(config)
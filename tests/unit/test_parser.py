@@ -135,3 +135,173 @@ paths:
 
         assert len(errors) == 1
         assert "NonExistent" in errors[0]
+
+    def test_operation_index(self, tmp_path: Path) -> None:
+        """Test the cached operation index."""
+        spec_content = """
+openapi: 3.0.3
+info:
+  title: Test API
+  version: 1.0.0
+paths:
+  /users:
+    get:
+      operationId: listUsers
+      tags: [users]
+      responses:
+        '200':
+          description: OK
+    post:
+      operationId: createUser
+      tags: [users, admin]
+      responses:
+        '201':
+          description: Created
+  /users/{id}:
+    get:
+      operationId: getUser
+      tags: [users]
+      responses:
+        '200':
+          description: OK
+"""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(spec_content)
+
+        parser = OpenAPIParser(spec_file)
+        index = parser.operation_index
+
+        assert parser.operation_index is index
+        assert index.operation_keys == {
+            ("/users", "get"),
+            ("/users", "post"),
+            ("/users/{id}", "get"),
+        }
+        assert index.by_operation_id["createUser"] == ("/users", "post")
+        assert index.by_tag["admin"] == (("/users", "post"),)
+        assert len(index.by_tag["users"]) == 3
+        assert [m for m, _ in index.by_path["/users"]] == ["get", "post"]
+        assert index.is_collection("/users")
+        assert not index.is_collection("/users/{id}")
+        with pytest.raises(TypeError):
+            index.by_key[("/users", "delete")] = {}  # type: ignore[index]
+
+    def test_parse_json_content_in_yaml_file(self, tmp_path: Path) -> None:
+        """Test that JSON content in a .yaml file is parsed via the JSON fast path."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text('{"openapi": "3.0.3", "info": {"title": "T"}, "paths": {}}')
+
+        spec = OpenAPIParser(spec_file).parse()
+
+        assert spec["info"]["title"] == "T"
+
+    def test_parse_yaml_flow_mapping(self, tmp_path: Path) -> None:
+        """Test that YAML flow mappings that are not strict JSON still parse."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text("{openapi: 3.0.3, info: {title: T}, paths: {}}")
+
+        spec = OpenAPIParser(spec_file).parse()
+
+        assert spec["info"]["title"] == "T"
+
+    def test_source_positions(self, tmp_path: Path) -> None:
+        """Test that positions are indexed by JSON pointer when enabled."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(
+            "openapi: 3.0.3\n"
+            "paths:\n"
+            "  /users/{id}:\n"
+            "    get:\n"
+            "      parameters:\n"
+            "        - name: id\n"
+            "          in: path\n"
+        )
+
+        parser = OpenAPIParser(spec_file, positions=True)
+        source_map = parser.source_map
+
+        assert source_map is not None
+        assert source_map.get("/paths/~1users~1{id}/get") == (4, 5)
+        assert source_map.line("paths", "/users/{id}", "get", "parameters", 0) == 6
+        # Scalars resolve to their nearest indexed ancestor
+        assert source_map.line("paths", "/users/{id}", "get", "operationId") == 4
+        assert OpenAPIParser(spec_file).source_map is None
+
+    def test_validate_refs_deep_nesting_and_locations(self) -> None:
+        """Test deep specs do not hit the recursion limit and errors keep locations."""
+        schema: dict = {"$ref": "#/components/schemas/Missing"}
+        for _ in range(5000):
+            schema = {"properties": {"child": schema}}
+        spec = {"paths": {"/a": {"get": {"parameters": [{"$ref": "#/nope"}]}}}, "deep": schema}
+
+        errors = OpenAPIParser.from_spec(spec).validate_refs()
+
+        assert errors[0] == "Unresolved ref at .paths./a.get.parameters[0]: #/nope"
+        assert errors[1].startswith("Unresolved ref at .deep.properties.child.properties")
+        assert len(errors) == 2
+
+
+class TestExternalRefs:
+    """Tests for multi-file $ref resolution."""
+
+    def _write_specs(self, tmp_path: Path) -> Path:
+        (tmp_path / "schemas").mkdir()
+        (tmp_path / "schemas" / "user.yaml").write_text(
+            "User:\n"
+            "  type: object\n"
+            "  properties:\n"
+            "    address: {$ref: '#/Address'}\n"
+            "    error: {$ref: '../common.yaml#/Error'}\n"
+            "Address:\n"
+            "  type: object\n"
+        )
+        (tmp_path / "common.yaml").write_text("Error:\n  type: object\n")
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(
+            "openapi: 3.0.3\n"
+            "components:\n"
+            "  schemas:\n"
+            "    User: {$ref: 'schemas/user.yaml#/User'}\n"
+            "    Error: {$ref: 'common.yaml#/Error'}\n"
+        )
+        return spec_file
+
+    def test_resolve_file_refs(self, tmp_path: Path) -> None:
+        """Test relative file refs resolve, including refs inside referenced files."""
+        parser = OpenAPIParser(self._write_specs(tmp_path))
+
+        user = parser.resolve_ref("schemas/user.yaml#/User")
+        assert user["type"] == "object"
+        assert parser.validate_refs() == []
+        assert parser.documents is not None
+        assert {p.name for p in parser.documents.paths} == {
+            "openapi.yaml",
+            "user.yaml",
+            "common.yaml",
+        }
+
+    def test_each_document_loaded_once(self, tmp_path: Path) -> None:
+        """Test that a file referenced from several documents is parsed once."""
+        parser = OpenAPIParser(self._write_specs(tmp_path))
+        parser.validate_refs()
+        assert parser.documents is not None
+
+        common = parser.documents.get(tmp_path / "common.yaml")
+        user = parser.documents.get(tmp_path / "schemas" / "user.yaml")
+        assert user.documents is parser.documents
+        assert user.ref_resolver.resolve("../common.yaml#/Error").source is common.ref_resolver
+
+    def test_broken_refs_in_referenced_files(self, tmp_path: Path) -> None:
+        """Test missing files and broken pointers inside referenced files are reported."""
+        spec_file = self._write_specs(tmp_path)
+        (tmp_path / "common.yaml").write_text("Other: {}\n")
+        spec_file.write_text(spec_file.read_text() + "    Gone: {$ref: 'missing.yaml'}\n")
+
+        errors = OpenAPIParser(spec_file).validate_refs()
+
+        assert errors[0] == "Unresolved ref at .components.schemas.Error: common.yaml#/Error"
+        assert errors[1].startswith("Invalid ref at .components.schemas.Gone: Cannot load")
+        assert errors[2] == (
+            "Unresolved ref at schemas/user.yaml:.User.properties.error: ../common.yaml#/Error"
+        )
+        assert len(errors) == 3
@@ -1,9 +1,12 @@
 """Tests for plugin system."""
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import yaml
 
+from api_governor.executors import SerialExecutor, run_tasks
 from api_governor.models import PolicyConfig
 from api_governor.parser import OpenAPIParser
 from api_governor.plugins import (
@@ -70,6 +73,45 @@ class CustomTestRule(RulePlugin):
         assert len(manager.plugins) == 1
         assert manager.plugins[0].rule_id == "TEST_RULE"
 
+    def test_file_plugins_run_in_spawned_workers(self, tmp_path: Path) -> None:
+        """Test plugins loaded from files can be sent to freshly started processes."""
+        plugin_code = """
+from api_governor.plugins import RulePlugin
+from api_governor.models import Finding, Severity
+
+class SpawnedRule(RulePlugin):
+    def __init__(self):
+        self.limit = 3
+
+    @property
+    def rule_id(self):
+        return "SPAWNED_RULE"
+
+    @property
+    def name(self):
+        return "Spawned Rule"
+
+    @property
+    def description(self):
+        return "Reports the number of paths"
+
+    def check(self, spec, policy):
+        message = f"{len(spec.paths)} of {self.limit} paths"
+        return [Finding(self.rule_id, Severity.INFO, message)]
+"""
+        plugin_file = tmp_path / "spawned_plugin.py"
+        plugin_file.write_text(plugin_code)
+        manager = PluginManager()
+        manager.load_from_file(plugin_file)
+        parser = OpenAPIParser.from_spec({"openapi": "3.0.3", "paths": {"/a": {}}})
+        tasks = manager.tasks(PolicyConfig.from_dict({}))
+
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            findings = pool.submit(run_tasks, SerialExecutor(), parser, tasks).result()
+
+        assert [(f.rule_id, f.message) for f in findings] == [("SPAWNED_RULE", "1 of 3 paths")]
+
 
 class TestRequireDescriptionRule:
     """Tests for RequireDescriptionRule."""
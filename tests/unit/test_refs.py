@@ -0,0 +1,68 @@
+"""Tests for $ref resolution."""
+
+from api_governor.refs import RefResolver
+
+DOCUMENT = {
+    "paths": {"/users/{id}": {"get": {"parameters": [{"name": "id", "in": "path"}]}}},
+    "components": {
+        "schemas": {
+            "User": {"type": "object"},
+            "Alias": {"$ref": "#/components/schemas/User"},
+            "LoopA": {"$ref": "#/components/schemas/LoopB"},
+            "LoopB": {"$ref": "#/components/schemas/LoopA"},
+            "a~b": {"type": "string"},
+            "Node": {"properties": {"child": {"$ref": "#/components/schemas/Node"}}},
+        }
+    },
+}
+
+
+class TestRefResolver:
+    """Tests for RefResolver class."""
+
+    def test_resolve_escaped_pointer(self) -> None:
+        """Test ~0/~1 escapes, percent-encoding and list indices."""
+        resolver = RefResolver(DOCUMENT)
+
+        target = resolver.resolve("#/paths/~1users~1%7Bid%7D/get/parameters/0")
+        assert target.found
+        assert target.value == {"name": "id", "in": "path"}
+        assert resolver.resolve("#/components/schemas/a~0b").value == {"type": "string"}
+
+    def test_resolve_is_memoized(self) -> None:
+        """Test that each ref string is resolved once."""
+        resolver = RefResolver(DOCUMENT)
+
+        assert resolver.resolve("#/components/schemas/User") is resolver.resolve(
+            "#/components/schemas/User"
+        )
+
+    def test_missing_and_external_refs(self) -> None:
+        """Test unresolved pointers and unsupported external refs."""
+        resolver = RefResolver(DOCUMENT)
+
+        assert not resolver.resolve("#/components/schemas/Missing").found
+        assert resolver.resolve("other.yaml#/User").error is not None
+
+    def test_deref_follows_chains_and_detects_cycles(self) -> None:
+        """Test ref chains are followed and loops are reported."""
+        resolver = RefResolver(DOCUMENT)
+
+        assert resolver.deref("#/components/schemas/Alias").value == {"type": "object"}
+        error = resolver.deref("#/components/schemas/LoopA").error
+        assert error is not None
+        assert "Circular" in error
+
+    def test_table_lists_distinct_refs(self) -> None:
+        """Test the ref table covers every distinct ref; recursive schemas are valid."""
+        table = RefResolver(DOCUMENT).table
+
+        assert set(table) == {
+            "#/components/schemas/User",
+            "#/components/schemas/LoopA",
+            "#/components/schemas/LoopB",
+            "#/components/schemas/Node",
+        }
+        assert table["#/components/schemas/User"].resolved
+        assert table["#/components/schemas/Node"].resolved
+        assert not table["#/components/schemas/LoopA"].resolved
@@ -0,0 +1,126 @@
+"""Tests for the resident JSON-RPC server."""
+
+import io
+import json
+import os
+from pathlib import Path
+
+from api_governor.governor import APIGovernor
+from api_governor.server import METHOD_NOT_FOUND, PARSE_ERROR, GovernorServer
+
+STRICT_POLICY = (
+    Path(__file__).parent.parent.parent
+    / "skills"
+    / "api-governor"
+    / "policy"
+    / "preset.strict.public.yaml"
+)
+
+SPEC = """
+openapi: 3.0.3
+info:
+  title: Test API
+  version: 1.0.0
+paths:
+  /users:
+    get:
+      parameters:
+        - name: limit
+          in: query
+      responses:
+        '200':
+          description: OK
+"""
+
+
+def _request(method: str, params: dict | None = None, request_id: int = 1) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+
+
+class TestGovernorServer:
+    """Tests for GovernorServer class."""
+
+    def test_lint(self, tmp_path: Path) -> None:
+        """Test linting a spec over JSON-RPC."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(SPEC)
+        server = GovernorServer()
+
+        response = server.handle(_request("lint", {"spec_path": str(spec_file)}))
+
+        assert response is not None
+        assert response["id"] == 1
+        assert response["result"]["spec_path"] == str(spec_file)
+        assert {f["rule_id"] for f in response["result"]["findings"]} >= {"SEC001", "PAG002"}
+
+    def test_default_policy(self, tmp_path: Path) -> None:
+        """Test requests without a policy use the server's policy."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(SPEC)
+        server = GovernorServer(policy_path=STRICT_POLICY)
+
+        response = server.handle(_request("lint", {"spec_path": str(spec_file)}))
+
+        assert response is not None
+        strict = APIGovernor._read_policy(STRICT_POLICY)
+        assert response["result"]["policy_name"] == strict.name
+
+    def test_reuses_parser_until_file_changes(self, tmp_path: Path) -> None:
+        """Test that parsed specs stay warm until the file is modified."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(SPEC)
+        server = GovernorServer()
+
+        first = server.get_parser(spec_file)
+        assert server.get_parser(spec_file) is first
+
+        spec_file.write_text(SPEC.replace("/users", "/accounts"))
+        os.utime(spec_file, ns=(1, 1))
+        second = server.get_parser(spec_file)
+
+        assert second is not first
+        assert "/accounts" in second.paths
+
+    def test_diff(self, tmp_path: Path) -> None:
+        """Test detecting breaking changes over JSON-RPC."""
+        baseline = tmp_path / "v1.yaml"
+        baseline.write_text(SPEC)
+        current = tmp_path / "v2.yaml"
+        current.write_text(SPEC.replace("/users", "/accounts"))
+        server = GovernorServer()
+
+        response = server.handle(
+            _request("diff", {"spec_path": str(current), "baseline_path": str(baseline)})
+        )
+
+        assert response is not None
+        changes = response["result"]["breaking_changes"]
+        assert [c["change_type"] for c in changes] == ["removed_operation"]
+
+    def test_errors(self) -> None:
+        """Test JSON-RPC error responses."""
+        server = GovernorServer()
+
+        unknown = server.handle(_request("unknown"))
+        assert unknown is not None
+        assert unknown["error"]["code"] == METHOD_NOT_FOUND
+
+        malformed = json.loads(server.handle_line("{not json") or "")
+        assert malformed["error"]["code"] == PARSE_ERROR
+
+        assert server.handle({"jsonrpc": "2.0", "method": "ping"}) is None
+
+    def test_serve_stdio_until_shutdown(self) -> None:
+        """Test the stdio loop answers requests and stops on shutdown."""
+        lines = [
+            json.dumps(_request("ping", request_id=1)),
+            json.dumps(_request("shutdown", request_id=2)),
+            json.dumps(_request("ping", request_id=3)),
+        ]
+        stdout = io.StringIO()
+
+        GovernorServer().serve_stdio(io.StringIO("\n".join(lines) + "\n"), stdout)
+
+        responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert [r["id"] for r in responses] == [1, 2]
+        assert responses[0]["result"] == "pong"
@@ -0,0 +1,201 @@
+"""Tests for single-pass spec traversal."""
+
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from api_governor.models import PolicyConfig, Severity
+from api_governor.parser import OpenAPIParser
+from api_governor.plugins import PluginManager, PluginVisitor, VisitorRulePlugin
+from api_governor.rules import RuleEngine
+from api_governor.traversal import SpecVisitor, SpecWalker
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Test", "version": "1.0"},
+    "paths": {
+        "/users": {
+            "get": {
+                "parameters": [{"name": "limit", "in": "query"}],
+                "responses": {"200": {"description": "OK"}},
+            },
+            "post": {
+                "requestBody": {"content": {"application/json": {}}},
+                "responses": {"201": {"description": "Created"}, "400": {"description": "Bad"}},
+            },
+        },
+        "/users/{id}": {"get": {"responses": {"200": {"description": "OK"}}}},
+    },
+    "components": {"schemas": {"User": {"type": "object"}}},
+}
+
+
+def _parser(tmp_path: Path, spec: dict[str, Any] = SPEC) -> OpenAPIParser:
+    spec_file = tmp_path / "spec.yaml"
+    spec_file.write_text(yaml.dump(spec))
+    parser = OpenAPIParser(spec_file)
+    parser.parse()
+    return parser
+
+
+class RecordingVisitor(SpecVisitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.events: list[tuple[Any, ...]] = []
+
+    def visit_path(self, path: str, path_item: dict[str, Any]) -> None:
+        self.events.append(("path", path))
+
+    def visit_operation(self, path: str, method: str, operation: dict[str, Any]) -> None:
+        self.events.append(("operation", path, method))
+
+    def visit_parameter(self, path: str, method: str, parameter: dict[str, Any]) -> None:
+        self.events.append(("parameter", path, method, parameter["name"]))
+
+    def visit_request_body(self, path: str, method: str, request_body: dict[str, Any]) -> None:
+        self.events.append(("request_body", path, method))
+
+    def visit_response(
+        self, path: str, method: str, status_code: str, response: dict[str, Any]
+    ) -> None:
+        self.events.append(("response", path, method, status_code))
+
+    def visit_schema(self, name: str, schema: dict[str, Any]) -> None:
+        self.events.append(("schema", name))
+
+
+class TestSpecWalker:
+    """Tests for SpecWalker class."""
+
+    def test_dispatches_every_node_kind(self, tmp_path: Path) -> None:
+        """Test that each node kind reaches the visitor in document order."""
+        visitor = RecordingVisitor()
+        SpecWalker([visitor]).walk(_parser(tmp_path))
+
+        assert visitor.events == [
+            ("path", "/users"),
+            ("operation", "/users", "get"),
+            ("parameter", "/users", "get", "limit"),
+            ("response", "/users", "get", "200"),
+            ("operation", "/users", "post"),
+            ("request_body", "/users", "post"),
+            ("response", "/users", "post", "201"),
+            ("response", "/users", "post", "400"),
+            ("path", "/users/{id}"),
+            ("operation", "/users/{id}", "get"),
+            ("response", "/users/{id}", "get", "200"),
+            ("schema", "User"),
+        ]
+
+    def test_skips_disabled_visitors(self, tmp_path: Path) -> None:
+        """Test that disabled visitors are never called."""
+        visitor = RecordingVisitor()
+        visitor.enabled = False
+        SpecWalker([visitor]).walk(_parser(tmp_path))
+
+        assert visitor.events == []
+
+    def test_isolated_visitor_error_is_recorded(self, tmp_path: Path) -> None:
+        """Test that a failing isolated visitor does not abort the walk."""
+
+        class Failing(SpecVisitor):
+            def visit_operation(self, path: str, method: str, operation: dict[str, Any]) -> None:
+                raise ValueError("boom")
+
+        failing = Failing()
+        recording = RecordingVisitor()
+        walker = SpecWalker()
+        walker.add(failing, isolate=True)
+        walker.add(recording)
+        walker.walk(_parser(tmp_path))
+
+        assert str(walker.error_for(failing)) == "boom"
+        assert walker.error_for(recording) is None
+        assert ("operation", "/users/{id}", "get") in recording.events
+
+    def test_stop_ends_walk_early(self, tmp_path: Path) -> None:
+        """Test the walk stops before the next path item once stop returns True."""
+        visitor = RecordingVisitor()
+        completed = SpecWalker([visitor]).walk(_parser(tmp_path), stop=lambda: bool(visitor.events))
+
+        assert not completed
+        assert {event[1] for event in visitor.events} == {"/users"}
+
+
+class TestRuleEngine:
+    """Tests for RuleEngine traversal."""
+
+    def test_findings_grouped_in_rule_order(self, tmp_path: Path) -> None:
+        """Test that findings are ordered by rule, then by document order."""
+        engine = RuleEngine(PolicyConfig.from_dict({}))
+        findings = engine.evaluate(_parser(tmp_path))
+
+        rule_ids = [f.rule_id for f in findings]
+        assert rule_ids == ["SEC001", "SEC001", "SEC001", "ERR001", "PAG002", "OBS001"]
+
+    def test_evaluate_until_stops_at_gate(self, tmp_path: Path) -> None:
+        """Test fail-fast evaluation runs cheap gating rules first and stops."""
+        engine = RuleEngine(PolicyConfig.from_dict({}))
+        parser = _parser(tmp_path)
+
+        findings, stopped = engine.evaluate_until(parser, Severity.MAJOR)
+        assert stopped
+        assert [f.rule_id for f in findings] == ["ERR001"]
+
+        findings, stopped = engine.evaluate_until(parser, Severity.BLOCKER)
+        assert not stopped
+        assert findings == engine.evaluate(parser)
+
+    def test_findings_carry_source_lines(self, tmp_path: Path) -> None:
+        """Test that findings get line numbers when the parser indexes positions."""
+        spec_file = tmp_path / "spec.yaml"
+        spec_file.write_text(yaml.dump(SPEC, sort_keys=False))
+        lines = spec_file.read_text().splitlines()
+
+        engine = RuleEngine(PolicyConfig.from_dict({}))
+        findings = engine.evaluate(OpenAPIParser(spec_file, positions=True))
+
+        assert [lines[f.line - 1].strip() for f in findings if f.line] == [
+            "get:",
+            "post:",
+            "get:",
+            "schemas:",
+            "parameters:",
+            "schemas:",
+        ]
+        assert all(f.line is None for f in engine.evaluate(_parser(tmp_path)))
+
+
+class TestPluginManagerTraversal:
+    """Tests for visitor-based plugins."""
+
+    def test_visitor_plugin_error_becomes_finding(self, tmp_path: Path) -> None:
+        """Test that a failing visitor plugin reports a PLUGIN_ERROR finding."""
+
+        class _FailingVisitor(PluginVisitor):
+            def visit_path(self, path: str, path_item: dict[str, Any]) -> None:
+                raise RuntimeError("bad path")
+
+        class FailingRule(VisitorRulePlugin):
+            visitor_class = _FailingVisitor
+
+            @property
+            def rule_id(self) -> str:
+                return "FAILING"
+
+            @property
+            def name(self) -> str:
+                return "Failing"
+
+            @property
+            def description(self) -> str:
+                return "Always fails"
+
+        manager = PluginManager()
+        manager.register(FailingRule)
+        findings = manager.run_all(_parser(tmp_path), PolicyConfig.from_dict({}))
+
+        assert len(findings) == 1
+        assert findings[0].rule_id == "PLUGIN_ERROR_FAILING"
+        assert "bad path" in findings[0].message
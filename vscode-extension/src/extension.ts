@@ -1,16 +1,135 @@
 import * as vscode from 'vscode';
 import * as cp from 'child_process';
 import * as path from 'path';
+import { LanguageClient, LanguageClientOptions, ServerOptions } from 'vscode-languageclient/node';
 
 let diagnosticCollection: vscode.DiagnosticCollection;
+let cacheDir: string | undefined;
+let server: GovernorServerClient | undefined;
+let languageClient: LanguageClient | undefined;
+
+/**
+ * Client for the resident `api_governor --serve` process.
+ *
+ * Requests are newline-delimited JSON-RPC 2.0 over the child's stdio, so
+ * policies and parsed specs stay warm between saves.
+ */
+class GovernorServerClient {
+    private child: cp.ChildProcess;
+    private buffer = '';
+    private nextId = 1;
+    private pending = new Map<number, { resolve: (value: any) => void; reject: (reason: any) => void }>();
+
+    constructor(readonly pythonPath: string) {
+        const args = ['-m', 'api_governor', '--serve'];
+        if (cacheDir) {
+            args.push('--cache-dir', cacheDir);
+        }
+        this.child = cp.spawn(pythonPath, args, { stdio: ['pipe', 'pipe', 'pipe'] });
+        this.child.stdout?.setEncoding('utf8');
+        this.child.stdout?.on('data', (chunk: string) => this.onData(chunk));
+        this.child.on('exit', () => this.failAll('API Governor server exited'));
+        this.child.on('error', (error) => this.failAll(error.message));
+    }
+
+    request(method: string, params: object): Promise<any> {
+        const id = this.nextId++;
+        return new Promise((resolve, reject) => {
+            this.pending.set(id, { resolve, reject });
+            this.child.stdin?.write(JSON.stringify({ jsonrpc: '2.0', id, method, params }) + '\n');
+        });
+    }
+
+    get alive(): boolean {
+        return this.child.exitCode === null && !this.child.killed;
+    }
+
+    dispose() {
+        this.child.kill();
+    }
+
+    private onData(chunk: string) {
+        this.buffer += chunk;
+        let newline: number;
+        while ((newline = this.buffer.indexOf('\n')) >= 0) {
+            const line = this.buffer.slice(0, newline);
+            this.buffer = this.buffer.slice(newline + 1);
+            if (!line.trim()) {
+                continue;
+            }
+            const response = JSON.parse(line);
+            const handlers = this.pending.get(response.id);
+            if (!handlers) {
+                continue;
+            }
+            this.pending.delete(response.id);
+            if (response.error) {
+                handlers.reject(response.error.message);
+            } else {
+                handlers.resolve(response.result);
+            }
+        }
+    }
+
+    private failAll(reason: string) {
+        for (const handlers of this.pending.values()) {
+            handlers.reject(reason);
+        }
+        this.pending.clear();
+    }
+}
+
+/**
+ * Start `api_governor --lsp`, which re-lints open specs incrementally as
+ * they are edited and publishes diagnostics with source positions.
+ */
+function startLanguageClient(): LanguageClient {
+    const config = vscode.workspace.getConfiguration('api-governor');
+    const pythonPath = config.get<string>('pythonPath') || 'python';
+    const policy = config.get<string>('policy') || 'standard';
+    const customPolicy = config.get<string>('customPolicyPath');
+
+    const args = ['-m', 'api_governor', '--lsp'];
+    if (policy === 'strict') {
+        args.push('--strict');
+    } else if (policy === 'custom' && customPolicy) {
+        args.push('--policy', customPolicy);
+    }
+
+    const serverOptions: ServerOptions = { command: pythonPath, args };
+    const clientOptions: LanguageClientOptions = {
+        documentSelector: [
+            { scheme: 'file', language: 'yaml' },
+            { scheme: 'file', language: 'json' },
+        ],
+    };
+    const client = new LanguageClient('api-governor', 'API Governor', serverOptions, clientOptions);
+    client.start();
+    return client;
+}
+
+function getServer(pythonPath: string): GovernorServerClient {
+    if (!server || !server.alive || server.pythonPath !== pythonPath) {
+        server?.dispose();
+        server = new GovernorServerClient(pythonPath);
+    }
+    return server;
+}
 
 export function activate(context: vscode.ExtensionContext) {
     console.log('API Governor extension activated');
 
+    // Persist parsed specs and results between runs
+    cacheDir = path.join(context.globalStorageUri.fsPath, 'cache');
+
     // Create diagnostic collection for showing issues
     diagnosticCollection = vscode.languages.createDiagnosticCollection('api-governor');
     context.subscriptions.push(diagnosticCollection);
 
+    if (vscode.workspace.getConfiguration('api-governor').get('useLanguageServer')) {
+        languageClient = startLanguageClient();
+    }
+
     // Register commands
     context.subscriptions.push(
         vscode.commands.registerCommand('api-governor.lint', () => lintCurrentFile()),
@@ -22,7 +141,7 @@ export function activate(context: vscode.ExtensionContext) {
     context.subscriptions.push(
         vscode.workspace.onDidSaveTextDocument((document) => {
             const config = vscode.workspace.getConfiguration('api-governor');
-            if (config.get('autoLint') && isOpenAPIFile(document)) {
+            if (!languageClient && config.get('autoLint') && isOpenAPIFile(document)) {
                 lintFile(document.uri);
             }
         })
@@ -31,7 +150,7 @@ export function activate(context: vscode.ExtensionContext) {
     // Lint on open
     context.subscriptions.push(
         vscode.workspace.onDidOpenTextDocument((document) => {
-            if (isOpenAPIFile(document)) {
+            if (!languageClient && isOpenAPIFile(document)) {
                 lintFile(document.uri);
             }
         })
@@ -39,14 +158,16 @@ export function activate(context: vscode.ExtensionContext) {
 
     // Lint already open files
     vscode.workspace.textDocuments.forEach((document) => {
-        if (isOpenAPIFile(document)) {
+        if (!languageClient && isOpenAPIFile(document)) {
             lintFile(document.uri);
         }
     });
 }
 
-export function deactivate() {
+export function deactivate(): Thenable<void> | undefined {
     diagnosticCollection.dispose();
+    server?.dispose();
+    return languageClient?.stop();
 }
 
 function isOpenAPIFile(document: vscode.TextDocument): boolean {
@@ -93,8 +214,19 @@ async function lintFile(uri: vscode.Uri) {
     const pythonPath = config.get<string>('pythonPath') || 'python';
     const policy = config.get<string>('policy') || 'standard';
 
+    const customPolicy = config.get<string>('customPolicyPath');
+
     try {
-        const result = await runApiGovernor(uri.fsPath, policy, pythonPath);
+        let result: string;
+        if (config.get('useServer')) {
+            const params: { [key: string]: string } = { spec_path: uri.fsPath };
+            if (policy === 'custom' && customPolicy) {
+                params.policy_path = customPolicy;
+            }
+            result = JSON.stringify(await getServer(pythonPath).request('lint', params));
+        } else {
+            result = await runApiGovernor(uri.fsPath, policy, pythonPath);
+        }
         const diagnostics = parseResult(result, uri);
         diagnosticCollection.set(uri, diagnostics);
 
@@ -222,6 +354,10 @@ function runApiGovernor(
             cmd += ` --output-dir "${outputDir}"`;
         }
 
+        if (cacheDir) {
+            cmd += ` --cache-dir "${cacheDir}"`;
+        }
+
         cp.exec(cmd, { maxBuffer: 1024 * 1024 }, (error, stdout, stderr) => {
             if (error && !stdout) {
                 reject(stderr || error.message);